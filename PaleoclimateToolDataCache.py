@@ -0,0 +1,95 @@
+# Python modules
+from collections import OrderedDict
+from threading import RLock
+
+## Paleoclimate Tool Data Cache
+## * Caches climate data year grids (month, lat, lon) for all parameters within a memory budget (bytes)
+## * Evicts the least recently used year grids when the memory budget is exceeded
+## * Counts cache hits, misses and evictions
+## * Thread safe (parameters may be loaded concurrently)
+class PaleoclimateToolDataCache :
+
+    # Initialise
+    def __init__(self, memory_budget=512*1024*1024) :
+
+        # Memory budget in bytes
+        self.memory_budget = memory_budget
+
+        # Cached year grids in least to most recently used order
+        self.cached_year_grids = OrderedDict() # { (parameter, year_ad) : array }
+        self.cached_bytes = 0
+
+        # Cache statistics
+        self.statistics = { 'hits' : 0, 'misses' : 0, 'evictions' : 0 }
+
+        # Lock for concurrent access
+        self.lock = RLock()
+
+    # Set memory budget (bytes) and evict year grids when now exceeded
+    def setMemoryBudget(self, memory_budget) :
+        with self.lock :
+            self.memory_budget = memory_budget
+            self.evictYearGrids()
+
+    # Get memory budget (bytes)
+    def getMemoryBudget(self) :
+        return self.memory_budget
+
+    # Method gets the cached year grids for a parameter (None when not cached)
+    def getYearGrids(self, parameter, year_ad) :
+        key = (parameter, year_ad)
+        with self.lock :
+            if self.cached_year_grids.has_key(key) :
+                year_grids = self.cached_year_grids.pop(key)
+                self.cached_year_grids[key] = year_grids # most recently used
+                self.statistics['hits'] += 1
+                return year_grids
+            else :
+                self.statistics['misses'] += 1
+                return None
+
+    # Method checks if year grids are cached for a parameter (without affecting usage order or statistics)
+    def hasYearGrids(self, parameter, year_ad) :
+        return self.cached_year_grids.has_key((parameter, year_ad))
+
+    # Method adds year grids for a parameter and evicts the least recently used when over budget
+    def addYearGrids(self, parameter, year_ad, year_grids) :
+        key = (parameter, year_ad)
+        with self.lock :
+            if self.cached_year_grids.has_key(key) :
+                self.cached_bytes -= self.cached_year_grids.pop(key).nbytes
+            if year_grids.nbytes <= self.memory_budget :
+                self.cached_year_grids[key] = year_grids
+                self.cached_bytes += year_grids.nbytes
+                self.evictYearGrids()
+
+    # Method evicts the least recently used year grids until within the memory budget
+    def evictYearGrids(self) :
+        with self.lock :
+            while self.cached_bytes > self.memory_budget and self.cached_year_grids :
+                key, year_grids = self.cached_year_grids.popitem(last=False)
+                self.cached_bytes -= year_grids.nbytes
+                self.statistics['evictions'] += 1
+
+    # Method clears the cached year grids (for a parameter when specified)
+    def clear(self, parameter=None) :
+        with self.lock :
+            if parameter :
+                for key in self.cached_year_grids.keys() :
+                    if key[0] == parameter :
+                        self.cached_bytes -= self.cached_year_grids.pop(key).nbytes
+            else :
+                self.cached_year_grids = OrderedDict()
+                self.cached_bytes = 0
+
+    # Get cache statistics (including current number of year grids and bytes cached)
+    def getStatistics(self) :
+        with self.lock :
+            statistics = self.statistics.copy()
+            statistics['year_grids'] = len(self.cached_year_grids)
+            statistics['bytes'] = self.cached_bytes
+        return statistics
+
+    # Reset cache statistics
+    def resetStatistics(self) :
+        self.statistics = { 'hits' : 0, 'misses' : 0, 'evictions' : 0 }
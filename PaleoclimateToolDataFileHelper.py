@@ -3,13 +3,16 @@
 EXECUTABLE_BUILD_INCLUSION = False
 
 # Python modules
+import ctypes
+import os
 import re
 import string
-import urllib
 import urllib2 as url
-from math import floor
-from os import listdir, mkdir, path, remove
-from StringIO import StringIO
+from math import ceil, floor
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from os import listdir, mkdir, path, remove, rename
+from threading import RLock
 from time import time, localtime, strftime
 
 # Python extension modules (requires extension installation)
@@ -24,6 +27,21 @@ from docx import Document
 from docx.enum.section import WD_ORIENT
 import lxml.etree
 import lxml._elementpath
+try :
+    import pyarrow # optional: Parquet and Feather series data files require pyarrow
+except ImportError :
+    pyarrow = None
+
+# Tool library modules
+from PaleoclimateToolDataCache import PaleoclimateToolDataCache
+from PaleoclimateToolDownloadManager import PaleoclimateToolDownloadManager
+from PaleoclimateToolExpression import PaleoclimateToolExpression
+from PaleoclimateToolGeoTiffGridWriter import PaleoclimateToolGeoTiffGridWriter
+from PaleoclimateToolNetCdfGridWriter import PaleoclimateToolNetCdfGridWriter
+from PaleoclimateToolProgressReporter import PaleoclimateToolProgressCancelled, PaleoclimateToolProgressReporter
+
+# NetCDF file lock: the NetCDF (HDF5) library is not thread safe, so all NetCDF files are opened, read and closed under this (module level) lock
+netCdf_file_lock = RLock()
 
 ## Paleoclimate Tool Data File Helper
 ## * Loads climate data files into arrays for the PaleoView tool.
@@ -38,10 +56,13 @@ import lxml._elementpath
 class PaleoclimateToolDataFileHelper :
 
     # Initialise
-    def __init__(self, application_gui=None) :
+    def __init__(self, progress_reporter=None) :
 
-        # Set the application GUI
-        self.application_gui = application_gui
+        # Set the progress reporter (progress is only accumulated when none is provided)
+        if progress_reporter != None :
+            self.progress_reporter = progress_reporter
+        else :
+            self.progress_reporter = PaleoclimateToolProgressReporter()
 
         # Climate data source
         self.climate_data_source = 'local' # url or local
@@ -50,12 +71,23 @@ class PaleoclimateToolDataFileHelper :
         self.climate_data_url = ''
         self.climate_data_proxy = { 'active' : False, 'url' : '', 'username' : '', 'password' : '' }
 
+        # Climate data download manager (concurrent, resumable downloads)
+        self.download_manager = PaleoclimateToolDownloadManager()
+
         # Climate data directory
         self.climate_data_directory = { 'name' : '', 'directory' : '', 'path' : '' }
 
         # Region mask directory
         self.region_mask_directory = { 'name' : '', 'directory' : '', 'path' : '' }
 
+        # Region masks cached in-process (copies are returned)
+        self.cached_region_masks = {} # { (region_code, time_dependent_year) : array }
+
+        # Time dependent region masks (5-20995BP every 10 years) packed into a single bit-packed (year, lat, lon/8) .npy file (built once from the text files)
+        self.time_dependent_region_mask_years = range(5, 20996, 10)
+        self.time_dependent_region_mask_store_file = 'land-0-21KBP.Mask.npy'
+        self.time_dependent_region_mask_store = None # memory mapped when first required (False when unavailable)
+
         # Bias correction directory
         self.bias_correction_directory = { 'name' : '', 'directory' : '', 'path' : '' }
 
@@ -70,6 +102,12 @@ class PaleoclimateToolDataFileHelper :
         self.grid_height = 72
         self.grid_width = 144
 
+        # Grid cell area weights (cosine of cell centre latitudes)
+        self.grid_area_weights = np.meshgrid(np.ones(144), np.cos(np.arange(88.75,-88.751,-2.5)*np.pi/180.0))[1]
+
+        # Grid region statistic percentiles
+        self.grid_region_statistic_percentiles = { 'percentile_5th' : 5, 'percentile_25th' : 25, 'percentile_50th' : 50, 'percentile_75th' : 75, 'percentile_95th' : 95 }
+
         # Climate data parameters in presented order
         self.data_parameters = ['mean_temperature', 'minimum_temperature', 'maximum_temperature',
                                 'specific_humidity', 'relative_humidity', 'precipitation', 'sea_level_pressure']
@@ -99,16 +137,35 @@ class PaleoclimateToolDataFileHelper :
         self.use_netCdf_data = True
         self.current_netCdf_data_intervals = self.getCurrentNetCdfDataIntervals()
 
-        # Cached NetCDF file and subgroup for parameter # TODO clear NetCDF data cache
-        self.cached_netCdf_data = {} # { parameter : { 'rootgrp' : <DataSet>, 'root_interval_str' : str, 'sub_interval_str' : str,
-                                     #                 'year_grids' : {}, 'year_keys' : [], 'call_count' : int },
-                                     #   'delta_ref_data' : [] }
+        # Use memory mapped data files (converted from NetCDF files when missing): a (year, month, lat, lon) float32 array for each parameter and interval
+        self.use_mmap_data = False
+        self.mmap_data_file_postfix = '.npy'
+        self.current_mmap_data_intervals = self.getCurrentMmapDataIntervals()
+        self.cached_mmap_data = {} # { (parameter, root_interval_str) : { 'from_year_ad' : int, 'until_year_ad' : int, 'data' : <memmap> } }
 
-        # Number of netCDF arrays to cache (set to interval size : max 100)
-        self.cached_netCdf_size = 31
+        # Cached NetCDF file and subgroup for parameter
+        self.cached_netCdf_data = {} # { parameter : { 'rootgrp' : <DataSet>, 'root_interval_str' : str, 'sub_interval_str' : str } }
 
-        # NetCDF grid writing cache
-        self.netCdf_writing_cache = {} # { 'times_array': [], 'data_array' : [], 'count' : int }
+        # Cached delta reference data (valid across generation calls until cleared)
+        self.delta_ref_data_cache = {} # { (parameter_group_code, parameter_code, interval_ad_from, interval_ad_until, months, correct_bias) : data }
+
+        # Climate data year grids cached (LRU) across all parameters within a memory budget (bytes)
+        self.climate_data_cache = PaleoclimateToolDataCache(memory_budget=512*1024*1024)
+
+        # Thread pool for loading the multiple parameters required by derived parameter calculations concurrently
+        self.parameter_loading_threads = 3
+        self.parameter_loading_pool = None # created when first required
+
+        # Optional cumulative sum index (sidecar .npy file for each NetCDF file) for sliding window interval means
+        # Each index file is float64 (years+1, 12, 72, 144): about 1MB per year, so 7GB for a 7000 year NetCDF file (24GB for all years of a parameter)
+        # Missing (NaN) values are counted in a further int32 sidecar file, only generated when missing values are present
+        self.use_cumulative_sum_index = False
+        self.cumulative_sum_index_file_postfix = '-cumulative.npy'
+        self.cumulative_missing_count_file_postfix = '-cumulative-missing.npy'
+        self.cached_cumulative_sum_indices = {} # { (parameter, root_interval_str) : { 'from_year_ad' : int, 'until_year_ad' : int, 'cumulative_sums' : <memmap>, 'cumulative_missing_counts' : <memmap> or None } or None }
+
+        # NetCDF or GeoTIFF grid data file writer (open while grids are generated)
+        self.grid_data_file_writer = None
         
         # Non-gridded parameter files
         self.non_gridded_parameter_files = { 'southern-oscillation' : { 'soi' : 'South_Oscillation_Index.txt', 'enso' : '' } }
@@ -166,6 +223,18 @@ class PaleoclimateToolDataFileHelper :
                                              'precipitation' : 'climate_data_grids*bias_correction_data_grids',
                                              'sea_level_pressure' : 'climate_data_grids + bias_correction_data_grids' }
 
+        # Linear bias corrections (bias corrected interval means can be calculated from uncorrected interval means)
+        self.linear_bias_corrections = ['mean_temperature', 'minimum_temperature', 'maximum_temperature', 'specific_humidity', 'precipitation', 'sea_level_pressure']
+
+        # Compiled calculation expressions (parameter and bias correction calculations are compiled once when first used)
+        self.compiled_expressions = {}
+
+    # Method gets the compiled version of a calculation expression (compiled once)
+    def compileExpression(self, expression) :
+        if not self.compiled_expressions.has_key(expression) :
+            self.compiled_expressions[expression] = PaleoclimateToolExpression(expression)
+        return self.compiled_expressions[expression]
+
     # Get data parameters
     def getDataParameters(self) :
         return self.data_parameters[:]
@@ -184,6 +253,31 @@ class PaleoclimateToolDataFileHelper :
             self.use_netCdf_data = use
         return self.use_netCdf_data
 
+    # Use memory mapped data files (NetCDF files are converted when required)
+    def useMmapData(self, use=None) :
+        if use != None :
+            self.use_mmap_data = use
+            self.closeMmapDataFiles()
+        return self.use_mmap_data
+
+    # Set the number of threads used to load parameters concurrently (1 loads sequentially)
+    def setParameterLoadingThreads(self, threads) :
+        if self.parameter_loading_pool != None :
+            self.parameter_loading_pool.close()
+            self.parameter_loading_pool = None
+        self.parameter_loading_threads = threads
+
+    # Set the number of climate data files downloaded concurrently
+    def setDownloadThreads(self, threads) :
+        self.download_manager.setThreads(threads)
+
+    # Use cumulative sum index files for interval means (generated alongside NetCDF files when required)
+    def useCumulativeSumIndex(self, use=None) :
+        if use != None :
+            self.use_cumulative_sum_index = use
+            self.closeCumulativeSumIndices()
+        return self.use_cumulative_sum_index
+
     # Get the month codes
     def getMonthCodes(self) :
         return self.month_codes[:]
@@ -225,6 +319,7 @@ class PaleoclimateToolDataFileHelper :
     # Set climate data directory
     def setClimateDataDirectory(self, path) :
         self.climate_data_directory = self.splitPath(path)
+        self.clearDeltaReferenceDataCache()
 
     # Get climate data directory path
     def getClimateDataDirectoryPath(self) :
@@ -311,14 +406,58 @@ class PaleoclimateToolDataFileHelper :
                 download_intervals_required.append(interval_label)
         return download_intervals_required
 
-    # Method clears NetCDF data file cache
-    def clearNetCdfDataCache(self) :
-        if self.cached_netCdf_data.has_key('delta_ref_data') :
-            self.cached_netCdf_data.pop('delta_ref_data')
-        for parameter, cached_data in self.cached_netCdf_data.items() :
-            if cached_data.has_key('rootgrp') :
-                cached_data['rootgrp'].close()
-            self.cached_netCdf_data.pop(parameter)
+    # Method clears NetCDF data file cache (and cached climate data year grids and delta reference data unless retained)
+    def clearNetCdfDataCache(self, retain_year_grids=False) :
+        with netCdf_file_lock :
+            for parameter, cached_data in self.cached_netCdf_data.items() :
+                if cached_data.has_key('rootgrp') :
+                    cached_data['rootgrp'].close()
+                self.cached_netCdf_data.pop(parameter)
+        if not retain_year_grids :
+            self.climate_data_cache.clear()
+            self.clearDeltaReferenceDataCache()
+        self.closeCumulativeSumIndices()
+        self.closeMmapDataFiles()
+
+    # Method clears cached delta reference data
+    def clearDeltaReferenceDataCache(self) :
+        self.delta_ref_data_cache = {}
+
+    # Set climate data cache memory budget (bytes)
+    def setClimateDataCacheMemoryBudget(self, memory_budget) :
+        self.climate_data_cache.setMemoryBudget(memory_budget)
+
+    # Get climate data cache statistics: hits, misses, evictions, year grids and bytes cached
+    def getClimateDataCacheStatistics(self) :
+        return self.climate_data_cache.getStatistics()
+
+    # Get the settings required to construct an equivalent helper (eg. within worker processes)
+    def getHelperSettings(self) :
+        return { 'climate_data_source' : self.climate_data_source,
+                 'climate_data_url' : self.climate_data_url,
+                 'climate_data_proxy' : self.climate_data_proxy.copy(),
+                 'climate_data_directory' : self.climate_data_directory['path'],
+                 'region_mask_directory' : self.region_mask_directory['path'],
+                 'bias_correction_directory' : self.bias_correction_directory['path'],
+                 'use_netCdf_data' : self.use_netCdf_data,
+                 'use_mmap_data' : self.use_mmap_data,
+                 'use_cumulative_sum_index' : self.use_cumulative_sum_index,
+                 'climate_data_cache_memory_budget' : self.climate_data_cache.getMemoryBudget(),
+                 'parameter_loading_threads' : self.parameter_loading_threads }
+
+    # Apply settings from an equivalent helper
+    def applyHelperSettings(self, settings) :
+        self.setClimateDataSource(settings['climate_data_source'])
+        self.setClimateDataUrl(settings['climate_data_url'])
+        self.setClimateDataProxy(settings['climate_data_proxy']['active'], settings['climate_data_proxy']['url'], settings['climate_data_proxy']['username'], settings['climate_data_proxy']['password'])
+        self.setClimateDataDirectory(settings['climate_data_directory'])
+        self.setRegionMaskDirectory(settings['region_mask_directory'])
+        self.setBiasCorrectionDirectory(settings['bias_correction_directory'])
+        self.useNetCdfData(use=settings['use_netCdf_data'])
+        self.useMmapData(use=settings['use_mmap_data'])
+        self.useCumulativeSumIndex(use=settings['use_cumulative_sum_index'])
+        self.setClimateDataCacheMemoryBudget(settings['climate_data_cache_memory_budget'])
+        self.setParameterLoadingThreads(settings['parameter_loading_threads'])
 
     # Climate data download interval present
     def climateDataDownloadIntervalPresent(self, parameter, interval_label) :
@@ -326,6 +465,8 @@ class PaleoclimateToolDataFileHelper :
         if self.use_netCdf_data : # Check for NetCDF data file
 
             expected_netCdf_file = (parameter+'-'+interval_label+'.nc')
+            if self.use_mmap_data and path.exists(path.join(self.climate_data_directory['path'], (parameter+'-'+interval_label+self.mmap_data_file_postfix))) :
+                return True
             return path.exists(path.join(self.climate_data_directory['path'], expected_netCdf_file))
 
         else : # Check for raw climate data
@@ -371,10 +512,13 @@ class PaleoclimateToolDataFileHelper :
     # Set region mask directory
     def setRegionMaskDirectory(self, path) :
         self.region_mask_directory = self.splitPath(path)
+        self.cached_region_masks = {}
+        self.time_dependent_region_mask_store = None
 
     # Set bias correction directory
     def setBiasCorrectionDirectory(self, path) :
         self.bias_correction_directory = self.splitPath(path)
+        self.clearDeltaReferenceDataCache()
 
     # Set File Generation directory
     def setFileGenerationDirectory(self, path) :
@@ -452,20 +596,78 @@ class PaleoclimateToolDataFileHelper :
         else : # no contents
             return True
 
-    # Method loads region mask
+    # Method loads region mask (cached)
     def loadRegionMask(self, region_code, time_dependent=False, year=150) :
         if time_dependent :
-            #region_mask_dict = {}
-            #for year in np.arange(5, 20996, 10) :
-            mask_file = path.join(self.region_mask_directory['path'], 'land-0-21KBP', (str(year)+ 'BP.Mask.txt'))
-            if region_code == 'land-0-21KBP' :
-                return (np.genfromtxt(mask_file, delimiter=1) > 0.5)*1
-            elif region_code == 'ocean-0-21KBP' :
-                return (np.genfromtxt(mask_file, delimiter=1) < 0.5)*1
-            #return region_mask_dict
+            cache_key = (region_code, year)
+        else :
+            cache_key = (region_code, None)
+        if not self.cached_region_masks.has_key(cache_key) :
+            if time_dependent :
+                land_mask = self.loadTimeDependentLandMask(year)
+                if region_code == 'land-0-21KBP' :
+                    self.cached_region_masks[cache_key] = land_mask
+                elif region_code == 'ocean-0-21KBP' :
+                    self.cached_region_masks[cache_key] = 1 - land_mask
+                else :
+                    return None
+            else :
+                mask_file = path.join(self.region_mask_directory['path'], (region_code + '.msk'))
+                self.cached_region_masks[cache_key] = np.genfromtxt(mask_file, delimiter=1)
+        return self.cached_region_masks[cache_key].copy()
+
+    # Method loads the time dependent land mask for a year (BP) from the packed mask store (or the text file when the store is unavailable)
+    def loadTimeDependentLandMask(self, year) :
+        if self.time_dependent_region_mask_store is None :
+            self.time_dependent_region_mask_store = self.openTimeDependentRegionMaskStore()
+        if self.time_dependent_region_mask_store is not False and year in self.time_dependent_region_mask_years :
+            packed_mask = self.time_dependent_region_mask_store[self.time_dependent_region_mask_years.index(year)]
+            return np.unpackbits(packed_mask, axis=-1)[:,:self.grid_width].astype(int)
         else :
-            mask_file = path.join(self.region_mask_directory['path'], (region_code + '.msk'))
-            return np.genfromtxt(mask_file, delimiter=1)
+            mask_file = path.join(self.region_mask_directory['path'], 'land-0-21KBP', (str(year)+ 'BP.Mask.txt'))
+            return (np.genfromtxt(mask_file, delimiter=1) > 0.5)*1
+
+    # Method opens (memory maps) the packed time dependent region mask store, generating it from the text files when missing
+    # Returns False when the store cannot be generated (e.g. read-only installation directory)
+    def openTimeDependentRegionMaskStore(self) :
+        store_file_path = path.join(self.region_mask_directory['path'], self.time_dependent_region_mask_store_file)
+        expected_shape = (len(self.time_dependent_region_mask_years), self.grid_height, int(ceil(self.grid_width/8.0)))
+        try :
+            if not path.exists(store_file_path) :
+                self.generateTimeDependentRegionMaskStore()
+            store = np.load(store_file_path, mmap_mode='r')
+            if store.shape != expected_shape :
+                return False
+            return store
+        except Exception, e :
+            return False
+
+    # Method generates the packed time dependent region mask store from the text mask files
+    def generateTimeDependentRegionMaskStore(self) :
+        store_file_path = path.join(self.region_mask_directory['path'], self.time_dependent_region_mask_store_file)
+        try :
+            packed_masks = np.zeros((len(self.time_dependent_region_mask_years), self.grid_height, int(ceil(self.grid_width/8.0))), dtype=np.uint8)
+            for i, year in enumerate(self.time_dependent_region_mask_years) :
+                mask_file = open(path.join(self.region_mask_directory['path'], 'land-0-21KBP', (str(year)+ 'BP.Mask.txt')))
+                try :
+                    mask_digits = np.frombuffer(''.join(mask_file.read().split()), dtype=np.uint8).reshape(self.grid_height, self.grid_width) # one digit per cell
+                finally :
+                    mask_file.close()
+                packed_masks[i] = np.packbits((mask_digits - ord('0')) > 0.5, axis=-1)
+            f = open(store_file_path+'.tmp', 'wb')
+            try :
+                np.save(f, packed_masks)
+            finally :
+                f.close()
+            if path.exists(store_file_path) :
+                remove(store_file_path)
+            rename(store_file_path+'.tmp', store_file_path)
+        except Exception, e :
+            if path.exists(store_file_path+'.tmp') :
+                remove(store_file_path+'.tmp')
+            exception_message = 'Could not generate time dependent region mask store: ' + store_file_path + '\n' + str(e)
+            raise Exception(exception_message)
+        return store_file_path
 
     # Method finds nearest time dependent region mask year
     def nearestTimeDependentRegionMaskYear(self, year) :
@@ -490,21 +692,27 @@ class PaleoclimateToolDataFileHelper :
                               region_mask=1,
                               generate_grids=True,
                               all_months=False,
-                              correct_bias=False) :
+                              correct_bias=False,
+                              progress_reporter=None) :
+
+        # Report progress via the helper progress reporter unless another is provided (eg. by a worker thread)
+        if progress_reporter == None :
+            progress_reporter = self.progress_reporter
 
         # Expand region mask when not a grid (=1 in tests)
         if type(region_mask) != np.ndarray and type(region_mask) != dict :
             region_mask = np.zeros((self.grid_height, self.grid_width)) + region_mask
 
-        # Update current NetCDF data file availability
+        # Update current NetCDF and memory mapped data file availability
         self.getCurrentNetCdfDataIntervals()
+        self.getCurrentMmapDataIntervals()
 
-        # Set netCDF cache size to the interval size
-        self.cached_netCdf_size = min(interval_size+1, 500)
-        
         # Setup proxy for web-based climate data when required
         self.setupClimateDataProxy()
 
+        # Convert NetCDF files to memory mapped data files (with progress) when required
+        self.generateRequiredMmapClimateData(parameter_group_code, parameter_code, period_ad_from, period_ad_until, interval_size, delta_ref_period_ad, progress_reporter)
+
         # Reset bias correction data cache
         self.cached_bias_correction_data_grids = {}
 
@@ -522,48 +730,30 @@ class PaleoclimateToolDataFileHelper :
 
         # Collect (cached) delta reference data when required
         if delta_ref_period_ad :
-            if self.cached_netCdf_data.has_key('delta_ref_data') :
-                delta_ref_data = self.cached_netCdf_data['delta_ref_data']
-            else :
-                if all_months :
-                    delta_ref_data = []
-                    for month_index in range(12) :
-                        delta_ref_data.append(self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
-                                                                                 parameter_code=parameter_code,
-                                                                                 interval_ad_from=(delta_ref_period_ad - interval_size/2),
-                                                                                 interval_ad_until=(delta_ref_period_ad + interval_size/2 - int(not bool(interval_size%2))),
-                                                                                 month_indices=[month_index],
-                                                                                 correct_bias=correct_bias))
-                else :
-                    delta_ref_data = self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
-                                                                        parameter_code=parameter_code,
-                                                                        interval_ad_from=(delta_ref_period_ad - interval_size/2),
-                                                                        interval_ad_until=(delta_ref_period_ad + interval_size/2 - int(not bool(interval_size%2))),
-                                                                        month_indices=month_indices,
-                                                                        correct_bias=correct_bias)
-                self.cached_netCdf_data['delta_ref_data'] = delta_ref_data
+            delta_ref_data = self.loadDeltaReferenceData(parameter_group_code=parameter_group_code,
+                                                         parameter_code=parameter_code,
+                                                         interval_ad_from=(delta_ref_period_ad - interval_size/2),
+                                                         interval_ad_until=(delta_ref_period_ad + interval_size/2 - int(not bool(interval_size%2))),
+                                                         month_indices=month_indices,
+                                                         all_months=all_months,
+                                                         correct_bias=correct_bias)
 
         # Collect data
         parameter_data = []
         intervals = range(period_ad_from, period_ad_until+1, interval_step)
-        if all_months :
-            for month_index in range(12) :
-                parameter_data_month = []
-                for i, interval_from in enumerate(intervals) :
-                    parameter_data_month.append(self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
-                                                                                   parameter_code=parameter_code,
-                                                                                   interval_ad_from=(interval_from - interval_size/2),
-                                                                                   interval_ad_until=(interval_from + interval_size/2 - int(not bool(interval_size%2))),
-                                                                                   month_indices=[month_index],
-                                                                                   correct_bias=correct_bias))
-                    if self.application_gui != None :
-                        try :
-                            self.application_gui.generation_status_bar['value'] += interval_size
-                            self.application_gui.update() # .update_idletasks()
-                        except :
-                            return([])
-                        #print 'generateParameterData, all_months:', all_months, self.application_gui.generation_status_bar['value'], time()
-                parameter_data.append(parameter_data_month)
+        if all_months : # each interval is generated for all 12 months at once, then collected by month
+            parameter_data = [[] for month_index in range(12)]
+            for i, interval_from in enumerate(intervals) :
+                parameter_data_months = self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
+                                                                           parameter_code=parameter_code,
+                                                                           interval_ad_from=(interval_from - interval_size/2),
+                                                                           interval_ad_until=(interval_from + interval_size/2 - int(not bool(interval_size%2))),
+                                                                           month_indices=range(12),
+                                                                           correct_bias=correct_bias,
+                                                                           all_months=True)
+                for month_index in range(12) :
+                    parameter_data[month_index].append(parameter_data_months[month_index])
+                progress_reporter.addProgress('generation', interval_size * 12)
         else :
             for i, interval_from in enumerate(intervals) :
                 parameter_data.append(self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
@@ -572,19 +762,16 @@ class PaleoclimateToolDataFileHelper :
                                                                          interval_ad_until=(interval_from + interval_size/2 - int(not bool(interval_size%2))),
                                                                          month_indices=month_indices,
                                                                          correct_bias=correct_bias))
-                if self.application_gui != None :
-                    try :
-                        self.application_gui.generation_status_bar['value'] += interval_size * len(month_indices)
-                        self.application_gui.update() # .update_idletasks()
-                    except :
-                        return([])
-                    #print 'generateParameterData, all_months:', all_months, self.application_gui.generation_status_bar['value'], time()
+                progress_reporter.addProgress('generation', interval_size * len(month_indices))
+
+        # Apply any progress held back by the rate limited refresh
+        progress_reporter.refresh(force=True)
 
         # Calculate delta values from reference data when required 
         if delta_ref_period_ad :
             if all_months :
                 for month_index in range(12) :
-                    parameter_data[month_index] = self.calculateDeltaValues(parameter_data[month_index], delta_ref_data, delta_as_percent=delta_as_percent, grid_data=self.parameterDataIsGridded(parameter_group_code, parameter_code))
+                    parameter_data[month_index] = self.calculateDeltaValues(parameter_data[month_index], delta_ref_data[month_index], delta_as_percent=delta_as_percent, grid_data=self.parameterDataIsGridded(parameter_group_code, parameter_code))
             else :
                 parameter_data = self.calculateDeltaValues(parameter_data, delta_ref_data, delta_as_percent=delta_as_percent, grid_data=self.parameterDataIsGridded(parameter_group_code, parameter_code))
 
@@ -613,14 +800,74 @@ class PaleoclimateToolDataFileHelper :
         else : # Return data list
             return parameter_data
 
+    # Method generates (map) grid data for each of the years, fanning contiguous chunks of years out across worker processes when required.
+    # Yields (year_ad, grid data) in year order so that files can be generated as the data arrives.
+    def generateParameterDataForYears(self, period_years_ad, processes=1, chunk_size=None, **generation_arguments) :
+
+        # Split the years into contiguous chunks (so each worker benefits from its cache)
+        if not chunk_size :
+            chunk_size = max(1, int(ceil(len(period_years_ad)/(processes*4.0))))
+        year_chunks = [period_years_ad[i:(i+chunk_size)] for i in range(0, len(period_years_ad), chunk_size)]
+        interval_step = generation_arguments.pop('interval_step', 10)
+        if len(period_years_ad) > 1 :
+            interval_step = period_years_ad[1] - period_years_ad[0]
+        chunk_generation_arguments = []
+        for year_chunk in year_chunks :
+            chunk_arguments = generation_arguments.copy()
+            chunk_arguments.update({ 'period_ad_from' : year_chunk[0], 'period_ad_until' : year_chunk[-1], 'interval_step' : interval_step, 'generate_grids' : True })
+            chunk_generation_arguments.append(chunk_arguments)
+
+        # Generate within this process or a pool of worker processes (each with their own helper, NetCDF files, and a share of the cache memory budget)
+        if processes > 1 and len(year_chunks) > 1 :
+            self.getCurrentMmapDataIntervals()
+            self.generateRequiredMmapClimateData(generation_arguments['parameter_group_code'], generation_arguments['parameter_code'], period_years_ad[0], period_years_ad[-1],
+                                                 generation_arguments.get('interval_size', 10), generation_arguments.get('delta_ref_period_ad'), generation_arguments.get('progress_reporter', self.progress_reporter)) # before the workers could convert the same files
+            worker_settings = self.getHelperSettings()
+            worker_settings['climate_data_cache_memory_budget'] /= processes
+            worker_settings['parameter_loading_threads'] = 1
+            pool = Pool(processes, initialiseWorkerDataFileHelper, (worker_settings,))
+            try :
+                for year_chunk, chunk_parameter_data in zip(year_chunks, pool.imap(generateWorkerParameterData, chunk_generation_arguments)) :
+                    for year_ad, parameter_data in zip(year_chunk, chunk_parameter_data) :
+                        yield (year_ad, parameter_data)
+                pool.close()
+            except :
+                pool.terminate()
+                raise
+            finally :
+                pool.join()
+        else :
+            for year_chunk, chunk_arguments in zip(year_chunks, chunk_generation_arguments) :
+                for year_ad, parameter_data in zip(year_chunk, self.generateParameterData(**chunk_arguments)) :
+                    yield (year_ad, parameter_data)
+
+    # Method loads delta reference data for an interval (cached until cleared): for the selected months, or a list for each of the 12 months when all months
+    def loadDeltaReferenceData(self, parameter_group_code, parameter_code, interval_ad_from, interval_ad_until, month_indices, all_months=False, correct_bias=False) :
+        if all_months :
+            months = 'all'
+        else :
+            months = tuple(sorted(month_indices))
+        key = (parameter_group_code, parameter_code, interval_ad_from, interval_ad_until, months, bool(correct_bias))
+        if not self.delta_ref_data_cache.has_key(key) :
+            self.delta_ref_data_cache[key] = self.generateParameterDataInterval(parameter_group_code=parameter_group_code,
+                                                                                parameter_code=parameter_code,
+                                                                                interval_ad_from=interval_ad_from,
+                                                                                interval_ad_until=interval_ad_until,
+                                                                                month_indices=month_indices,
+                                                                                correct_bias=correct_bias,
+                                                                                all_months=all_months)
+        return self.delta_ref_data_cache[key]
+
     # Method generates requested parameter data for a single interval
+    # When all months, a list of the data for each of the 12 months is generated (gridded data is loaded once for all months)
     def generateParameterDataInterval(self,
                                       parameter_group_code,
                                       parameter_code,
                                       interval_ad_from,
                                       interval_ad_until,
                                       month_indices,
-                                      correct_bias=False) :
+                                      correct_bias=False,
+                                      all_months=False) :
         #print 'generateParameterDataInterval from', interval_ad_from, 'until', interval_ad_until
 
         # Resolve parameter calculations if present
@@ -631,59 +878,138 @@ class PaleoclimateToolDataFileHelper :
             # Handle non-gridded parameter files differently
             parameter_data_is_gridded = self.parameterDataIsGridded(parameter_group_code, parameter_code)
 
-            # Aggregation parameter
+            # Generate each month separately for non-gridded data when all months
+            if all_months and not parameter_data_is_gridded :
+                return [self.generateParameterDataInterval(parameter_group_code, parameter_code, interval_ad_from, interval_ad_until, [month_index], correct_bias) for month_index in range(12)]
+            elif all_months :
+                month_indices = range(12)
+
+            # Gridded data is loaded for the whole interval as (year, month, lat, lon) arrays and reduced in one pass
             if parameter_data_is_gridded :
-                sum_for_average = np.zeros((self.grid_height, self.grid_width))
-            else :
-                sum_for_average = 0
 
-            # Calculate for each year in interval
-            for year_ad in range(interval_ad_from, interval_ad_until+1) :
+                # Use interval means from cumulative sum index files when only (linear) averages are calculated
+                if self.use_cumulative_sum_index and parameter_calculation['calculate'].keys() == ['average'] and parameter_calculation['return'] == 'average' :
+                    calculation_expression = self.compileExpression(parameter_calculation['calculate']['average'])
+                    calculation_values = {}
+                    for parameter in parameter_calculation['parameters'] :
+                        if parameter in calculation_expression.variables :
+                            grid_values = self.loadClimateDataIntervalMeans(parameter, interval_ad_from, interval_ad_until, month_indices, correct_bias)
+                            if grid_values is None :
+                                break
+                            calculation_values[parameter] = grid_values
+                    else :
+                        if all_months :
+                            return list(calculation_expression.evaluate(calculation_values))
+                        return calculation_expression.evaluate(calculation_values).mean(0)
 
-                # Collect/calculate any averages and seasonality standard deviations and coefficients of variation
+                # Resolve the parameters (and months) required for each calculation
                 if 'average' in parameter_calculation['calculate'].keys() :
                     calculate_key = 'average'
                 elif 'stdev_seasonality' in parameter_calculation['calculate'].keys() :
                     calculate_key = 'stdev_seasonality'
                 elif 'coeff_var_seasonality' in parameter_calculation['calculate'].keys() :
                     calculate_key = 'coeff_var_seasonality'
+                calculation_expressions = dict([(key, self.compileExpression(expression)) for key, expression in parameter_calculation['calculate'].items()])
+                return_expression = self.compileExpression(parameter_calculation['return'])
+                load_requests = []
+                for parameter in parameter_calculation['parameters'] :
+                    if calculate_key and parameter in calculation_expressions[calculate_key].variables :
+                        load_requests.append((calculate_key, parameter, month_indices))
+                    if calculation_expressions.has_key('annual_range') and parameter in calculation_expressions['annual_range'].variables :
+                        load_requests.append(('annual_range', parameter, range(12)))
+
+                # Load all required parameters for the interval concurrently
+                loaded_grid_values = self.loadClimateDataIntervalGridsConcurrently([(parameter, load_month_indices) for (key, parameter, load_month_indices) in load_requests],
+                                                                                   interval_ad_from, interval_ad_until, correct_bias)
+
+                # Collect/calculate any averages and seasonality standard deviations and coefficients of variation (only those returned)
+                calculated_values = {}
                 if calculate_key == 'average' or calculate_key == 'stdev_seasonality' or calculate_key == 'coeff_var_seasonality' :
-                    for parameter in parameter_calculation['parameters'] :
-                        if parameter_calculation['calculate'][calculate_key].find(parameter) > -1 :
-                            if parameter_data_is_gridded :
-                                grid_values = self.loadClimateDataGrids(parameter, year_ad, month_indices, correct_bias)
-                                exec(parameter + ' = grid_values')
-                            else :
-                                data_values = self.loadNongriddedClimateData(parameter_group_code, parameter_code, year_ad, month_indices)
-                                exec(parameter + ' = data_values')
-                    calculation_values = eval(parameter_calculation['calculate'][calculate_key])
-                    average = calculation_values.mean(0)
-                    stdev_seasonality = calculation_values.std(0)
-                    coeff_var_seasonality = stdev_seasonality/average
-
-                # Calculate any annual ranges
-                if 'annual_range' in parameter_calculation['calculate'].keys() :
+                    grid_values = dict([(parameter, loaded_grid_values[i]) for i, (key, parameter, load_month_indices) in enumerate(load_requests) if key == calculate_key])
+                    calculation_values = calculation_expressions[calculate_key].evaluate(grid_values)
+                    if all_months :
+                        self.calculateSeasonalValues(calculation_values, None, return_expression.variables, calculated_values)
+                    else :
+                        self.calculateSeasonalValues(calculation_values, 1, return_expression.variables, calculated_values)
+
+                # Calculate any annual ranges (repeated for each month when all months)
+                if calculation_expressions.has_key('annual_range') :
                     calculate_key = 'annual_range'
-                    for parameter in parameter_calculation['parameters'] :
-                        if parameter_calculation['calculate'][calculate_key].find(parameter) > -1 :
-                            if parameter_data_is_gridded :
-                                grid_values = self.loadClimateDataGrids(parameter, year_ad, range(12), correct_bias)
-                                exec(parameter + ' = grid_values')
-                            else :
-                                data_values = self.loadNongriddedClimateData(parameter_group_code, parameter_code, year_ad, range(12))
-                                exec(parameter + ' = data_values')
-                    calculation_values = eval(parameter_calculation['calculate'][calculate_key])
-                    annual_range = calculation_values.max(0) - calculation_values.min(0)
-
-                # Aggregate calculated value for the year
-                sum_for_average += eval(parameter_calculation['return'])
-
-            # Calculate average across interval
-            parameter_data_interval = sum_for_average/(interval_ad_until - interval_ad_from + 1)
+                    grid_values = dict([(parameter, loaded_grid_values[i]) for i, (key, parameter, load_month_indices) in enumerate(load_requests) if key == calculate_key])
+                    calculation_values = calculation_expressions[calculate_key].evaluate(grid_values)
+                    calculated_values['annual_range'] = calculation_values.max(1) - calculation_values.min(1)
+                    if all_months :
+                        calculated_values['annual_range'] = np.repeat(calculated_values['annual_range'][:,np.newaxis], 12, axis=1)
+
+                # Calculate average across interval years
+                parameter_data_interval = return_expression.evaluate(calculated_values).mean(0)
+                if all_months :
+                    parameter_data_interval = list(parameter_data_interval)
+
+            else :
+
+                # Aggregation parameter
+                sum_for_average = 0
+
+                # Compiled calculations
+                calculation_expressions = dict([(key, self.compileExpression(expression)) for key, expression in parameter_calculation['calculate'].items()])
+                return_expression = self.compileExpression(parameter_calculation['return'])
+
+                # Calculate for each year in interval
+                for year_ad in range(interval_ad_from, interval_ad_until+1) :
+
+                    # Collect/calculate any averages and seasonality standard deviations and coefficients of variation
+                    calculated_values = {}
+                    if 'average' in parameter_calculation['calculate'].keys() :
+                        calculate_key = 'average'
+                    elif 'stdev_seasonality' in parameter_calculation['calculate'].keys() :
+                        calculate_key = 'stdev_seasonality'
+                    elif 'coeff_var_seasonality' in parameter_calculation['calculate'].keys() :
+                        calculate_key = 'coeff_var_seasonality'
+                    if calculate_key == 'average' or calculate_key == 'stdev_seasonality' or calculate_key == 'coeff_var_seasonality' :
+                        data_values = {}
+                        for parameter in parameter_calculation['parameters'] :
+                            if parameter in calculation_expressions[calculate_key].variables :
+                                data_values[parameter] = self.loadNongriddedClimateData(parameter_group_code, parameter_code, year_ad, month_indices)
+                        calculation_values = calculation_expressions[calculate_key].evaluate(data_values)
+                        self.calculateSeasonalValues(calculation_values, 0, return_expression.variables, calculated_values)
+
+                    # Calculate any annual ranges
+                    if calculation_expressions.has_key('annual_range') :
+                        calculate_key = 'annual_range'
+                        data_values = {}
+                        for parameter in parameter_calculation['parameters'] :
+                            if parameter in calculation_expressions[calculate_key].variables :
+                                data_values[parameter] = self.loadNongriddedClimateData(parameter_group_code, parameter_code, year_ad, range(12))
+                        calculation_values = calculation_expressions[calculate_key].evaluate(data_values)
+                        calculated_values['annual_range'] = calculation_values.max(0) - calculation_values.min(0)
+
+                    # Aggregate calculated value for the year
+                    sum_for_average += return_expression.evaluate(calculated_values)
+
+                # Calculate average across interval
+                parameter_data_interval = sum_for_average/(interval_ad_until - interval_ad_from + 1)
 
             # Return parameter data for interval
             return parameter_data_interval
 
+    # Method calculates the averages, seasonality standard deviations and/or coefficients of variation (across the month axis) required by a return calculation
+    # Each month is calculated alone when no month axis is specified
+    def calculateSeasonalValues(self, calculation_values, month_axis, required_values, calculated_values) :
+        if 'average' in required_values or 'coeff_var_seasonality' in required_values :
+            if month_axis == None :
+                calculated_values['average'] = calculation_values
+            else :
+                calculated_values['average'] = calculation_values.mean(month_axis)
+        if 'stdev_seasonality' in required_values or 'coeff_var_seasonality' in required_values :
+            if month_axis == None :
+                calculated_values['stdev_seasonality'] = calculation_values - calculation_values # zero (or NaN when not finite) as for a single value
+            else :
+                calculated_values['stdev_seasonality'] = calculation_values.std(month_axis)
+        if 'coeff_var_seasonality' in required_values :
+            calculated_values['coeff_var_seasonality'] = calculated_values['stdev_seasonality']/calculated_values['average']
+        return calculated_values
+
     # Method determines if the parameter data gridded?
     def parameterDataIsGridded(self, parameter_group_code, parameter_code) :
         return not (self.non_gridded_parameter_files.has_key(parameter_group_code) and self.non_gridded_parameter_files[parameter_group_code].has_key(parameter_code))
@@ -797,15 +1123,380 @@ class PaleoclimateToolDataFileHelper :
 
         # Correct bias when required
         if correct_bias :
-            bias_correction_data_grids = self.loadBiasCorrectionDataGrids(parameter, month_indices)
-            if self.pre_bias_correction_bounds.has_key(parameter) :
-                for data_grids, bounds in self.pre_bias_correction_bounds[parameter].items() :
-                    for bound_type, bound_value in bounds.items() :
-                        exec(data_grids + ' = self.applyBoundToDataGrid(' + data_grids + ', bound_type, bound_value)')
-            return eval(self.bias_correction_calculation[parameter])
+            return self.correctClimateDataBias(parameter, climate_data_grids, month_indices)
         else :
             return climate_data_grids
 
+    # Method loads climate data for the selected months of each year within an interval as a (year, month, lat, lon) array
+    def loadClimateDataIntervalGrids(self, parameter, interval_ad_from, interval_ad_until, month_indices, correct_bias=False) :
+
+        # Re-order month indices when months cross years
+        month_indices = self.rearrangeMonthIndices(month_indices)
+        months_cross_years = (month_indices[0] > month_indices[-1])
+
+        # Load the selected months for the interval years (including the previous year when months cross years)
+        interval_grids = self.loadClimateDataInterval(parameter, (interval_ad_from - int(months_cross_years)), interval_ad_until, month_indices)
+
+        # Shift months that cross into the previous year
+        if months_cross_years :
+            years = interval_ad_until - interval_ad_from + 1
+            climate_data_grids = np.empty((years, len(month_indices), self.grid_height, self.grid_width))
+            for m, i in enumerate(month_indices) :
+                if i > month_indices[-1] : # crosses into the previous year
+                    climate_data_grids[:,m] = interval_grids[0:years,m]
+                else :
+                    climate_data_grids[:,m] = interval_grids[1:,m]
+        else :
+            climate_data_grids = interval_grids
+
+        # Correct bias when required
+        if correct_bias :
+            return self.correctClimateDataBias(parameter, climate_data_grids, month_indices)
+        else :
+            return climate_data_grids
+
+    # Method loads interval grids for each (parameter, month indices) request concurrently using a thread pool (in request order)
+    # Requests are only loaded concurrently for distinct parameters, as each parameter has its own cached files
+    # NetCDF reads are serialised (via the NetCDF file lock), so only the memory mapped and raw file loading and bias correction run in parallel
+    def loadClimateDataIntervalGridsConcurrently(self, requests, interval_ad_from, interval_ad_until, correct_bias=False) :
+        load = lambda request : self.loadClimateDataIntervalGrids(request[0], interval_ad_from, interval_ad_until, request[1], correct_bias)
+        if self.parameter_loading_threads > 1 and len(requests) > 1 and len(set([request[0] for request in requests])) == len(requests) :
+            if self.parameter_loading_pool == None :
+                self.parameter_loading_pool = ThreadPool(self.parameter_loading_threads)
+            return self.parameter_loading_pool.map(load, requests)
+        else :
+            return map(load, requests)
+
+    # Method loads climate data for the selected months of each year from/until the years specified as a (year, month, lat, lon) array
+    def loadClimateDataInterval(self, parameter, from_year_ad, until_year_ad, month_indices=range(12)) :
+
+        interval_grids = np.empty(((until_year_ad - from_year_ad + 1), len(month_indices), self.grid_height, self.grid_width))
+
+        # Utilise local memory mapped data files when selected: slice the years directly
+        if self.climate_data_source == 'local' and self.use_mmap_data :
+            years_loaded = np.zeros(interval_grids.shape[0], dtype=bool)
+            for root_interval_str in self.current_mmap_data_intervals[parameter] :
+                mmap_data = self.openMmapDataFile(parameter, root_interval_str)
+                from_year_ad_loaded = max(mmap_data['from_year_ad'], from_year_ad)
+                until_year_ad_loaded = min(mmap_data['until_year_ad'], until_year_ad)
+                if from_year_ad_loaded <= until_year_ad_loaded :
+                    interval_grids[(from_year_ad_loaded - from_year_ad):(until_year_ad_loaded - from_year_ad + 1)] = mmap_data['data'][(from_year_ad_loaded - mmap_data['from_year_ad']):(until_year_ad_loaded - mmap_data['from_year_ad'] + 1)][:,month_indices]
+                    years_loaded[(from_year_ad_loaded - from_year_ad):(until_year_ad_loaded - from_year_ad + 1)] = True
+                if years_loaded.all() :
+                    break
+            if not years_loaded.all() :
+                year_label = self.convertAdYearToDataLabel(from_year_ad + (years_loaded == False).nonzero()[0][0])
+                raise Exception('Could not find memory mapped data for '+ parameter.replace('_', ' ').title() + ' data for ' + year_label + '.\n')
+
+        # Utilise local NetCDF files when present: read each year variable within a single pass over the subgroups
+        elif self.climate_data_source == 'local' and self.use_netCdf_data :
+
+            # Use year grids from the climate data cache when present
+            years_loaded = np.zeros(interval_grids.shape[0], dtype=bool)
+            for y, year_ad in enumerate(range(from_year_ad, until_year_ad+1)) :
+                year_grids = self.climate_data_cache.getYearGrids(parameter, year_ad)
+                if year_grids is not None :
+                    interval_grids[y] = year_grids[month_indices]
+                    years_loaded[y] = True
+
+            for root_interval_str in self.current_netCdf_data_intervals[parameter] :
+                root_interval_ad = self.convertDataIntervalLabelToAD(root_interval_str)
+                root_from_year_ad = max((root_interval_ad['from_year_ad'] - self.download_data_window), (1950 - 22000))
+                root_until_year_ad = min((root_interval_ad['until_year_ad'] + self.download_data_window), 1989)
+                if root_from_year_ad <= until_year_ad and root_until_year_ad >= from_year_ad and not years_loaded.all() :
+                    rootgrp = self.openNetCdfDataFile(parameter, root_interval_str)
+                    for sub_interval_str, subgroup in rootgrp.groups.items() :
+                        sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
+                        for year_ad in range(max(sub_interval_ad['from_year_ad'], from_year_ad), min(sub_interval_ad['until_year_ad'], until_year_ad)+1) :
+                            if not years_loaded[year_ad - from_year_ad] :
+                                with netCdf_file_lock :
+                                    year_grids = subgroup.variables[self.convertAdYearToDataLabel(year_ad)][:,:,:]
+                                self.climate_data_cache.addYearGrids(parameter, year_ad, year_grids)
+                                interval_grids[year_ad - from_year_ad] = year_grids[month_indices]
+                                years_loaded[year_ad - from_year_ad] = True
+            if not years_loaded.all() :
+                year_label = self.convertAdYearToDataLabel(from_year_ad + (years_loaded == False).nonzero()[0][0])
+                raise Exception('Could not find NetCDF data for '+ parameter.replace('_', ' ').title() + ' data for ' + year_label + '.\n')
+
+        # Otherwise load each raw data file grid
+        else :
+            for y, year_ad in enumerate(range(from_year_ad, until_year_ad+1)) :
+                for m, month_index in enumerate(month_indices) :
+                    interval_grids[y,m] = self.loadClimateDataGrid(parameter, year_ad, month_index)
+
+        return interval_grids
+
+    # Method opens a NetCDF data file for a parameter and root interval (reusing the cached file when already open)
+    def openNetCdfDataFile(self, parameter, root_interval_str) :
+        with netCdf_file_lock :
+            if self.cached_netCdf_data.has_key(parameter) and self.cached_netCdf_data[parameter].has_key('rootgrp') :
+                if self.cached_netCdf_data[parameter]['root_interval_str'] == root_interval_str :
+                    return self.cached_netCdf_data[parameter]['rootgrp']
+                self.cached_netCdf_data[parameter]['rootgrp'].close()
+                self.cached_netCdf_data[parameter].pop('rootgrp')
+            netCdf_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc'))
+            try :
+                rootgrp = Dataset(netCdf_file_path, 'r')
+            except Exception, e :
+                exception_message = 'Could not open NetCDF data file: ' + netCdf_file_path + '\n' + str(e)
+                raise Exception(exception_message)
+            self.cached_netCdf_data[parameter] = { 'rootgrp' : rootgrp, 'root_interval_str' : root_interval_str, 'sub_interval_str' : rootgrp.groups.keys()[0] }
+            return rootgrp
+
+    # Method opens a memory mapped data file for a parameter and root interval, converting the NetCDF file when missing or more recent
+    def openMmapDataFile(self, parameter, root_interval_str) :
+        if self.cached_mmap_data.has_key((parameter, root_interval_str)) :
+            return self.cached_mmap_data[(parameter, root_interval_str)]
+        mmap_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.mmap_data_file_postfix))
+        if self.mmapDataFileRequiresGeneration(parameter, root_interval_str) :
+            self.generateMmapClimateData(parameter, root_interval_str)
+        years_ad = self.getMmapDataFileYears(root_interval_str)
+        try :
+            mmap_data = np.load(mmap_file_path, mmap_mode='r')
+        except Exception, e :
+            exception_message = 'Could not open memory mapped data file: ' + mmap_file_path + '\n' + str(e)
+            raise Exception(exception_message)
+        if mmap_data.shape != ((years_ad['until_year_ad'] - years_ad['from_year_ad'] + 1), 12, self.grid_height, self.grid_width) :
+            raise Exception('Memory mapped data file does not contain the expected years (' + self.convertAdIntervalToDataLabel(years_ad['from_year_ad'], years_ad['until_year_ad']) + '): ' + mmap_file_path)
+        self.cached_mmap_data[(parameter, root_interval_str)] = { 'from_year_ad' : years_ad['from_year_ad'], 'until_year_ad' : years_ad['until_year_ad'], 'data' : mmap_data }
+        return self.cached_mmap_data[(parameter, root_interval_str)]
+
+    # Method checks if a memory mapped data file requires generation: missing or older than its NetCDF file
+    def mmapDataFileRequiresGeneration(self, parameter, root_interval_str) :
+        netCdf_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc'))
+        mmap_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.mmap_data_file_postfix))
+        return path.exists(netCdf_file_path) and (not path.exists(mmap_file_path) or path.getmtime(mmap_file_path) < path.getmtime(netCdf_file_path))
+
+    # Method generates the memory mapped data files (from NetCDF files) that are missing or older than their NetCDF files for the parameter data period (and delta reference period) when utilised
+    # Progress is reported (in years converted) via the 'conversion' progress key, which is reset once complete
+    def generateRequiredMmapClimateData(self, parameter_group_code, parameter_code, period_ad_from, period_ad_until, interval_size=10, delta_ref_period_ad=None, progress_reporter=None) :
+        if not (self.climate_data_source == 'local' and self.use_mmap_data) :
+            return
+        if not (self.parameter_calculation.has_key(parameter_group_code) and self.parameter_calculation[parameter_group_code].has_key(parameter_code)) : # non-gridded
+            return
+        years_ad_required = [((period_ad_from - interval_size/2 - 1), (period_ad_until + interval_size/2))] # including the previous year when months cross years
+        if delta_ref_period_ad :
+            years_ad_required.append(((delta_ref_period_ad - interval_size/2 - 1), (delta_ref_period_ad + interval_size/2)))
+        conversions = []
+        for parameter in self.parameter_calculation[parameter_group_code][parameter_code]['parameters'] :
+            for root_interval_str in self.current_mmap_data_intervals[parameter] :
+                years_ad = self.getMmapDataFileYears(root_interval_str)
+                if [from_year_ad for from_year_ad, until_year_ad in years_ad_required if from_year_ad <= years_ad['until_year_ad'] and until_year_ad >= years_ad['from_year_ad']] :
+                    if self.mmapDataFileRequiresGeneration(parameter, root_interval_str) :
+                        conversions.append((parameter, root_interval_str, (years_ad['until_year_ad'] - years_ad['from_year_ad'] + 1)))
+        if conversions :
+            if progress_reporter != None :
+                progress_reporter.startProgress('conversion', maximum=sum([years for parameter, root_interval_str, years in conversions]))
+            for parameter, root_interval_str, years in conversions :
+                self.generateMmapClimateData(parameter, root_interval_str, progress_reporter)
+            if progress_reporter != None :
+                progress_reporter.startProgress('conversion')
+                progress_reporter.refresh(force=True)
+
+    # Method generates a memory mapped data file for a parameter and root interval from its NetCDF file: a contiguous (year, month, lat, lon) float32 array
+    # Progress (each year converted) is added to the 'conversion' progress key when a progress reporter is provided (its refresh function may cancel the conversion)
+    def generateMmapClimateData(self, parameter, root_interval_str, progress_reporter=None) :
+        mmap_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.mmap_data_file_postfix))
+        rootgrp = self.openNetCdfDataFile(parameter, root_interval_str)
+        years_ad = self.getMmapDataFileYears(root_interval_str)
+        try :
+            mmap_data = np.lib.format.open_memmap(mmap_file_path+'.tmp', mode='w+', dtype='f4', shape=((years_ad['until_year_ad'] - years_ad['from_year_ad'] + 1), 12, self.grid_height, self.grid_width))
+            years_loaded = np.zeros(mmap_data.shape[0], dtype=bool)
+            for sub_interval_str, subgroup in rootgrp.groups.items() :
+                sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
+                for year_ad in range(max(sub_interval_ad['from_year_ad'], years_ad['from_year_ad']), min(sub_interval_ad['until_year_ad'], years_ad['until_year_ad'])+1) :
+                    with netCdf_file_lock :
+                        mmap_data[year_ad - years_ad['from_year_ad']] = subgroup.variables[self.convertAdYearToDataLabel(year_ad)][:,:,:]
+                    years_loaded[year_ad - years_ad['from_year_ad']] = True
+                    if progress_reporter != None :
+                        progress_reporter.addProgress('conversion', 1)
+            if not years_loaded.all() :
+                raise Exception('Missing data for ' + self.convertAdYearToDataLabel(years_ad['from_year_ad'] + (years_loaded == False).nonzero()[0][0]))
+            mmap_data.flush()
+            del mmap_data
+            if self.cached_mmap_data.has_key((parameter, root_interval_str)) :
+                self.cached_mmap_data.pop((parameter, root_interval_str))
+            if path.exists(mmap_file_path) :
+                remove(mmap_file_path)
+            rename(mmap_file_path+'.tmp', mmap_file_path)
+        except Exception, e :
+            if path.exists(mmap_file_path+'.tmp') :
+                remove(mmap_file_path+'.tmp')
+            if isinstance(e, PaleoclimateToolProgressCancelled) :
+                raise
+            exception_message = 'Could not generate memory mapped data file: ' + mmap_file_path + '\n' + str(e)
+            raise Exception(exception_message)
+        return mmap_file_path
+
+    # Method gets the years stored in memory mapped data files for a root interval (includes the download data window)
+    def getMmapDataFileYears(self, root_interval_str) :
+        root_interval_ad = self.convertDataIntervalLabelToAD(root_interval_str)
+        return { 'from_year_ad' : max((root_interval_ad['from_year_ad'] - self.download_data_window), (1950 - 22000)),
+                 'until_year_ad' : min((root_interval_ad['until_year_ad'] + self.download_data_window), 1989) }
+
+    # Method closes any open memory mapped data files
+    def closeMmapDataFiles(self) :
+        self.cached_mmap_data = {}
+
+    # Method loads the means of climate data for the selected months across the interval years via cumulative sum index files (None when not available)
+    def loadClimateDataIntervalMeans(self, parameter, interval_ad_from, interval_ad_until, month_indices, correct_bias=False) :
+
+        # Only available for local NetCDF files with linear bias corrections
+        if not (self.climate_data_source == 'local' and self.use_netCdf_data) or (correct_bias and parameter not in self.linear_bias_corrections) :
+            return None
+
+        # Re-order month indices when months cross years
+        month_indices = self.rearrangeMonthIndices(month_indices)
+        months_cross_years = (month_indices[0] > month_indices[-1])
+
+        # Find the index covering the interval (including the previous year when months cross years)
+        cumulative_sum_index = self.loadCumulativeSumIndex(parameter, (interval_ad_from - int(months_cross_years)), interval_ad_until)
+        if cumulative_sum_index is None :
+            return None
+
+        # Interval means are the difference between the cumulative sums at the interval boundaries (missing when any year within the interval is missing)
+        years = interval_ad_until - interval_ad_from + 1
+        cumulative_sums = cumulative_sum_index['cumulative_sums']
+        cumulative_missing_counts = cumulative_sum_index['cumulative_missing_counts']
+        climate_data_means = np.empty((len(month_indices), self.grid_height, self.grid_width))
+        for m, i in enumerate(month_indices) :
+            from_index = interval_ad_from - int(i > month_indices[-1]) - cumulative_sum_index['from_year_ad'] # crosses into the previous year
+            climate_data_means[m] = (cumulative_sums[from_index+years,i] - cumulative_sums[from_index,i])/years
+            if cumulative_missing_counts is not None :
+                climate_data_means[m][(cumulative_missing_counts[from_index+years,i] - cumulative_missing_counts[from_index,i]) > 0] = np.nan
+
+        # Correct bias when required
+        if correct_bias :
+            return self.correctClimateDataBias(parameter, climate_data_means, month_indices)
+        else :
+            return climate_data_means
+
+    # Method loads (opening or generating when required) the cumulative sum index covering the years for a parameter (None when not available)
+    def loadCumulativeSumIndex(self, parameter, from_year_ad, until_year_ad) :
+        for root_interval_str in self.current_netCdf_data_intervals[parameter] :
+            root_interval_ad = self.convertDataIntervalLabelToAD(root_interval_str)
+            root_from_year_ad = max((root_interval_ad['from_year_ad'] - self.download_data_window), (1950 - 22000))
+            root_until_year_ad = min((root_interval_ad['until_year_ad'] + self.download_data_window), 1989)
+            if root_from_year_ad <= from_year_ad and root_until_year_ad >= until_year_ad :
+                if not self.cached_cumulative_sum_indices.has_key((parameter, root_interval_str)) :
+                    self.cached_cumulative_sum_indices[(parameter, root_interval_str)] = self.openCumulativeSumIndex(parameter, root_interval_str)
+                cumulative_sum_index = self.cached_cumulative_sum_indices[(parameter, root_interval_str)]
+                if cumulative_sum_index and cumulative_sum_index['from_year_ad'] <= from_year_ad and cumulative_sum_index['until_year_ad'] >= until_year_ad :
+                    return cumulative_sum_index
+        return None
+
+    # Method opens a cumulative sum index file (memory mapped) for a parameter and root interval, generating it when missing or older than the NetCDF file
+    def openCumulativeSumIndex(self, parameter, root_interval_str) :
+        netCdf_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc'))
+        index_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.cumulative_sum_index_file_postfix))
+        missing_count_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.cumulative_missing_count_file_postfix))
+        try :
+            if not path.exists(index_file_path) or path.getmtime(index_file_path) < path.getmtime(netCdf_file_path) :
+                self.generateCumulativeSumIndex(parameter, root_interval_str)
+            years_ad = self.getNetCdfDataFileYears(parameter, root_interval_str)
+            cumulative_sums = np.load(index_file_path, mmap_mode='r')
+            cumulative_missing_counts = None
+            if path.exists(missing_count_file_path) :
+                cumulative_missing_counts = np.load(missing_count_file_path, mmap_mode='r')
+        except Exception, e : # fall back to loading the interval data (eg. insufficient disk space)
+            return None
+        if cumulative_sums.shape != ((years_ad['until_year_ad'] - years_ad['from_year_ad'] + 2), 12, self.grid_height, self.grid_width) :
+            return None
+        if cumulative_missing_counts is not None and cumulative_missing_counts.shape != cumulative_sums.shape :
+            return None
+        return { 'from_year_ad' : years_ad['from_year_ad'], 'until_year_ad' : years_ad['until_year_ad'], 'cumulative_sums' : cumulative_sums, 'cumulative_missing_counts' : cumulative_missing_counts }
+
+    # Method generates a cumulative sum index file for a parameter and root interval NetCDF file: (year+1, month, lat, lon) sums of all preceding years
+    # Missing (NaN) values are summed as zero and counted within a cumulative missing value count file (generated only when missing values are present)
+    def generateCumulativeSumIndex(self, parameter, root_interval_str) :
+        index_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.cumulative_sum_index_file_postfix))
+        missing_count_file_path = path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+self.cumulative_missing_count_file_postfix))
+        rootgrp = self.openNetCdfDataFile(parameter, root_interval_str)
+        years_ad = self.getNetCdfDataFileYears(parameter, root_interval_str)
+        years = years_ad['until_year_ad'] - years_ad['from_year_ad'] + 1
+
+        # Check free disk space for the index file (and any missing value counts at half its size)
+        index_file_size = (years + 1)*12*self.grid_height*self.grid_width*8
+        free_disk_space = self.getFreeDiskSpace(self.climate_data_directory['path'])
+        if free_disk_space != None and free_disk_space < 1.5*index_file_size :
+            raise Exception('Insufficient disk space for cumulative sum index file: ' + index_file_path + ' (requires ' + str(int(ceil(1.5*index_file_size/1048576.0))) + 'MB)')
+
+        try :
+            cumulative_sums = np.lib.format.open_memmap(index_file_path+'.tmp', mode='w+', dtype='f8', shape=((years + 1), 12, self.grid_height, self.grid_width))
+            cumulative_missing_counts = None # created when the first missing value is found
+            cumulative_sum = np.zeros((12, self.grid_height, self.grid_width))
+            cumulative_missing_count = np.zeros((12, self.grid_height, self.grid_width), dtype='i4')
+            cumulative_sums[0] = cumulative_sum
+            for sub_interval_str, subgroup in rootgrp.groups.items() :
+                sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
+                for year_ad in range(sub_interval_ad['from_year_ad'], sub_interval_ad['until_year_ad']+1) :
+                    with netCdf_file_lock :
+                        cumulative_sums[year_ad - years_ad['from_year_ad'] + 1] = subgroup.variables[self.convertAdYearToDataLabel(year_ad)][:,:,:]
+            for y in range(years) :
+                year_grids = np.array(cumulative_sums[y+1])
+                missing = np.isnan(year_grids)
+                if missing.any() :
+                    if cumulative_missing_counts is None : # zero filled (including previous years)
+                        cumulative_missing_counts = np.lib.format.open_memmap(missing_count_file_path+'.tmp', mode='w+', dtype='i4', shape=cumulative_sums.shape)
+                    year_grids[missing] = 0.0
+                    cumulative_missing_count += missing
+                cumulative_sum += year_grids
+                cumulative_sums[y+1] = cumulative_sum
+                if cumulative_missing_counts is not None :
+                    cumulative_missing_counts[y+1] = cumulative_missing_count
+            cumulative_sums.flush()
+            del cumulative_sums
+            if path.exists(index_file_path) :
+                remove(index_file_path)
+            rename(index_file_path+'.tmp', index_file_path)
+            if path.exists(missing_count_file_path) :
+                remove(missing_count_file_path)
+            if cumulative_missing_counts is not None :
+                cumulative_missing_counts.flush()
+                del cumulative_missing_counts
+                rename(missing_count_file_path+'.tmp', missing_count_file_path)
+        except Exception, e :
+            for file_path in [index_file_path+'.tmp', missing_count_file_path+'.tmp'] :
+                if path.exists(file_path) :
+                    remove(file_path)
+            exception_message = 'Could not generate cumulative sum index file: ' + index_file_path + '\n' + str(e)
+            raise Exception(exception_message)
+        return index_file_path
+
+    # Method gets the free disk space (bytes) for a directory (None when not available)
+    def getFreeDiskSpace(self, directory_path) :
+        try :
+            if hasattr(os, 'statvfs') :
+                file_system = os.statvfs(directory_path)
+                return file_system.f_bavail*file_system.f_frsize
+            else : # Windows
+                free_bytes = ctypes.c_ulonglong(0)
+                if ctypes.windll.kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(unicode(directory_path)), None, None, ctypes.pointer(free_bytes)) :
+                    return free_bytes.value
+        except Exception, e :
+            pass
+        return None
+
+    # Method gets the years covered by the subgroups of a NetCDF data file for a parameter and root interval
+    def getNetCdfDataFileYears(self, parameter, root_interval_str) :
+        rootgrp = self.openNetCdfDataFile(parameter, root_interval_str)
+        sub_intervals_ad = [self.convertDataIntervalLabelToAD(sub_interval_str) for sub_interval_str in rootgrp.groups.keys()]
+        return { 'from_year_ad' : min([sub_interval_ad['from_year_ad'] for sub_interval_ad in sub_intervals_ad]),
+                 'until_year_ad' : max([sub_interval_ad['until_year_ad'] for sub_interval_ad in sub_intervals_ad]) }
+
+    # Method closes any open cumulative sum index files
+    def closeCumulativeSumIndices(self) :
+        self.cached_cumulative_sum_indices = {}
+
+    # Method corrects the bias of climate data grids for the selected months (month axis last before lat, lon)
+    def correctClimateDataBias(self, parameter, climate_data_grids, month_indices) :
+        calculation_values = { 'climate_data_grids' : climate_data_grids, 'bias_correction_data_grids' : self.loadBiasCorrectionDataGrids(parameter, month_indices) }
+        if self.pre_bias_correction_bounds.has_key(parameter) :
+            for data_grids, bounds in self.pre_bias_correction_bounds[parameter].items() :
+                for bound_type, bound_value in bounds.items() :
+                    calculation_values[data_grids] = self.applyBoundToDataGrid(calculation_values[data_grids], bound_type, bound_value)
+        return self.compileExpression(self.bias_correction_calculation[parameter]).evaluate(calculation_values)
+
     # Method applies a bound to a data grid
     def applyBoundToDataGrid(self, data_grids, bound_type, bound_value) :
         if bound_type == 'lower' :
@@ -826,7 +1517,7 @@ class PaleoclimateToolDataFileHelper :
         year_str = str(year) + postfix
 
         # Original code handles individual local or networked raw files
-        if (self.climate_data_source == 'local' and not self.use_netCdf_data) or self.climate_data_source == 'url' :
+        if (self.climate_data_source == 'local' and not self.use_netCdf_data and not self.use_mmap_data) or self.climate_data_source == 'url' :
             if self.parameter_directory_code_map.has_key(parameter) :
                 data_file = self.climate_data_file_template.replace('{parameter_directory_code}', self.parameter_directory_code_map[parameter])
                 data_file = data_file.replace('{year}', str(year))
@@ -852,90 +1543,51 @@ class PaleoclimateToolDataFileHelper :
             else :
                 raise Exception('The data location for ' + parameter.replace('_', ' ').title() + ' has not been defined yet')
 
+        # Utilise local memory mapped data files when selected
+        elif (self.climate_data_source == 'local' and self.use_mmap_data) :
+            for root_interval_str in self.current_mmap_data_intervals[parameter] :
+                mmap_data = self.openMmapDataFile(parameter, root_interval_str)
+                if mmap_data['from_year_ad'] <= year_ad <= mmap_data['until_year_ad'] :
+                    return mmap_data['data'][(year_ad - mmap_data['from_year_ad']), month_index].astype(float)
+            raise Exception('Could not find memory mapped data for '+ parameter.replace('_', ' ').title() + ' data for ' + self.month_names[month_index] + ' ' + str(year) + postfix + '.\n')
+
         # Utilise local NetCDF files when present
         elif (self.climate_data_source == 'local' and self.use_netCdf_data) :
 
-            # Check NetCDF cache for data first
-            if self.cached_netCdf_data.has_key(parameter) :
+            # Check climate data cache for year grids first
+            year_grids = self.climate_data_cache.getYearGrids(parameter, year_ad)
+            if year_grids is not None :
+                return year_grids[month_index]
 
-                # Check cached year grids
-                if self.cached_netCdf_data[parameter]['year_grids'].has_key(year_ad) :
-                    return self.cached_netCdf_data[parameter]['year_grids'][year_ad][month_index]
-
-                # Get root group DataSet object
+            # Check current subgroup of cached NetCDF file
+            if self.cached_netCdf_data.has_key(parameter) :
                 rootgrp = self.cached_netCdf_data[parameter]['rootgrp']
-
-                # Avoid memory limit (2GB)
-                if self.cached_netCdf_data[parameter]['call_count'] <= 800/(len(self.cached_netCdf_data.keys())) :
-
-                    # Check current subgroup
-                    sub_interval_ad = self.convertDataIntervalLabelToAD(self.cached_netCdf_data[parameter]['sub_interval_str'])
-                    if sub_interval_ad['from_year_ad'] <= year_ad <= sub_interval_ad['until_year_ad'] :
-                        try :
-                            subgroup = rootgrp.groups[self.cached_netCdf_data[parameter]['sub_interval_str']]
-                            self.cached_netCdf_data[parameter]['year_grids'][year_ad] = subgroup.variables[year_str][:,:,:]
-                            self.cached_netCdf_data[parameter]['year_keys'].append(year_ad)
-                            if (len(self.cached_netCdf_data[parameter]['year_grids']) > self.cached_netCdf_size) :
-                                self.cached_netCdf_data[parameter]['year_grids'].pop(self.cached_netCdf_data[parameter]['year_keys'].pop(0))
-                            self.cached_netCdf_data[parameter]['call_count'] = self.cached_netCdf_data[parameter]['call_count'] + 1
-                            return self.cached_netCdf_data[parameter]['year_grids'][year_ad][month_index]
-                        except :
-                            #print 'error 1'
-                            ignore = None # re-open netCDF file (as below)
-
-                    # Check current rootgrp
-                    for sub_interval_str in rootgrp.groups.keys() :
-                        sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
-                        if sub_interval_ad['from_year_ad'] <= year_ad <= sub_interval_ad['until_year_ad'] :
-                            self.cached_netCdf_data[parameter]['sub_interval_str'] = sub_interval_str
-                            try :
-                                self.cached_netCdf_data[parameter]['year_grids'][year_ad] = rootgrp.groups[sub_interval_str].variables[year_str][:,:,:]
-                                self.cached_netCdf_data[parameter]['year_keys'].append(year_ad)
-                                if (len(self.cached_netCdf_data[parameter]['year_grids']) > self.cached_netCdf_size) :
-                                    self.cached_netCdf_data[parameter]['year_grids'].pop(self.cached_netCdf_data[parameter]['year_keys'].pop(0))
-                                self.cached_netCdf_data[parameter]['call_count'] = self.cached_netCdf_data[parameter]['call_count'] + 1
-                                return self.cached_netCdf_data[parameter]['year_grids'][year_ad][month_index]
-                            except :
-                                #print 'error 2'
-                                ignore = None # re-open netCDF file (as below)
-
-                # Count reset, not found, or fail - clear cache for parameter
-                # print 'count', self.cached_netCdf_data[parameter]['call_count']
-                rootgrp.close()
-                year_grids_copy = self.cached_netCdf_data[parameter]['year_grids']#.copy()
-                year_keys = self.cached_netCdf_data[parameter]['year_keys']
-                self.cached_netCdf_data.pop(parameter)
-                self.cached_netCdf_data[parameter] = { 'year_grids' : year_grids_copy, 'year_keys' : year_keys, 'call_count' : 0 }
-
-            # Check available NetCDF data files
+                sub_interval_ad = self.convertDataIntervalLabelToAD(self.cached_netCdf_data[parameter]['sub_interval_str'])
+                if sub_interval_ad['from_year_ad'] <= year_ad <= sub_interval_ad['until_year_ad'] :
+                    with netCdf_file_lock :
+                        year_grids = rootgrp.groups[self.cached_netCdf_data[parameter]['sub_interval_str']].variables[year_str][:,:,:]
+                    self.climate_data_cache.addYearGrids(parameter, year_ad, year_grids)
+                    return year_grids[month_index]
+
+            # Check available NetCDF data files (opening when not cached)
             for root_interval_str in self.current_netCdf_data_intervals[parameter] :
                 root_interval_ad = self.convertDataIntervalLabelToAD(root_interval_str)
                 root_from_year_ad = max((root_interval_ad['from_year_ad'] - self.download_data_window), (1950 - 22000))
                 root_until_year_ad = min((root_interval_ad['until_year_ad'] + self.download_data_window), 1989)
                 if root_from_year_ad <= year_ad <= root_until_year_ad :
-                    try :
-                        rootgrp = Dataset(path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc')), 'r')
-                        for sub_interval_str in rootgrp.groups.keys() :
-                            sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
-                            if sub_interval_ad['from_year_ad'] <= year_ad <= sub_interval_ad['until_year_ad'] :
-                                if self.cached_netCdf_data.has_key(parameter) :
-                                    self.cached_netCdf_data[parameter]['rootgrp'] = rootgrp
-                                    self.cached_netCdf_data[parameter]['root_interval_str'] = root_interval_str
-                                    self.cached_netCdf_data[parameter]['sub_interval_str'] = sub_interval_str
-                                    self.cached_netCdf_data[parameter]['year_grids'][year_ad] = rootgrp.groups[sub_interval_str].variables[year_str][:,:,:]
-                                    self.cached_netCdf_data[parameter]['year_keys'].append(year_ad)
-                                    if (len(self.cached_netCdf_data[parameter]['year_grids']) > self.cached_netCdf_size) :
-                                        self.cached_netCdf_data[parameter]['year_grids'].pop(self.cached_netCdf_data[parameter]['year_keys'].pop(0))
-                                else :
-                                    self.cached_netCdf_data[parameter] = { 'rootgrp' : rootgrp, 'root_interval_str' : root_interval_str, 'sub_interval_str' : sub_interval_str,
-                                                                           'year_grids' : {year_ad : rootgrp.groups[sub_interval_str].variables[year_str][:,:,:]},
-                                                                           'year_keys' : [year_ad], 'call_count' : 0 }
-                                return self.cached_netCdf_data[parameter]['year_grids'][year_ad][month_index]
-                    except Exception, e :
-                        exception_message = 'Could not open NetCDF data file: ' + path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc')) + '\n' + str(e)
-                        raise Exception(exception_message)
-
-            # Still not found
+                    rootgrp = self.openNetCdfDataFile(parameter, root_interval_str)
+                    for sub_interval_str in rootgrp.groups.keys() :
+                        sub_interval_ad = self.convertDataIntervalLabelToAD(sub_interval_str)
+                        if sub_interval_ad['from_year_ad'] <= year_ad <= sub_interval_ad['until_year_ad'] :
+                            self.cached_netCdf_data[parameter]['sub_interval_str'] = sub_interval_str
+                            try :
+                                with netCdf_file_lock :
+                                    year_grids = rootgrp.groups[sub_interval_str].variables[year_str][:,:,:]
+                            except Exception, e :
+                                exception_message = 'Could not read NetCDF data file: ' + path.join(self.climate_data_directory['path'], (parameter+'-'+root_interval_str+'.nc')) + '\n' + str(e)
+                                raise Exception(exception_message)
+                            self.climate_data_cache.addYearGrids(parameter, year_ad, year_grids)
+                            return year_grids[month_index]
             raise Exception('Could not find NetCDF data for '+ parameter.replace('_', ' ').title() + ' data for ' + self.month_names[month_index] + ' ' + str(year) + postfix + '.\n')
 
     # Method loads bias correction data for the selected months
@@ -1023,98 +1675,122 @@ class PaleoclimateToolDataFileHelper :
         return delta_data
 
     # Method calculates grid region statistics
+    # Grid data (list or (N, lat, lon) stack) is grouped by region mask and the statistics for each group are calculated in single array operations
     def calculateGridRegionStatistics(self, grid_data_list, region_mask_list) :
         grid_statistics = { 'minimum' : [], 'percentile_5th' : [], 'percentile_25th' : [], 'percentile_50th' : [], 'percentile_75th' : [], 'percentile_95th' : [], 'maximum' : [],
                             'grid_mean' : [], 'grid_stdev' : [], 'area_mean' : [], 'area_stdev' : [] }
-        for i, grid_data in enumerate(grid_data_list) :
-            finite_grid_data = np.ma.masked_array(grid_data, mask=((np.isfinite(grid_data) - 1)*-1))
-            region_data = finite_grid_data[region_mask_list[i].nonzero()]
-            grid_statistics['minimum'].append(region_data.min())
-            grid_statistics['percentile_5th'].append(np.percentile(region_data, 5))
-            grid_statistics['percentile_25th'].append(np.percentile(region_data, 25))
-            grid_statistics['percentile_50th'].append(np.percentile(region_data, 50))
-            grid_statistics['percentile_75th'].append(np.percentile(region_data, 75))
-            grid_statistics['percentile_95th'].append(np.percentile(region_data, 95))
-            grid_statistics['maximum'].append(region_data.max())
-            grid_statistics['grid_mean'].append(region_data.mean())
-            grid_statistics['grid_stdev'].append(region_data.std())
-            area_weighted_region_mask = region_mask_list[i] * np.meshgrid(np.ones(144), np.cos(np.arange(88.75,-88.751,-2.5)*np.pi/180.0))[1]
-            area_mean = (finite_grid_data*area_weighted_region_mask).sum()/area_weighted_region_mask.sum()
-            grid_statistics['area_mean'].append(area_mean)
-            grid_statistics['area_stdev'].append(np.sqrt(((area_mean-finite_grid_data)**2*area_weighted_region_mask).sum()/area_weighted_region_mask.sum()))
+        grid_data_stack = np.asarray(grid_data_list)
+        if not len(grid_data_stack) :
+            return grid_statistics
+
+        # Group grids by their region mask (masks are usually repeated objects)
+        region_mask_groups = {} # { mask key : [grid indices] }
+        region_masks = {} # { mask key : mask }
+        region_mask_keys = {} # { mask object id : mask key }
+        region_mask_list = list(region_mask_list) # retains any stack views so their ids are not reused
+        for i, region_mask in enumerate(region_mask_list) :
+            if not region_mask_keys.has_key(id(region_mask)) :
+                region_mask_keys[id(region_mask)] = np.asarray(region_mask).tobytes()
+            mask_key = region_mask_keys[id(region_mask)]
+            if not region_mask_groups.has_key(mask_key) :
+                region_mask_groups[mask_key] = []
+                region_masks[mask_key] = np.asarray(region_mask)
+            region_mask_groups[mask_key].append(i)
+
+        # Calculate statistics for each group: region data (grids, region cells) with non-finite values masked
+        statistic_values = dict([(key, np.zeros(len(grid_data_stack))) for key in grid_statistics.keys()])
+        percentile_keys = self.grid_region_statistic_percentiles.keys()
+        percentiles = [self.grid_region_statistic_percentiles[key] for key in percentile_keys]
+        for mask_key, grid_indices in region_mask_groups.items() :
+            region_cells = region_masks[mask_key].nonzero()
+            region_data = grid_data_stack[grid_indices][:, region_cells[0], region_cells[1]]
+            finite_region_data = np.ma.masked_invalid(region_data)
+            region_percentiles = np.percentile(region_data, percentiles, axis=1)
+            for j, key in enumerate(percentile_keys) :
+                statistic_values[key][grid_indices] = region_percentiles[j]
+            statistic_values['minimum'][grid_indices] = finite_region_data.min(axis=1).filled(np.nan)
+            statistic_values['maximum'][grid_indices] = finite_region_data.max(axis=1).filled(np.nan)
+            statistic_values['grid_mean'][grid_indices] = finite_region_data.mean(axis=1).filled(np.nan)
+            statistic_values['grid_stdev'][grid_indices] = finite_region_data.std(axis=1).filled(np.nan)
+            area_weights = region_masks[mask_key][region_cells]*self.grid_area_weights[region_cells]
+            area_mean = (finite_region_data*area_weights).sum(axis=1).filled(0)/area_weights.sum()
+            statistic_values['area_mean'][grid_indices] = area_mean
+            area_deviations = area_mean.reshape(-1,1) - finite_region_data
+            statistic_values['area_stdev'][grid_indices] = np.sqrt((area_deviations*area_deviations*area_weights).sum(axis=1).filled(0)/area_weights.sum())
+        for key in grid_statistics.keys() :
+            grid_statistics[key] = list(statistic_values[key])
         return grid_statistics
 
     # Method generates a grid data file
     def generateGridDataFile(self, masked_data, file_type, year_label, year_ad=None, description=None, filename=None, times=None, data_units=None, grid=None) :
         masked_data[((np.isfinite(masked_data)-1)*-1).nonzero()] = np.nan
-        data_frame = pd.DataFrame(masked_data)
         if file_type == 'csv' :
             output_file_path = path.join(self.file_generation_directory['path'], ('grid_data_'+year_label+'.csv'))
-            data_frame.to_csv(output_file_path, header=False, index=False, na_rep='-9999', float_format='%.3f')
+            f = open(output_file_path, 'w')
+            f.write(self.formatGridDataText(masked_data, ','))
+            f.close()
         elif file_type == 'ascii' :
             output_file_path = path.join(self.file_generation_directory['path'], ('grid_data_'+year_label+'.txt'))
             f = open(output_file_path, 'w')
-            f.write(data_frame.to_string(header=False, index=False, na_rep='-9999', float_format=(lambda f: '%.3f'%f)).replace('  nan','-9999'))
+            f.write(self.formatGridDataText(masked_data, ' ', justified=True))
             f.close()
         elif file_type == 'esri_ascii' :
             header = 'ncols 144\n' + 'nrows 72\n' + 'xllcorner -180\n' + 'yllcorner -90\n' + 'cellsize 2.5\n' + 'nodata_value -9999\n'
-            string_buffer = StringIO()
-            data_frame.to_csv(string_buffer, sep=' ', header=False, index=False, na_rep='-9999', float_format='%.3f')
             output_file_path = path.join(self.file_generation_directory['path'], ('grid_data_'+year_label+'.asc'))
             f = open(output_file_path, 'w')
             f.write(header)
-            f.write(string_buffer.getvalue())
+            f.write(self.formatGridDataText(masked_data, ' '))
             f.close()
-        elif file_type == 'netcdf' :
+        elif file_type == 'netcdf' : # streamed into a single file for all grids (the writer remains open until closed after the last grid)
+            output_file_path = path.join(self.file_generation_directory['path'], (filename+'.nc'))
             if grid == 'first' :
-                output_file_path = path.join(self.file_generation_directory['path'], (filename+'.nc'))
-                rootgrp = Dataset(output_file_path, 'w')
-                rootgrp.Conventions = 'CF-1.7'
-                rootgrp.title = str(filename)
-                rootgrp.institution = 'Global Ecology Lab'
-                rootgrp.source = 'https://github.com/GlobalEcologyLab/PaleoView'
-                rootgrp.history = '[' + strftime("%Y-%m-%d %H:%M", localtime()) + ']' + 'Created netCDF4 zlib=True dataset.'
-                rootgrp.description = str(description)
-                rootgrp.createDimension('time', len(times))
-                rootgrp.createDimension('lat', 72)
-                rootgrp.createDimension('lon', 144)
-                time = rootgrp.createVariable('time','i4',('time',))
-                time.units = '- years BP' # 'years since 1950-1-1' shifts out of sync over time
-                time.calendar = 'noleap'
-                time.axis = 'T'
-                time.long_name = 'time'
-                time.standard_name = 'time'
-                time[:] = times
-                latitude = rootgrp.createVariable('lat','f8',('lat',), zlib=True)
-                latitude.units = 'degrees_north'
-                latitude.axis = 'Y'
-                latitude.long_name = 'latitude'
-                latitude.standard_name = 'latitude'
-                latitude[:] = np.arange(88.75,-88.751,-2.5)
-                longitude = rootgrp.createVariable('lon','f8',('lon',), zlib=True)
-                longitude.units = 'degrees_east'
-                longitude.axis = 'X'            
-                longitude.long_name = 'longitude'
-                longitude.standard_name = 'longitude'
-                longitude[:] = np.arange(-178.75,178.751,2.5)
-                data = rootgrp.createVariable(filename,'f8',('time','lat','lon'), zlib=True, least_significant_digit=7)
-                data.coordinates = 'time lat lon'
-                data.units = data_units
-                data.long_name = filename.replace('_',' ').title()
-                rootgrp.close()
-                self.netCdf_writing_cache = { 'times_array': [], 'data_array' : [], 'count' : 0 }
-            self.netCdf_writing_cache['times_array'].append(times.index(year_ad-1950))
-            self.netCdf_writing_cache['data_array'].append(masked_data)
-            self.netCdf_writing_cache['count'] += 1
-            if self.netCdf_writing_cache['count'] > 500 or grid == 'last' : # optimize?
-                output_file_path = path.join(self.file_generation_directory['path'], (filename+'.nc'))
-                rootgrp = Dataset(output_file_path, 'a')
-                rootgrp.variables[filename][self.netCdf_writing_cache['times_array'],:,:] = np.array(self.netCdf_writing_cache['data_array'])
-                rootgrp.close()
-                self.netCdf_writing_cache = { 'times_array': [], 'data_array' : [], 'count' : 0 }
+                self.closeGridDataFileWriter()
+                self.grid_data_file_writer = PaleoclimateToolNetCdfGridWriter(output_file_path, filename, times, description=description, data_units=data_units)
+            elif self.grid_data_file_writer == None : # continue writing to the existing file
+                if not path.exists(output_file_path) :
+                    raise Exception('NetCDF file ' + filename + '.nc has not been created (the first grid was not generated)')
+                self.grid_data_file_writer = PaleoclimateToolNetCdfGridWriter(output_file_path, filename, times, append=True)
+            self.grid_data_file_writer.writeGrid(masked_data, year_ad-1950)
+            if grid == 'last' or self.grid_data_file_writer.allGridsWritten() :
+                self.closeGridDataFileWriter()
+        elif file_type == 'geotiff' : # streamed into a single file with a band for each grid (the writer remains open until closed after the last grid)
+            if grid == 'first' :
+                self.closeGridDataFileWriter()
+                output_file_path = path.join(self.file_generation_directory['path'], (filename+'.tif'))
+                self.grid_data_file_writer = PaleoclimateToolGeoTiffGridWriter(output_file_path, times, description=description, data_units=data_units)
+            elif self.grid_data_file_writer == None : # closed GeoTIFF files cannot be appended to
+                raise Exception('GeoTIFF file ' + filename + '.tif is not open for writing (the first grid was not generated or the file was closed)')
+            self.grid_data_file_writer.writeGrid(masked_data, year_ad-1950, band_label=year_label)
+            if grid == 'last' or self.grid_data_file_writer.allGridsWritten() :
+                self.closeGridDataFileWriter()
+
+    # Method formats grid data as text rows of values with 3 decimal places and -9999 for no data (masked or non-finite values)
+    # The whole grid is formatted via a single format string. Justified columns (ASCII tables) are right justified to their widest value (without a final newline)
+    def formatGridDataText(self, masked_data, delimiter, justified=False) :
+        grid_values = np.ma.masked_invalid(masked_data)
+        rows, cols = grid_values.shape
+        if justified :
+            column_formats = []
+            for column_minimum, column_maximum, column_has_no_data in zip(grid_values.min(axis=0), grid_values.max(axis=0), np.ma.getmaskarray(grid_values).any(axis=0)) :
+                width = 5*int(column_has_no_data)
+                if column_minimum is not np.ma.masked :
+                    width = max(width, len('%.3f' % column_minimum), len('%.3f' % column_maximum))
+                column_formats.append('%' + str(width) + '.3f')
+            grid_format = '\n'.join([delimiter.join(column_formats)]*rows)
+            return (grid_format % tuple(grid_values.filled(np.nan).ravel())).replace('  nan', '-9999')
+        else :
+            grid_format = (delimiter.join(['%.3f']*cols) + '\n')*rows
+            return (grid_format % tuple(grid_values.filled(np.nan).ravel())).replace('nan', '-9999')
+
+    # Method closes the NetCDF or GeoTIFF grid data file writer when open (explicitly, once grid generation has finished)
+    def closeGridDataFileWriter(self) :
+        if self.grid_data_file_writer != None :
+            self.grid_data_file_writer.close()
+            self.grid_data_file_writer = None
 
     # Method generates a series data file
-    def generateSeriesDataFile(self, data_frame, file_type, month='', description=None, data_units=None) :
+    # Parquet series are appended to a dataset (partitioned by the partition key value pairs) when a dataset path is provided
+    def generateSeriesDataFile(self, data_frame, file_type, month='', description=None, data_units=None, dataset_path=None, partition=[]) :
         if month :
             month = '_' + month
         if file_type == 'csv' :
@@ -1145,6 +1821,44 @@ class PaleoclimateToolDataFileHelper :
                     variables[key].units = str(data_units)
                 variables[key][:] = data_frame[key].as_matrix()
             rootgrp.close()
+        elif file_type in ['parquet', 'feather'] : # typed columnar files (requires pandas 0.24 and pyarrow)
+            self.checkColumnarSeriesDataFileRequirements()
+            columnar_data_frame = self.createColumnarSeriesDataFrame(data_frame, description=description, data_units=data_units)
+            if file_type == 'parquet' and dataset_path :
+                for key, value in partition :
+                    columnar_data_frame[key] = str(value)
+                columnar_data_frame.to_parquet(dataset_path, engine='pyarrow', index=False, partition_cols=[key for key, value in partition])
+            elif file_type == 'parquet' :
+                output_file_path = path.join(self.file_generation_directory['path'], ('series_data'+month+'.parquet'))
+                columnar_data_frame.to_parquet(output_file_path, engine='pyarrow', index=False)
+            else :
+                output_file_path = path.join(self.file_generation_directory['path'], ('series_data'+month+'.feather'))
+                columnar_data_frame.to_feather(output_file_path)
+
+    # Method checks that the modules required for Parquet and Feather series data files are installed: pandas 0.24 or later (partitioned datasets) and pyarrow
+    def checkColumnarSeriesDataFileRequirements(self) :
+        if [int(version) for version in re.findall(r'\d+', pd.__version__)[:2]] < [0, 24] :
+            raise Exception('Parquet and Feather series data files require pandas 0.24 or later (pandas ' + pd.__version__ + ' is installed)')
+        if not pyarrow :
+            raise Exception('Parquet and Feather series data files require the pyarrow module')
+
+    # Method creates a columnar series data frame with typed columns: integer years BP and AD, the (float) series values, then the description and units (when provided)
+    def createColumnarSeriesDataFrame(self, data_frame, description=None, data_units=None) :
+        year_column = data_frame.columns[0]
+        if year_column == 'Year (BP)' :
+            years_ad = 1950 - np.array(data_frame[year_column], dtype=np.int64)
+        elif year_column == 'Year (AD)' :
+            years_ad = np.array(data_frame[year_column], dtype=np.int64)
+        else : # year labels (eg. 100BP or 1989AD)
+            years_ad = np.array([self.convertDataLabelToAdYear(year_label) for year_label in data_frame[year_column]], dtype=np.int64)
+        columnar_data_frame = pd.DataFrame({ 'Year (BP)' : (1950 - years_ad), 'Year (AD)' : years_ad })[['Year (BP)', 'Year (AD)']]
+        for column in data_frame.columns[1:] :
+            columnar_data_frame[column] = np.array(data_frame[column], dtype=np.float64)
+        if description != None :
+            columnar_data_frame['Description'] = str(description)
+        if data_units != None :
+            columnar_data_frame['Units'] = str(data_units)
+        return columnar_data_frame
 
     # Method generates a log entry time-stamp
     def generateLogEntryTimestamp(self) :
@@ -1210,7 +1924,19 @@ class PaleoclimateToolDataFileHelper :
                     self.current_netCdf_data_intervals[parameter].append(data_interval_str)
                     self.use_netCdf_data = True
         return self.current_netCdf_data_intervals
-                
+
+    # Get current memory mapped data file availability (including NetCDF files that can be converted)
+    def getCurrentMmapDataIntervals(self) :
+        self.current_mmap_data_intervals = {}
+        for parameter in self.parameter_directory_code_map.keys() :
+            self.current_mmap_data_intervals[parameter] = []
+            for data_interval_str in self.climate_data_download_intervals :
+                expected_mmap_file = (parameter+'-'+data_interval_str+self.mmap_data_file_postfix)
+                expected_netCdf_file = (parameter+'-'+data_interval_str+'.nc')
+                if path.exists(path.join(self.climate_data_directory['path'], expected_mmap_file)) or path.exists(path.join(self.climate_data_directory['path'], expected_netCdf_file)) :
+                    self.current_mmap_data_intervals[parameter].append(data_interval_str)
+        return self.current_mmap_data_intervals
+
     # Convert data interval label to AD year interval
     def convertDataIntervalLabelToAD(self, interval_label) :
         from_year = int(interval_label.split('-')[0][:-2])
@@ -1237,6 +1963,21 @@ class PaleoclimateToolDataFileHelper :
             until_year_str = str(1950 - until_year_ad) + 'BP'
         return from_year_str + '-' + until_year_str
 
+    # Convert AD year to data label
+    def convertAdYearToDataLabel(self, year_ad) :
+        if year_ad > 1950 :
+            return str(year_ad) + 'AD'
+        else :
+            return str(1950 - year_ad) + 'BP'
+
+    # Convert data label to AD year
+    def convertDataLabelToAdYear(self, year_label) :
+        year = int(str(year_label)[:-2])
+        if str(year_label)[-2:] == 'BP' :
+            return 1950 - year
+        else :
+            return year
+
     # Method generates a NetCDF file for a climate data parameter for the specified interval 
     def generateNetCdfClimateData(self, parameter, from_year_ad, until_year_ad, min_year_ad=(1950-22000),
                                   max_year_ad=1989, zlib=True, decimals=None, correction_factor=1) :
@@ -1372,6 +2113,24 @@ class PaleoclimateToolDataFileHelper :
         interval = self.convertDataIntervalLabelToAD(interval_label)
         self.downloadClimateData(parameter, interval['from_year_ad'], interval['until_year_ad'], delimiter=delimiter, retain_netCdf_file=retain_netCdf_file, unpack=unpack)
 
+    # Method downloads NetCDF files for climate data parameter intervals (parameter, interval label pairs) concurrently: returns the errors for failed downloads
+    def downloadClimateDataIntervals(self, parameter_intervals) :
+
+        # Setup proxy for web-based climate data when required
+        self.setupClimateDataProxy()
+
+        # Download NetCDF files (resuming partial files)
+        downloads = []
+        for parameter, interval_label in parameter_intervals :
+            netCdf_file = (parameter+'-'+interval_label+'.nc')
+            downloads.append({ 'url' : (self.climate_data_url + netCdf_file), 'path' : path.join(self.climate_data_directory['path'], netCdf_file) })
+        download_results = self.download_manager.downloadFiles(downloads, progress_function=self.netCdfDownloadProgress, waiting_function=self.progress_reporter.refresh)
+        download_errors = []
+        for download_result in download_results :
+            if download_result['error'] :
+                download_errors.append('Could not open ' + path.basename(download_result['path']) + '\nExpected climate data NetCDF file at: \n' + self.climate_data_url + '\n' + download_result['error'])
+        return download_errors
+
     # Method downloads and unpacks a NetCDF file for a climate data parameter for the specified interval 
     def downloadClimateData(self, parameter, from_year_ad, until_year_ad, delimiter='', retain_netCdf_file=True, unpack=False) :
 
@@ -1379,18 +2138,11 @@ class PaleoclimateToolDataFileHelper :
         data_interval_str = self.convertAdIntervalToDataLabel(from_year_ad, until_year_ad)
         netCdf_file = (parameter+'-'+data_interval_str+'.nc')
 
-        # Setup proxy for web-based climate data when required
-        self.setupClimateDataProxy()
-
         # Download NetCDF file
         local_netCdf_path = path.join(self.climate_data_directory['path'], netCdf_file)
-        try :
-            #check_connection = url.urlopen((self.climate_data_url + netCdf_file))
-            #check_connection.close()
-            urllib.urlretrieve((self.climate_data_url + netCdf_file), local_netCdf_path, reporthook=self.netCdfDownloadProgress)
-        except Exception, e :
-            exception_message = 'Could not open ' + netCdf_file + '\nExpected climate data NetCDF file at: \n' + self.climate_data_url + '\n' + str(e)
-            raise Exception(exception_message)
+        download_errors = self.downloadClimateDataIntervals([(parameter, data_interval_str)])
+        if download_errors :
+            raise Exception(download_errors[0])
        
         # Unpack climate data files from NetCDF dataset file
         if unpack :
@@ -1417,17 +2169,20 @@ class PaleoclimateToolDataFileHelper :
         if not retain_netCdf_file :
             remove(local_netCdf_path)
 
-    # Method tracks download progress and updates status bar
-    def netCdfDownloadProgress(self, count, block_size, total_size) :
+    # Method tracks download progress (fractions of files) via the progress reporter (called from the download threads, so refreshed whilst waiting)
+    def netCdfDownloadProgress(self, fraction) :
+        self.progress_reporter.addProgress('download', fraction, refresh=False)
 
-        if self.application_gui != None :
+## Worker process functions: each worker process holds its own helper (and NetCDF files) when generating parameter data
 
-            self.application_gui.update() # .update_idletasks()
+worker_data_file_helper = None
 
-            # Set status maximum if not already set
-            if self.application_gui.climate_data_download_status_bar['maximum'] == 1 :
-                self.application_gui.climate_data_download_status_bar['maximum'] = total_size/block_size/100
+# Initialise the worker process helper with the settings of the parent helper
+def initialiseWorkerDataFileHelper(settings) :
+    global worker_data_file_helper
+    worker_data_file_helper = PaleoclimateToolDataFileHelper()
+    worker_data_file_helper.applyHelperSettings(settings)
 
-            # Set status value every 100 blocks
-            if not count % 100 :
-                self.application_gui.climate_data_download_status_bar['value'] += 1
+# Generate parameter data within a worker process
+def generateWorkerParameterData(generation_arguments) :
+    return worker_data_file_helper.generateParameterData(**generation_arguments)
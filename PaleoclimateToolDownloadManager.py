@@ -0,0 +1,158 @@
+# Python modules
+import hashlib
+import urllib2 as url
+from multiprocessing.pool import ThreadPool
+from os import path, remove, rename
+from time import sleep
+
+## Paleoclimate Tool Download Manager
+## * Downloads (climate data) files concurrently via a pool of threads
+## * Writes each download to a partial file (.part), which is resumed via HTTP Range requests after a dropped connection (or on the next run)
+## * Checks the downloaded size (Content-Length) and an optional MD5 checksum before renaming the partial file into place
+## * Reports progress as the fraction of each file downloaded. The calling thread waits for the downloads and calls a waiting function (eg. GUI refresh)
+class PaleoclimateToolDownloadManager :
+
+    # Initialise
+    def __init__(self, threads=4, block_size=65536, retries=3, retry_delay=1.0, timeout=60) :
+
+        # Concurrent downloads, transfer block size (bytes), and connection timeout (seconds)
+        self.threads = threads
+        self.block_size = block_size
+        self.timeout = timeout
+
+        # Failed transfers are retried (resuming the partial file) after a delay (seconds)
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+        # Partial file postfix
+        self.partial_file_postfix = '.part'
+
+    # Set the number of files downloaded concurrently
+    def setThreads(self, threads) :
+        self.threads = threads
+
+    # Method downloads files concurrently: downloads are { 'url' : url, 'path' : path, 'checksum' : MD5 (optional) }
+    # Returns results { 'url' : url, 'path' : path, 'error' : message or None } in the order of the downloads
+    def downloadFiles(self, downloads, progress_function=None, waiting_function=None, waiting_interval=0.05) :
+        if not downloads :
+            return []
+        pool = ThreadPool(max(1, min(self.threads, len(downloads))))
+        try :
+            async_results = [pool.apply_async(self.downloadFileResult, (download, progress_function)) for download in downloads]
+            pool.close()
+            for async_result in async_results :
+                while not async_result.ready() :
+                    async_result.wait(waiting_interval)
+                    if waiting_function != None :
+                        waiting_function()
+            results = [async_result.get() for async_result in async_results]
+        except Exception, e :
+            pool.terminate()
+            raise
+        pool.join()
+        return results
+
+    # Method downloads a file and returns the result (with the error message when the download fails)
+    def downloadFileResult(self, download, progress_function=None) :
+        result = { 'url' : download['url'], 'path' : download['path'], 'error' : None }
+        try :
+            self.downloadFile(download['url'], download['path'], checksum=download.get('checksum'), progress_function=progress_function)
+        except Exception, e :
+            result['error'] = str(e)
+        return result
+
+    # Method downloads a file (resuming a partial file when present), retrying failed transfers
+    # Progress function is passed the increase in the fraction of the file downloaded
+    def downloadFile(self, file_url, file_path, checksum=None, progress_function=None) :
+        progress = { 'fraction' : 0.0 }
+        def reportProgress(fraction) :
+            if progress_function != None and fraction > progress['fraction'] :
+                progress_function(fraction - progress['fraction'])
+                progress['fraction'] = fraction
+        attempt = 0
+        while True :
+            try :
+                self.transferFile(file_url, file_path, checksum, reportProgress)
+                reportProgress(1.0)
+                return file_path
+            except Exception, e :
+                if (isinstance(e, url.HTTPError) and e.code < 500) or attempt >= self.retries : # client errors (eg. file not found) are not retried
+                    raise
+                attempt += 1
+                sleep(self.retry_delay)
+
+    # Method transfers a file into its partial file (requesting the remaining range when partially downloaded), then completes the file
+    def transferFile(self, file_url, file_path, checksum, reportProgress) :
+
+        # Request the remaining content when partially downloaded
+        partial_file_path = file_path + self.partial_file_postfix
+        downloaded_size = 0
+        if path.exists(partial_file_path) :
+            downloaded_size = path.getsize(partial_file_path)
+        request = url.Request(file_url)
+        if downloaded_size :
+            request.add_header('Range', 'bytes=' + str(downloaded_size) + '-')
+        try :
+            response = url.urlopen(request, timeout=self.timeout)
+        except url.HTTPError, e :
+            if e.code == 416 and downloaded_size : # range not satisfiable: partial file is already complete or is not part of the file
+                if str(e.headers.get('Content-Range', '')).endswith('/' + str(downloaded_size)) :
+                    return self.completeFile(partial_file_path, file_path, downloaded_size, downloaded_size, checksum)
+                remove(partial_file_path)
+                raise Exception('Partial download of ' + file_url + ' did not match the file (restarted)')
+            raise
+
+        # Append the remaining content, or write the complete content (the range is ignored by some servers)
+        if response.getcode() == 206 and downloaded_size :
+            content_range = str(response.info().getheader('Content-Range', ''))
+            if not content_range.startswith('bytes ' + str(downloaded_size) + '-') :
+                response.close()
+                remove(partial_file_path)
+                raise Exception('Unexpected content range ' + content_range + ' for ' + file_url + ' (restarted)')
+            file_mode = 'ab'
+        else :
+            downloaded_size = 0
+            file_mode = 'wb'
+        file_size = None
+        if response.info().getheader('Content-Length') != None :
+            file_size = downloaded_size + int(response.info().getheader('Content-Length'))
+        partial_file = open(partial_file_path, file_mode)
+        try :
+            while True :
+                block = response.read(self.block_size)
+                if not block :
+                    break
+                partial_file.write(block)
+                downloaded_size += len(block)
+                if file_size :
+                    reportProgress(float(downloaded_size)/file_size)
+        finally :
+            partial_file.close()
+            response.close()
+
+        return self.completeFile(partial_file_path, file_path, downloaded_size, file_size, checksum)
+
+    # Method checks the partial file size and checksum (when known), then renames it into place
+    def completeFile(self, partial_file_path, file_path, downloaded_size, file_size, checksum) :
+        if file_size != None and downloaded_size != file_size : # partial file is retained and resumed
+            raise Exception('Incomplete download of ' + path.basename(file_path) + ' (' + str(downloaded_size) + ' of ' + str(file_size) + ' bytes)')
+        if checksum != None and self.calculateChecksum(partial_file_path) != checksum.lower() :
+            remove(partial_file_path)
+            raise Exception('Checksum of ' + path.basename(file_path) + ' does not match ' + checksum)
+        try :
+            rename(partial_file_path, file_path) # atomic replacement (POSIX)
+        except OSError :
+            remove(file_path) # existing files are not replaced on Windows
+            rename(partial_file_path, file_path)
+        return file_path
+
+    # Method calculates the MD5 checksum of a file
+    def calculateChecksum(self, file_path) :
+        md5 = hashlib.md5()
+        f = open(file_path, 'rb')
+        block = f.read(self.block_size)
+        while block :
+            md5.update(block)
+            block = f.read(self.block_size)
+        f.close()
+        return md5.hexdigest()
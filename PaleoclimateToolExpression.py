@@ -0,0 +1,128 @@
+# Python modules
+import ast
+
+# Python extension modules (requires extension installation)
+import numpy as np
+
+## Paleoclimate Tool Expression
+## * Compiles a calculation expression (parameter and bias correction calculations) once into a sequence of NumPy operations
+## * Supports variables, numbers, arithmetic (+ - * / **), single comparisons, unary signs and constant subscripts/slices
+## * Evaluates via ufuncs, writing into intermediate result arrays (out=) rather than allocating new temporaries
+## * Rejects any other syntax (calls, attributes, etc.) so calculations can be safely added via configuration
+class PaleoclimateToolExpression :
+
+    # Supported operator ufuncs
+    binary_operator_ufuncs = { ast.Add : np.add, ast.Sub : np.subtract, ast.Mult : np.multiply, ast.Div : np.divide, ast.Pow : np.power }
+    comparison_operator_ufuncs = { ast.Lt : np.less, ast.LtE : np.less_equal, ast.Gt : np.greater, ast.GtE : np.greater_equal,
+                                   ast.Eq : np.equal, ast.NotEq : np.not_equal }
+
+    # Initialise (compiles the expression)
+    def __init__(self, expression) :
+
+        # Expression string
+        self.expression = expression
+
+        # Variables referenced (in order of first appearance)
+        self.variables = []
+
+        # Compiled operations: (operation, operands, result register)
+        self.operations = []
+        self.registers = 0
+
+        # Compile the parsed expression into operations
+        try :
+            self.result_operand = self.compileNode(ast.parse(expression.strip(), mode='eval').body)
+        except SyntaxError, e :
+            raise Exception('Invalid calculation expression: ' + expression + '\n' + str(e))
+
+    # Method compiles an expression node into operations and returns its operand: ('variable', name), ('constant', value) or ('register', index)
+    def compileNode(self, node) :
+        if isinstance(node, ast.Name) :
+            if node.id not in self.variables :
+                self.variables.append(node.id)
+            return ('variable', node.id)
+        elif isinstance(node, ast.Num) :
+            return ('constant', node.n)
+        elif isinstance(node, ast.BinOp) and self.binary_operator_ufuncs.has_key(type(node.op)) :
+            return self.addOperation('ufunc', self.binary_operator_ufuncs[type(node.op)], self.compileNode(node.left), self.compileNode(node.right))
+        elif isinstance(node, ast.Compare) and len(node.ops) == 1 and self.comparison_operator_ufuncs.has_key(type(node.ops[0])) :
+            return self.addOperation('ufunc', self.comparison_operator_ufuncs[type(node.ops[0])], self.compileNode(node.left), self.compileNode(node.comparators[0]))
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd) :
+            return self.compileNode(node.operand)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) :
+            return self.addOperation('ufunc', np.negative, self.compileNode(node.operand))
+        elif isinstance(node, ast.Subscript) :
+            return self.addOperation('subscript', self.compileSubscript(node.slice), self.compileNode(node.value))
+        else :
+            raise Exception('Unsupported syntax in calculation expression: ' + self.expression)
+
+    # Method compiles a subscript into a constant index (integers, slices and ellipses only)
+    def compileSubscript(self, node) :
+        if isinstance(node, ast.Index) :
+            return self.compileSubscript(node.value)
+        elif isinstance(node, ast.ExtSlice) :
+            return tuple([self.compileSubscript(dimension) for dimension in node.dims])
+        elif isinstance(node, ast.Tuple) :
+            return tuple([self.compileSubscript(element) for element in node.elts])
+        elif isinstance(node, ast.Slice) :
+            return slice(*[self.compileSubscript(bound) if bound else None for bound in (node.lower, node.upper, node.step)])
+        elif isinstance(node, ast.Ellipsis) :
+            return Ellipsis
+        elif isinstance(node, ast.Num) and type(node.n) in (int, long) :
+            return node.n
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) :
+            return -self.compileSubscript(node.operand)
+        else :
+            raise Exception('Unsupported subscript in calculation expression: ' + self.expression)
+
+    # Method adds an operation (folding constant operands) and returns its result operand
+    def addOperation(self, operation, function, *operands) :
+        if operation == 'ufunc' and not [operand for operand in operands if operand[0] != 'constant'] :
+            return ('constant', function(*[operand[1] for operand in operands]))
+        self.operations.append((operation, function, operands, self.registers))
+        self.registers += 1
+        return ('register', self.registers - 1)
+
+    # Method evaluates the expression for a dictionary of variable values
+    def evaluate(self, values) :
+        registers = [None]*self.registers
+        owned = [False]*self.registers # intermediate arrays that may be overwritten
+        for operation, function, operands, result_register in self.operations :
+            arguments = []
+            for source, key in operands :
+                if source == 'register' :
+                    arguments.append(registers[key])
+                elif source == 'variable' :
+                    if not values.has_key(key) :
+                        raise Exception('Calculation expression variable ' + key + ' is not defined: ' + self.expression)
+                    arguments.append(values[key])
+                else :
+                    arguments.append(key)
+            if operation == 'subscript' :
+                registers[result_register] = arguments[0][function]
+            else :
+                out = None
+                if function not in self.comparison_operator_ufuncs.values() :
+                    result_shape = np.broadcast(*arguments).shape
+                    result_dtype = np.result_type(*arguments)
+                    for (source, key), argument in zip(operands, arguments) :
+                        if source == 'register' and owned[key] and argument.shape == result_shape and argument.dtype == result_dtype :
+                            out = argument
+                            break
+                if out is not None :
+                    registers[result_register] = function(*arguments, out=out)
+                else :
+                    registers[result_register] = function(*arguments)
+                owned[result_register] = isinstance(registers[result_register], np.ndarray)
+            for source, key in operands :
+                if source == 'register' :
+                    registers[key] = None
+        source, key = self.result_operand
+        if source == 'register' :
+            return registers[key]
+        elif source == 'variable' :
+            if not values.has_key(key) :
+                raise Exception('Calculation expression variable ' + key + ' is not defined: ' + self.expression)
+            return values[key]
+        else :
+            return key
@@ -0,0 +1,180 @@
+# Python modules
+import struct
+import zlib
+from xml.sax.saxutils import escape
+
+# Python extension modules (requires extension installation)
+import numpy as np
+
+## Paleoclimate Tool GeoTIFF Grid Writer
+## * Streams grid data (maps) into a single multi-band GeoTIFF file (a band for each time) encoded in pure Python (GDAL is not required)
+## * Tiled with Deflate compression and the floating point predictor
+## * Includes overviews (2 x 2 means of the valid values) until an overview fits within a single tile, so large band stacks open quickly
+## * Georeferenced as WGS84 (EPSG:4326) with -9999 for no data, and band descriptions (year labels) and units as GDAL metadata
+## * The tiles of each grid are written as it arrives. The image file directories are written (at the end of the file) on closing
+class PaleoclimateToolGeoTiffGridWriter :
+
+    # TIFF field types: (code, struct format)
+    ascii_type = (2, 's')
+    short_type = (3, 'H')
+    long_type = (4, 'I')
+    double_type = (12, 'd')
+
+    # No data value
+    no_data_value = -9999.0
+
+    # Initialise (creates the GeoTIFF file)
+    def __init__(self, file_path, times, description=None, data_units=None, tile_size=64, grid_height=72, grid_width=144) :
+
+        # Time (band) indices and band labels
+        self.time_index = dict([(time, i) for i, time in enumerate(times)])
+        self.band_labels = [str(time) for time in times]
+        self.description = description
+        self.data_units = data_units
+
+        # Image levels: full resolution then overviews (halved until within a single tile)
+        self.tile_size = tile_size
+        self.levels = [{ 'height' : grid_height, 'width' : grid_width }]
+        while self.levels[-1]['height'] > tile_size or self.levels[-1]['width'] > tile_size :
+            self.levels.append({ 'height' : (self.levels[-1]['height'] + 1)/2, 'width' : (self.levels[-1]['width'] + 1)/2 })
+        for level in self.levels :
+            level['tiles_down'] = (level['height'] + tile_size - 1)/tile_size
+            level['tiles_across'] = (level['width'] + tile_size - 1)/tile_size
+            tiles = level['tiles_down']*level['tiles_across']*len(times)
+            level['tile_offsets'] = [0]*tiles
+            level['tile_byte_counts'] = [0]*tiles # unwritten (sparse) tiles are read as no data
+
+        # Create file with header (first image file directory offset written on closing)
+        self.file = open(file_path, 'wb')
+        self.file.write(struct.pack('<2sHI', 'II', 42, 0))
+
+        # Times written
+        self.times_written = set()
+
+    # Method writes the (masked) grid data for a time (band), optionally with a band label
+    def writeGrid(self, masked_data, time, band_label=None) :
+        if not self.time_index.has_key(time) :
+            raise Exception('Time ' + str(time) + ' is not within the GeoTIFF grid data file times')
+        band = self.time_index[time]
+        if band_label != None :
+            self.band_labels[band] = band_label
+        level_data = np.ma.masked_invalid(masked_data).astype(np.float64).filled(np.nan)
+        for level_index, level in enumerate(self.levels) :
+            if level_index :
+                level_data = self.calculateOverviewData(level_data)
+            tiles_per_band = level['tiles_down']*level['tiles_across']
+            for tile_row in range(level['tiles_down']) :
+                for tile_col in range(level['tiles_across']) :
+                    tile_data = level_data[(tile_row*self.tile_size):((tile_row+1)*self.tile_size), (tile_col*self.tile_size):((tile_col+1)*self.tile_size)]
+                    encoded_tile = self.encodeTile(tile_data)
+                    tile_index = band*tiles_per_band + tile_row*level['tiles_across'] + tile_col
+                    level['tile_offsets'][tile_index] = self.file.tell()
+                    level['tile_byte_counts'][tile_index] = len(encoded_tile)
+                    self.file.write(encoded_tile)
+        self.times_written.add(time)
+
+    # Method calculates overview data as the means of the valid values within each 2 x 2 block
+    def calculateOverviewData(self, data) :
+        rows, cols = data.shape
+        padded_data = np.empty((rows + rows%2, cols + cols%2))
+        padded_data.fill(np.nan)
+        padded_data[:rows,:cols] = data
+        blocks = padded_data.reshape(padded_data.shape[0]/2, 2, padded_data.shape[1]/2, 2)
+        valid = np.isfinite(blocks)
+        valid_counts = valid.sum(axis=3).sum(axis=1)
+        valid_sums = np.where(valid, blocks, 0).sum(axis=3).sum(axis=1)
+        return np.where(valid_counts > 0, valid_sums/np.maximum(valid_counts, 1), np.nan)
+
+    # Method encodes a tile: padded with no data, floating point predictor (byte planes then differences along each row) and Deflate compression
+    def encodeTile(self, tile_data) :
+        tile = np.empty((self.tile_size, self.tile_size), dtype='>f4')
+        tile.fill(self.no_data_value)
+        tile_rows, tile_cols = tile_data.shape
+        tile[:tile_rows,:tile_cols] = np.where(np.isfinite(tile_data), tile_data, self.no_data_value)
+        byte_planes = tile.view(np.uint8).reshape(self.tile_size, self.tile_size, 4).transpose(0, 2, 1).reshape(self.tile_size, self.tile_size*4)
+        differences = byte_planes.copy()
+        differences[:,1:] = np.diff(byte_planes, axis=1)
+        return zlib.compress(differences.tobytes(), 6)
+
+    # Method checks if grids have been written for all times
+    def allGridsWritten(self) :
+        return len(self.times_written) == len(self.time_index)
+
+    # Method generates the GDAL metadata (XML) for band descriptions and units
+    # Item values are escaped twice (as GDAL writes and reads them)
+    def generateGdalMetadata(self) :
+        items = []
+        for band, band_label in enumerate(self.band_labels) :
+            items.append('<Item name="DESCRIPTION" sample="' + str(band) + '" role="description">' + escape(escape(band_label)) + '</Item>')
+            if self.data_units :
+                items.append('<Item name="UNITTYPE" sample="' + str(band) + '" role="unittype">' + escape(escape(self.data_units)) + '</Item>')
+        gdal_metadata = '<GDALMetadata>' + ''.join(items) + '</GDALMetadata>'
+        if isinstance(gdal_metadata, unicode) :
+            gdal_metadata = gdal_metadata.encode('utf-8')
+        return gdal_metadata
+
+    # Method writes an image file directory at the (word aligned) end of the file and returns its offset
+    # Entries are (tag, field type, values) in tag order. Values that do not fit within an entry are written before the directory
+    def writeImageFileDirectory(self, entries, next_offset=0) :
+        entry_bytes = []
+        for tag, (field_type, field_format), values in entries :
+            if field_format == 's' :
+                value_bytes = values + '\0'
+                count = len(value_bytes)
+            else :
+                value_bytes = struct.pack('<' + str(len(values)) + field_format, *values)
+                count = len(values)
+            if len(value_bytes) <= 4 :
+                entry_bytes.append(struct.pack('<HHI', tag, field_type, count) + value_bytes + '\0'*(4 - len(value_bytes)))
+            else :
+                if self.file.tell()%2 :
+                    self.file.write('\0')
+                entry_bytes.append(struct.pack('<HHII', tag, field_type, count, self.file.tell()))
+                self.file.write(value_bytes)
+        if self.file.tell()%2 :
+            self.file.write('\0')
+        offset = self.file.tell()
+        self.file.write(struct.pack('<H', len(entry_bytes)) + ''.join(entry_bytes) + struct.pack('<I', next_offset))
+        return offset
+
+    # Method closes the file (writing the image file directories for the overviews then the full resolution image)
+    def close(self) :
+        if self.file == None :
+            return
+        bands = len(self.time_index)
+        next_offset = 0
+        for level_index in range(len(self.levels)-1, -1, -1) :
+            level = self.levels[level_index]
+            entries = [(254, self.long_type, [int(level_index > 0)]), # new subfile type: reduced resolution image for overviews
+                       (256, self.long_type, [level['width']]),
+                       (257, self.long_type, [level['height']]),
+                       (258, self.short_type, [32]*bands), # bits per sample
+                       (259, self.short_type, [8]), # compression: Deflate
+                       (262, self.short_type, [1])] # photometric interpretation: black is zero
+            if level_index == 0 and self.description :
+                entries.append((270, self.ascii_type, str(self.description))) # image description
+            entries.extend([(277, self.short_type, [bands]), # samples per pixel
+                            (284, self.short_type, [2]), # planar configuration: separate bands
+                            (317, self.short_type, [3]), # predictor: floating point
+                            (322, self.short_type, [self.tile_size]),
+                            (323, self.short_type, [self.tile_size]),
+                            (324, self.long_type, level['tile_offsets']),
+                            (325, self.long_type, level['tile_byte_counts'])])
+            if bands > 1 :
+                entries.append((338, self.short_type, [0]*(bands-1))) # extra samples: unspecified
+            entries.append((339, self.short_type, [3]*bands)) # sample format: floating point
+            if level_index == 0 :
+                entries.extend([(33550, self.double_type, [2.5, 2.5, 0.0]), # model pixel scale
+                                (33922, self.double_type, [0.0, 0.0, 0.0, -180.0, 90.0, 0.0]), # model tie point
+                                (34735, self.short_type, [1, 1, 0, 4, # geo key directory: WGS84 geographic, pixels are areas
+                                                          1024, 0, 1, 2,
+                                                          1025, 0, 1, 1,
+                                                          2048, 0, 1, 4326,
+                                                          2054, 0, 1, 9102]),
+                                (42112, self.ascii_type, self.generateGdalMetadata())])
+            entries.append((42113, self.ascii_type, '%g' % self.no_data_value)) # GDAL no data
+            next_offset = self.writeImageFileDirectory(entries, next_offset)
+        self.file.seek(4)
+        self.file.write(struct.pack('<I', next_offset))
+        self.file.close()
+        self.file = None
@@ -0,0 +1,718 @@
+# Python modules
+import copy
+from multiprocessing import Pool
+from os import path
+
+# Python extension modules (requires extension installation)
+import numpy as np
+
+# Python extension Matplot and Basemap modules
+from mpl_toolkits.basemap import Basemap
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
+from matplotlib import rcParams
+
+## Paleoclimate Tool Grid Plotter
+## * Holds the region bounding boxes, fixed range colour schemes and colour palettes used for grid plots (maps)
+## * Calculates the grid plot figure layout (best row x column configuration, margins, colourbar and font sizes)
+## * Calculates colour scheme boundaries (fixed or 90% range, with an optional zero boundary)
+## * Draws grid plots with colour boundary lines, coastlines, grid lines and a colourbar onto a figure (used by the GUI)
+## * Renders grid plot figures off-screen (Agg) to PNG, PDF or SVG files, optionally across worker processes
+class PaleoclimateToolGridPlotter :
+
+    # Initialise
+    def __init__(self) :
+
+        # Grid size
+        self.grid_height = 72
+        self.grid_width = 144
+
+        # Region bounding box
+        self.region_bounding_box = {}
+        self.region_bounding_box['globe'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['land'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['ocean'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['land-0-21KBP'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['ocean-0-21KBP'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['northern-hemisphere'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['southern-hemisphere'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['equatorial-pacific'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
+        self.region_bounding_box['n3'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
+        self.region_bounding_box['n3-4'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
+        self.region_bounding_box['n4'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
+        self.region_bounding_box['usa'] = { 'centre': 0, 'lat' : [15,60], 'lon' : [-130,-55], 'grid' : 10 }
+        self.region_bounding_box['canada'] = { 'centre': 0, 'lat' : [35,80], 'lon' : [-150,-45], 'grid' : 10 }
+        self.region_bounding_box['mexico'] = { 'centre': 0, 'lat' : [5,40], 'lon' : [-125,-80], 'grid' : 10 }
+        self.region_bounding_box['brazil'] = { 'centre': 0, 'lat' : [-45,15], 'lon' : [-80,-25], 'grid' : 10 }
+        self.region_bounding_box['africa'] = { 'centre': 0, 'lat' : [-40,40], 'lon' : [-20,55], 'grid' : 10 }
+        self.region_bounding_box['europe'] = { 'centre': 0, 'lat' : [30,75], 'lon' : [-25,40], 'grid' : 10 }
+        self.region_bounding_box['india'] = { 'centre': 0, 'lat' : [0,45], 'lon' : [60,100], 'grid' : 10 }
+        self.region_bounding_box['china'] = { 'centre': 0, 'lat' : [15,60], 'lon' : [70,140], 'grid' : 10 }
+        self.region_bounding_box['japan'] = { 'centre': 0, 'lat' : [25,50], 'lon' : [125,150], 'grid' : 10 }
+        self.region_bounding_box['australia-nz'] = { 'centre': 180, 'lat' : [-50,-5], 'lon' : [110,185], 'grid' : 10 }
+        self.region_bounding_box['central-asia'] = { 'centre': 0, 'lat' : [20,60], 'lon' : [35,120], 'grid' : 10 }
+        self.region_bounding_box['middle-east'] = { 'centre': 0, 'lat' : [10,45], 'lon' : [30,65], 'grid' : 10 }
+        self.region_bounding_box['east-former-soviet-union'] = { 'centre': 180, 'lat' : [40,85], 'lon' : [55,195], 'grid' : 10 }
+        self.region_bounding_box['west-former-soviet-union'] = { 'centre': 0, 'lat' : [40,80], 'lon' : [15,65], 'grid' : 10 }
+        self.region_bounding_box['rola'] = { 'centre': 0, 'lat' : [-60,30], 'lon' : [-95,-45], 'grid' : 10 }
+        self.region_bounding_box['south-east-asia'] = { 'centre': 0, 'lat' : [-15,35], 'lon' : [65,155], 'grid' : 10 }
+        self.region_bounding_box['west-pacific'] = { 'centre': 180, 'lat' : [-35,25], 'lon' : [130,240], 'grid' : 10 }
+        self.region_bounding_box['alaska'] = { 'centre': 180, 'lat' : [50,75], 'lon' : [190,225], 'grid' : 10 }
+        self.region_bounding_box['greenland'] = { 'centre': 0, 'lat' : [55,90], 'lon' : [-75,-10], 'grid' : 10 }
+        self.region_bounding_box['antarctica'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        self.region_bounding_box['arctic-islands'] = { 'centre': 0, 'lat' : [55,85], 'lon' : [-130,-55], 'grid' : 10 }
+        self.region_bounding_box['user-defined'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+
+        # Parameter fixed range colour scheme
+        self.parameter_fixed_range_colour_scheme = { 'temperature' : { 'mean-temperature' : { 'value' : {}, 'delta' : {} },
+                                                                       'minimum-temperature' : { 'value' : {}, 'delta' : {} },
+                                                                       'maximum-temperature' : { 'value' : {}, 'delta' : {} },
+                                                                       'diurnal-temperature-range' : { 'value' : {}, 'delta' : {} },
+                                                                       'annual-temperature-range' : { 'value' : {}, 'delta' : {} },
+                                                                       'isothermality' : { 'value' : {}, 'delta' : {} },
+                                                                       'temperature-seasonality' : { 'value' : {}, 'delta' : {} } },
+                                                     'precipitation' : { 'mean-precipitation' : { 'value' : {}, 'delta' : {} },
+                                                                         'precipitation-seasonality' : { 'value' : {}, 'delta' : {} } },
+                                                     'humidity' : { 'specific-humidity' : { 'value' : {}, 'delta' : {} },
+                                                                    'relative-humidity' : { 'value' : {}, 'delta' : {} } },
+                                                     'sea-level-pressure' : { 'sea-level-pressure' : { 'value' : {}, 'delta' : {} } } }
+        self.parameter_fixed_range_colour_scheme['temperature']['mean-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['mean-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['minimum-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['minimum-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['maximum-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['maximum-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['diurnal-temperature-range']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['diurnal-temperature-range']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['annual-temperature-range']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['annual-temperature-range']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['isothermality']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['isothermality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['temperature-seasonality']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['temperature']['temperature-seasonality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['%delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['precipitation']['precipitation-seasonality']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['precipitation']['precipitation-seasonality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['humidity']['specific-humidity']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['humidity']['specific-humidity']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['humidity']['relative-humidity']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : 100.0 }
+        self.parameter_fixed_range_colour_scheme['humidity']['relative-humidity']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['sea-level-pressure']['sea-level-pressure']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        self.parameter_fixed_range_colour_scheme['sea-level-pressure']['sea-level-pressure']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+
+        # Colour palettes
+        self.colour_palettes = ['rainbow', 'red_blue', 'ar4', 'extended_red_blue']
+        self.extended_colour_palettes = ['extended_red_blue']
+        rainbow = ['#fa58f4', '#0000ff', '#819ff7', '#81f7f3', '#04b431', '#44ff00', '#ffff00', '#fe9a2e', '#fec3d2', '#ff0000', '#cc3300']
+        rainbow_reversed = rainbow[:]
+        rainbow_reversed.reverse()
+        red_blue = ['#0000ac', '#0000ff', '#8888ff', '#a9a9ff', '#d5d5ff', '#ffffff', '#ffd7d7', '#ffaaaa', '#ff6464', '#ff0000', '#cc3300']
+        red_blue_reversed = red_blue[:]
+        red_blue_reversed.reverse()
+        ar4 = ['#668bf1', '#94b0fe', '#b1c4fa', '#d1dcfb', '#eaeffc', '#ffffce', '#ffe898', '#ffc98e', '#f3a24b', '#ff8257', '#fc551d']
+        ar4_reversed = ar4[:]
+        ar4_reversed.reverse()
+        extended_red_blue = ['#7a0000', '#b50000', '#df0000', '#ff0000', '#fa563d', '#ffa495', '#ff7338', '#ffa161', '#fdb56b', '#fecd80',
+                           '#f5ecc3', '#d7e2ff', '#b3ccf5', '#97b4fa', '#84a6ff', '#6989ec', '#4c80e6', '#3366d9', '#054baa', '#07378c',
+                           '#0a2864', '#0a0931'] # already reversed
+        extended_red_blue_reversed = extended_red_blue[:]
+        extended_red_blue.reverse()
+        self.colour_palette_lists = { False : { 'rainbow' : rainbow, 'red_blue' : red_blue, 'ar4' : ar4, 'extended_red_blue' : extended_red_blue },
+                                      True : { 'rainbow' : rainbow_reversed, 'red_blue' : red_blue_reversed, 'ar4' : ar4_reversed, 'extended_red_blue' : extended_red_blue_reversed } }
+
+        self.colourmaps = self.createColourMaps()
+
+        # Basemap projections (and processed coastlines) cached by region box, resolution and projection
+        self.cached_basemaps = {}
+
+    # Method creates the colour maps for each palette (normal and reversed)
+    def createColourMaps(self) :
+        rainbow = self.colour_palette_lists[False]['rainbow']
+        rainbow_reversed = self.colour_palette_lists[True]['rainbow']
+        red_blue = self.colour_palette_lists[False]['red_blue']
+        red_blue_reversed = self.colour_palette_lists[True]['red_blue']
+        ar4 = self.colour_palette_lists[False]['ar4']
+        ar4_reversed = self.colour_palette_lists[True]['ar4']
+        extended_red_blue = self.colour_palette_lists[False]['extended_red_blue']
+        extended_red_blue_reversed = self.colour_palette_lists[True]['extended_red_blue']
+        return { False : { 'rainbow' : LinearSegmentedColormap.from_list('rainbow', rainbow, N=11),
+                           'red_blue' : LinearSegmentedColormap.from_list('red_blue', red_blue, N=11),
+                           'ar4' : LinearSegmentedColormap.from_list('ar4', ar4, N=11),
+                           'extended_red_blue' : LinearSegmentedColormap.from_list('extended_red_blue', extended_red_blue[6:17], N=11) },
+                 True : { 'rainbow' : LinearSegmentedColormap.from_list('rainbow_reversed', rainbow_reversed, N=11),
+                          'red_blue' : LinearSegmentedColormap.from_list('red_blue_reversed', red_blue_reversed, N=11),
+                          'ar4' : LinearSegmentedColormap.from_list('ar4_reversed', ar4_reversed, N=11),
+                          'extended_red_blue' : LinearSegmentedColormap.from_list('extended_red_blue_reversed', extended_red_blue_reversed[5:16], N=11) } }
+
+    # Method creates an extended palette colour map aligned with the zero boundary index
+    def createExtendedColourMap(self, colour_palette, reverse, zero_index) :
+        return LinearSegmentedColormap.from_list(colour_palette, self.colour_palette_lists[reverse][colour_palette][(11-zero_index):(22-zero_index)], N=11)
+
+    # Method gets the colour map for a palette (extended palettes are aligned with the zero boundary index when provided)
+    def getColourMap(self, colour_palette, reverse=False, zero_index=None) :
+        if colour_palette in self.extended_colour_palettes and zero_index is not None :
+            return self.createExtendedColourMap(colour_palette, reverse, zero_index)
+        else :
+            return self.colourmaps[reverse][colour_palette]
+
+    # Method gets the fixed range colour scheme for a parameter (value, delta, or % delta)
+    def getFixedRangeColourScheme(self, parameter_group_code, parameter_code, delta=False, delta_as_percent=False) :
+        if delta :
+            if delta_as_percent and self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code].has_key('%delta') :
+                return self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['%delta']
+            else :
+                return self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['delta']
+        else :
+            return self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['value']
+
+    # Method calculates colour scheme boundary values from the region statistics (lists of grid statistics)
+    def calculateColourSchemeBoundaries(self, map_colour_scheme, fixed_range_colour_scheme, region_statistics) :
+
+        # Find minimum and maximum data values and colour scheme interval
+        if map_colour_scheme == '90%_range' :
+            data_5th_percentile = min(region_statistics['percentile_5th'])
+            data_95th_percentile = max(region_statistics['percentile_95th'])
+            scheme_interval = (data_95th_percentile - data_5th_percentile)/9
+            data_min = data_5th_percentile - scheme_interval
+            data_max = data_95th_percentile + scheme_interval
+
+        else : # fixed_range
+
+            # Prioritise min/max then first/last boundaries, use statistical min/max when neither provided
+            if fixed_range_colour_scheme['min'] != None :
+                data_min = fixed_range_colour_scheme['min']
+            elif fixed_range_colour_scheme['first_boundary'] != None :
+                data_min = None
+            else :
+                data_min = min(region_statistics['minimum'])
+            if fixed_range_colour_scheme['max'] != None :
+                data_max = fixed_range_colour_scheme['max']
+            elif fixed_range_colour_scheme['last_boundary'] != None :
+                data_max = None
+            else :
+                data_max = max(region_statistics['maximum'])
+
+            # Resolve scheme interval and unresolved min/max
+            if data_min == None and data_max == None :
+                scheme_interval = (fixed_range_colour_scheme['last_boundary'] - fixed_range_colour_scheme['first_boundary'])/9.0
+                data_min = fixed_range_colour_scheme['first_boundary'] - scheme_interval
+                data_max = fixed_range_colour_scheme['last_boundary'] + scheme_interval
+            elif data_min == None :
+                scheme_interval = (data_max - fixed_range_colour_scheme['first_boundary'])/10.0
+                data_min = fixed_range_colour_scheme['first_boundary'] - scheme_interval
+            elif data_max == None :
+                scheme_interval = (fixed_range_colour_scheme['last_boundary'] - data_min)/10.0
+                data_max = fixed_range_colour_scheme['last_boundary'] + scheme_interval
+            else :
+                scheme_interval = (data_max - data_min)/11.0
+
+        # Return colour scheme boundary values
+        if scheme_interval :
+            return np.arange(data_min, data_max+0.1*scheme_interval, scheme_interval)
+        else :
+            return np.arange(data_min-1.0, data_max+1.2, 0.2)
+
+    # Method determines if a zero boundary is permitted for the colour scheme
+    def zeroBoundaryPermitted(self, map_colour_scheme, region_statistics) :
+        if map_colour_scheme == '90%_range' :
+            return min(region_statistics['percentile_5th']) <= 0 and max(region_statistics['percentile_95th']) >= 0
+        else : # fixed_range
+            return True
+
+    # Method adjusts colour scheme boundaries so that one boundary is at zero: returns (zero boundary index, boundaries)
+    def adjustColourSchemeZeroBoundaries(self, colour_scheme_boundaries, map_colour_scheme, fixed_range_colour_scheme) :
+
+        if map_colour_scheme == '90%_range' : # shift left method
+            colour_scheme_boundaries_zero_index = (colour_scheme_boundaries >= 0).nonzero()[0][0]
+            colour_scheme_boundaries -= colour_scheme_boundaries[colour_scheme_boundaries_zero_index]
+
+        else : # fixed_range: minimal stretch method
+
+            # Resolve colour scheme zero boundaries
+            first_index = int(fixed_range_colour_scheme['first_boundary'] != None and fixed_range_colour_scheme['min'] == None)
+            last_index = 11 - int(fixed_range_colour_scheme['last_boundary'] != None and fixed_range_colour_scheme['max'] == None)
+            if colour_scheme_boundaries.round(12).min() >= 0 :
+                data_min = 0.0
+                scheme_interval = (colour_scheme_boundaries[last_index] - data_min)/last_index
+                data_max = colour_scheme_boundaries[last_index] + scheme_interval*(11 - last_index)
+                colour_scheme_boundaries_zero_index = 0
+            elif colour_scheme_boundaries.round(12).max() <= 0 :
+                data_max = 0.0
+                scheme_interval = (data_max - colour_scheme_boundaries[first_index])/(11 - first_index)
+                data_min = colour_scheme_boundaries[first_index] - scheme_interval*first_index
+                colour_scheme_boundaries_zero_index = 11
+            else :
+                first_positive_index = (colour_scheme_boundaries >= 0).nonzero()[0][0]
+                lower_stretch = None
+                upper_stretch = None
+                if first_positive_index < last_index :
+                    lower_stretch = (last_index - first_index)*colour_scheme_boundaries[first_positive_index]/(last_index - first_positive_index)
+                if first_positive_index > first_index + 1 :
+                    upper_stretch = (last_index - first_index)*colour_scheme_boundaries[first_positive_index - 1]/(first_index - first_positive_index + 1)
+                if upper_stretch == None or (lower_stretch != None and round(lower_stretch, 12) <= round(upper_stretch, 12)) :
+                    colour_scheme_boundaries[first_index] -= lower_stretch
+                    colour_scheme_boundaries_zero_index = first_positive_index
+                else :
+                    colour_scheme_boundaries[last_index] += upper_stretch
+                    colour_scheme_boundaries_zero_index = first_positive_index - 1
+                scheme_interval = (colour_scheme_boundaries[last_index] - colour_scheme_boundaries[first_index])/(last_index - first_index)
+                data_min = colour_scheme_boundaries[first_index] - scheme_interval*first_index
+                data_max = colour_scheme_boundaries[last_index] + scheme_interval*(11 - last_index)
+            colour_scheme_boundaries = np.arange(data_min, data_max+0.1*scheme_interval, scheme_interval).round(12)
+
+        return (colour_scheme_boundaries_zero_index, colour_scheme_boundaries)
+
+    # Method resolves the colourbar label boundaries for the colour scheme
+    def calculateColourbarLabelBoundaries(self, colour_scheme_boundaries, map_colour_scheme, fixed_range_colour_scheme) :
+        if map_colour_scheme == '90%_range' :
+            return colour_scheme_boundaries[1:-1]
+        else : # fixed_range
+            cb_label_boundaries = colour_scheme_boundaries[:]
+            if fixed_range_colour_scheme['first_boundary'] != None and fixed_range_colour_scheme['min'] == None :
+                cb_label_boundaries = cb_label_boundaries[1:]
+            if fixed_range_colour_scheme['last_boundary'] != None and fixed_range_colour_scheme['max'] == None :
+                cb_label_boundaries = cb_label_boundaries[:-1]
+            return cb_label_boundaries
+
+    # Method resolves the basemap resolution and projection for a region
+    def resolveRegionBasemapSettings(self, region, region_box) :
+
+        # Basemap resolution: c (crude), l (low), i (intermediate), h (high), f (full)
+        if region in ['globe', 'land', 'land-0-21KBP', 'ocean', 'ocean-0-21KBP', 'northern-hemisphere', 'southern-hemisphere', 'equatorial-pacific', 'n3', 'n3-4', 'n4', 'rola'] :
+            basemap_resolution = 'c'
+        elif region in ['japan', 'middle-east', 'alaska'] :
+            basemap_resolution = 'i'
+        elif region == 'user-defined':
+            box_area = (region_box['lat'][1]-region_box['lat'][0])/2.5*(region_box['lon'][1]-region_box['lon'][0])/2.5
+            if box_area > 1000 :
+                basemap_resolution = 'c'
+            elif box_area > 200 :
+                basemap_resolution = 'l'
+            else :
+                basemap_resolution = 'i'
+        else :
+            basemap_resolution = 'l'
+
+        # Projection
+        map_projection = 'cyl'
+        bounding_lat = None
+        if region == 'antarctica' :
+            map_projection = 'spaeqd'
+            bounding_lat = -60
+
+        return { 'resolution' : basemap_resolution, 'projection' : map_projection, 'bounding_lat' : bounding_lat }
+
+    # Method calculates the grid plot figure layout: fits the best row x column configuration within the (maximum) figure size
+    def calculateGridPlotLayout(self, number_of_plots, plot_width_to_height_ratio, figure_width=None, figure_height=None) :
+
+        # Set/calculate dimensions and margins
+        if figure_width :
+            maximum_width = figure_width
+        else :
+            maximum_width = 15.0
+        if figure_height :
+            maximum_height = figure_height
+        else :
+            maximum_height = 9.0
+        margin = 0.225*max(maximum_width/15.0, (maximum_width/15.0 + maximum_height/9.0)/2)
+        title_margin = 0.495*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
+        label_margin = 0.335*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
+        colourbar_margin = 0.585*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
+        colourbar_total_height = 1.125*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
+
+        # Determine best row x column configuration
+        max_rows = 20
+        max_cols = 20
+        max_plot_width = 0
+        best_config = None
+        best_uses = None
+        for rows in np.arange(1, min(number_of_plots+1, max_rows+1)) :
+            cols = number_of_plots/rows + int(bool(number_of_plots%rows))
+            if cols <= max_cols :
+                plot_width = (maximum_width - (cols + 1)*margin)/cols
+                plot_height = (maximum_height - title_margin - (rows - 1)*label_margin - colourbar_total_height)/rows
+                using = 'maximum_width'
+                if plot_width > plot_height*plot_width_to_height_ratio :
+                    plot_width = plot_width_to_height_ratio*plot_height
+                    using = 'maximum_height'
+                if plot_width > max_plot_width :
+                    max_plot_width = plot_width
+                    best_config = [int(rows), int(cols)]
+                    best_uses = using
+        max_plot_height = max_plot_width/plot_width_to_height_ratio
+
+        # Set colorbar width relative to row:col configuration
+        config_ratio = 1.0*best_config[0]/best_config[1]
+        colourbar_width = maximum_width*(0.70+np.log2(config_ratio)*0.1) # 0.75
+        colourbar_height = 0.015*colourbar_width
+
+        # Calculate width and height of best configuration
+        if figure_width and figure_height :
+            width = figure_width
+            height = figure_height
+        else :
+            if best_uses == 'maximum_width' :
+                width = maximum_width
+                height = title_margin + max_plot_height*best_config[0] + label_margin*(best_config[0] - 1) + colourbar_total_height
+            elif best_uses == 'maximum_height' :
+                width = margin*(best_config[1] + 1) + max_plot_width*best_config[1]
+                height = maximum_height
+            if width < colourbar_width*1.1 :
+                width = colourbar_width*1.1
+
+        # Set font sizes relative to figure size
+        font_scale = (width/15.0+height/9.0)/2
+
+        return { 'best_config' : best_config, 'width' : width, 'height' : height, 'margin' : margin, 'title_margin' : title_margin, 'label_margin' : label_margin,
+                 'colourbar_margin' : colourbar_margin, 'colourbar_total_height' : colourbar_total_height, 'colourbar_width' : colourbar_width, 'colourbar_height' : colourbar_height,
+                 'max_plot_width' : max_plot_width, 'max_plot_height' : max_plot_height, 'title_font_size' : 14*font_scale, 'font_size' : 12*font_scale }
+
+    # Method gets a basemap for plot axes: the projection (and coastlines) are created once for each region box, resolution and projection, then copied onto the axes
+    def getBasemap(self, axes, region_box, resolution, projection, bounding_lat) :
+        basemap_key = (region_box['centre'], tuple(region_box['lat']), tuple(region_box['lon']), resolution, projection, bounding_lat)
+        if not self.cached_basemaps.has_key(basemap_key) :
+            self.cached_basemaps[basemap_key] = Basemap(lon_0=region_box['centre'],
+                                                        llcrnrlat=region_box['lat'][0],
+                                                        urcrnrlat=region_box['lat'][1],
+                                                        llcrnrlon=region_box['lon'][0],
+                                                        urcrnrlon=region_box['lon'][1],
+                                                        resolution=resolution,
+                                                        projection=projection,
+                                                        boundinglat=bounding_lat)
+        basemap = copy.copy(self.cached_basemaps[basemap_key])
+        basemap.ax = axes
+        if hasattr(basemap, '_initialized_axes') : # axes limits not yet set for these axes
+            basemap._initialized_axes = set()
+        return basemap
+
+    # Method shifts data grids (or masks) 180 degrees in longitude (for regions centred on 180 degrees)
+    # The grids are stacked and rolled in a single array operation, and repeated grid objects (such as a shared region mask) are only shifted once
+    def shiftDataGrids180Degrees(self, data_grids) :
+        if not len(data_grids) :
+            return []
+        unique_data_grids = []
+        unique_index = {}
+        for data_grid in data_grids :
+            if not unique_index.has_key(id(data_grid)) :
+                unique_index[id(data_grid)] = len(unique_data_grids)
+                unique_data_grids.append(data_grid)
+        stacked_data_grids = np.asarray(unique_data_grids, dtype=float)
+        shifted_data_grids = np.roll(stacked_data_grids, stacked_data_grids.shape[2]//2, axis=2)
+        return [shifted_data_grids[unique_index[id(data_grid)]] for data_grid in data_grids]
+
+    # Method transforms grid masks for contours
+    # Each (rows+1, cols+1) contour mask point is set when any of its surrounding (up to 4) grid cells are, with longitude wrap-around and single pole points
+    def transformGridMasksForContours(self, grid_masks) :
+        grid_masks = np.asarray(grid_masks) != 0
+        maps, rows, cols = grid_masks.shape
+        contour_grid_masks = np.zeros((maps,rows+1,cols+1))
+        contour_grid_masks[:,0,:] = grid_masks[:,0,:].any(axis=1).reshape(-1,1)
+        contour_grid_masks[:,rows,:] = grid_masks[:,(rows-1),:].any(axis=1).reshape(-1,1)
+        contour_grid_masks[:,1:rows,1:cols] = grid_masks[:,:-1,:-1] | grid_masks[:,:-1,1:] | grid_masks[:,1:,:-1] | grid_masks[:,1:,1:]
+        contour_grid_masks[:,1:rows,0] = grid_masks[:,:-1,0] | grid_masks[:,1:,0] | grid_masks[:,:-1,(cols-1)] | grid_masks[:,1:,(cols-1)]
+        contour_grid_masks[:,1:rows,cols] = contour_grid_masks[:,1:rows,0]
+        return list(contour_grid_masks)
+
+    # Method transforms data grids for contours
+    # Each (rows+1, cols+1) contour point is the mean of its surrounding (4) grid cells, with longitude wrap-around and pole points the mean of the pole rows
+    def transformDataGridsForContours(self, data_grids) :
+        data_grids = np.asarray(data_grids)
+        maps, rows, cols = data_grids.shape
+        contour_data_grids = np.zeros((maps,rows+1,cols+1))
+        contour_data_grids[:,0,:] = data_grids[:,0,:].mean(axis=1).reshape(-1,1)
+        contour_data_grids[:,rows,:] = data_grids[:,(rows-1),:].mean(axis=1).reshape(-1,1)
+        contour_data_grids[:,1:rows,1:cols] = (data_grids[:,:-1,:-1] + data_grids[:,:-1,1:] + data_grids[:,1:,:-1] + data_grids[:,1:,1:])/4.0
+        contour_data_grids[:,1:rows,0] = (data_grids[:,:-1,0] + data_grids[:,1:,0] + data_grids[:,:-1,(cols-1)] + data_grids[:,1:,(cols-1)])/4.0
+        contour_data_grids[:,1:rows,cols] = contour_data_grids[:,1:rows,0]
+        return list(contour_data_grids)
+
+    # Method creates colour boundary lines
+    # Returns a single line collection of the cell edges between (unmasked) cells with different colour indexes
+    # Edges crossing the zero boundary colour index (when supplied) are thicker. Edge coordinates are projected when a (non-cylindrical) basemap is supplied
+    def createColourBoundaryLines(self, colour_indexes, longitudes, latititudes, zero_boundary_index, regular_linewidth, zero_linewidth, basemap=None) :
+        unmasked = np.logical_not(np.ma.getmaskarray(colour_indexes))
+        colour_indexes = np.ma.getdata(colour_indexes)
+        lon_edges = (colour_indexes[:,:-1] != colour_indexes[:,1:]) * unmasked[:,:-1] * unmasked[:,1:] # between columns jx and jx+1
+        lat_edges = (colour_indexes[:-1,:] != colour_indexes[1:,:]) * unmasked[:-1,:] * unmasked[1:,:] # between rows iy and iy+1
+        lon_edge_rows, lon_edge_cols = lon_edges.nonzero()
+        lat_edge_rows, lat_edge_cols = lat_edges.nonzero()
+
+        # Segment end points: vertical edges at the right of each column, horizontal edges at the bottom of each row
+        segment_lons = np.concatenate((np.array([longitudes[lon_edge_cols+1], longitudes[lon_edge_cols+1]]).T,
+                                       np.array([longitudes[lat_edge_cols], longitudes[lat_edge_cols+1]]).T))
+        segment_lats = np.concatenate((np.array([latititudes[lon_edge_rows], latititudes[lon_edge_rows+1]]).T,
+                                       np.array([latititudes[lat_edge_rows+1], latititudes[lat_edge_rows+1]]).T))
+        if basemap and len(segment_lons) :
+            segment_x, segment_y = basemap(segment_lons, segment_lats)
+            segments = np.dstack((segment_x, segment_y))
+        else :
+            segments = np.dstack((segment_lons, segment_lats))
+
+        # Linewidths
+        linewidths = np.ones(len(segments))*regular_linewidth
+        if zero_boundary_index is not None :
+            lower_indexes = np.concatenate((np.minimum(colour_indexes[:,:-1], colour_indexes[:,1:])[lon_edges], np.minimum(colour_indexes[:-1,:], colour_indexes[1:,:])[lat_edges]))
+            upper_indexes = np.concatenate((np.maximum(colour_indexes[:,:-1], colour_indexes[:,1:])[lon_edges], np.maximum(colour_indexes[:-1,:], colour_indexes[1:,:])[lat_edges]))
+            linewidths[((lower_indexes < zero_boundary_index)*(upper_indexes >= zero_boundary_index)).nonzero()] = zero_linewidth
+
+        return LineCollection(segments, colors='k', linewidths=linewidths)
+
+    # Method creates a grid plot figure: a map for each data grid (masked by its region mask) and a shared colourbar
+    # Plot settings:
+    #   main_title, grid_plot_titles, region_box, basemap (resolution, projection, bounding_lat), colour_scheme_boundaries,
+    #   colour_scheme_boundaries_zero_index (None when no zero boundary), colourbar_label_boundaries, colourbar_label, colour_map,
+    #   contoured, boundary_lines, land_boundaries, grid_lines (show, space, include), figure_width and figure_height (optional)
+    # The optional map_plotted function is called after each map is plotted (e.g. to update progress)
+    # Returns the figure and its plot components
+    def createGridFigure(self, parameter_data, region_masks, plot_settings, map_plotted=None) :
+
+        # Resolve settings
+        region_box = plot_settings['region_box']
+        basemap_settings = plot_settings['basemap']
+        colour_scheme_boundaries = plot_settings['colour_scheme_boundaries']
+        colour_scheme_boundaries_zero_index = plot_settings.get('colour_scheme_boundaries_zero_index')
+        colour_map = plot_settings['colour_map']
+        contoured = plot_settings.get('contoured', False)
+        boundary_lines = plot_settings.get('boundary_lines', True)
+        grid_lines = plot_settings.get('grid_lines', { 'show' : True, 'space' : None, 'include' : 'ticks' })
+
+        # Resolve minimum and maximum data values and colour scheme interval from colour scheme boundaries
+        data_min = colour_scheme_boundaries[0]
+        data_max = colour_scheme_boundaries[-1]
+        scheme_interval = colour_scheme_boundaries[1] - colour_scheme_boundaries[0]
+
+        # Enforce near minimum and near maximum values on data
+        near_data_min = data_min + 0.0001*scheme_interval
+        near_data_max = data_max - 0.0001*scheme_interval
+        parameter_data = [np.clip(data_grid, near_data_min, near_data_max) for data_grid in parameter_data]
+
+        # Setup the latitude and longitude variables
+        latititudes = np.arange(90, -92.5, -2.5)
+        longitudes = np.arange(region_box['centre']-180, region_box['centre']+182.5, 2.5)
+        lons, lats = np.meshgrid(longitudes, latititudes)
+
+        # Calculate the layout
+        if basemap_settings['projection'] == 'cyl' :
+            plot_width_to_height_ratio = 1.0*(region_box['lon'][1] - region_box['lon'][0])/(region_box['lat'][1] - region_box['lat'][0])
+        else :
+            plot_width_to_height_ratio = 1.0
+        layout = self.calculateGridPlotLayout(len(parameter_data), plot_width_to_height_ratio, plot_settings.get('figure_width'), plot_settings.get('figure_height'))
+        layout['plot_width_to_height_ratio'] = plot_width_to_height_ratio
+        best_config = layout['best_config']
+        width = layout['width']
+        height = layout['height']
+
+        # Create figure
+        figure = Figure(frameon=False, linewidth=0, dpi=100, figsize=(width, height))
+        title = figure.suptitle(plot_settings['main_title'], fontsize=layout['title_font_size'])
+        plot_axes = []
+        basemaps = []
+        images = [] # pcolor or contourf for each map
+        boundary_line_artists = [] # boundary line collection or contour set for each map (None when not drawn)
+        coastlines = [] # coastlines for each map (None when not drawn)
+
+        # Set linewidths
+        regular_boundary_linewidth = rcParams['lines.linewidth']*0.5
+        zero_boundary_linewidth = rcParams['lines.linewidth']*1.5
+        linewidths = np.ones_like(colour_scheme_boundaries)*regular_boundary_linewidth
+        if colour_scheme_boundaries_zero_index is not None :
+            linewidths[colour_scheme_boundaries_zero_index] = zero_boundary_linewidth
+
+        for i, data in enumerate(parameter_data) :
+
+            # Plot data on a base map
+            plot_axes.append(figure.add_subplot(best_config[0], best_config[1], i+1))
+            plot_axes[i].set_xlabel(plot_settings['grid_plot_titles'][i], fontsize=layout['font_size'])
+            basemaps.append(self.getBasemap(plot_axes[i], region_box, basemap_settings['resolution'], basemap_settings['projection'], basemap_settings['bounding_lat']))
+            basemaps[i].drawmapboundary(fill_color='0.3')
+            masked_data = np.ma.masked_array(data, mask=((region_masks[i] - 1)*-1))
+            boundary_line_artists.append(None)
+            if contoured :
+                images.append(basemaps[i].contourf(lons, lats, masked_data, colour_scheme_boundaries, shading='flat', cmap=colour_map, latlon=True, vmin=data_min, vmax=data_max))
+                if boundary_lines :
+                    boundary_line_artists[i] = basemaps[i].contour(lons, lats, masked_data, colour_scheme_boundaries, linewidths=linewidths, colors='k', linestyles='solid', latlon=True, vmin=data_min, vmax=data_max)
+            else :
+                images.append(basemaps[i].pcolor(lons, lats, masked_data, shading='flat', cmap=colour_map, latlon=True, vmin=data_min, vmax=data_max, snap=True))
+                if boundary_lines :
+                    colour_indexes = np.zeros_like(masked_data)
+                    for boundary_value in colour_scheme_boundaries[1:-1] :
+                        colour_indexes += (masked_data >= boundary_value)
+                    if basemap_settings['projection'] == 'cyl' :
+                        projection_basemap = None
+                    else :
+                        projection_basemap = basemaps[i]
+                    boundary_line_artists[i] = self.createColourBoundaryLines(colour_indexes, longitudes, latititudes, colour_scheme_boundaries_zero_index,
+                                                                              regular_boundary_linewidth, zero_boundary_linewidth, basemap=projection_basemap)
+                    plot_axes[i].add_collection(boundary_line_artists[i])
+            if plot_settings.get('land_boundaries', True) :
+                coastlines.append(basemaps[i].drawcoastlines())
+            else :
+                coastlines.append(None)
+
+            # Grid lines and ticks
+            if grid_lines['show'] :
+                self.setGridLines(plot_axes[i], region_box, grid_lines)
+
+            # Notify map plotted
+            if map_plotted :
+                map_plotted(i)
+
+        # Adjust spacing and make an axis for the colorbar on the bottom
+        figure.subplots_adjust(left=(layout['margin']/width), right=(1.0-layout['margin']/width),
+                               bottom=(layout['colourbar_total_height']/height), top=(1.0-layout['title_margin']/height),
+                               wspace=(layout['margin']/layout['max_plot_width']), hspace=(layout['label_margin']/layout['max_plot_height']))
+        cax = figure.add_axes([((1-layout['colourbar_width']/width)/2.0), (layout['colourbar_margin']/height), (layout['colourbar_width']/width), (layout['colourbar_height']/height)])
+        cb = figure.colorbar(images[-1], cax=cax, orientation='horizontal', boundaries=colour_scheme_boundaries, ticks=plot_settings['colourbar_label_boundaries'], drawedges=boundary_lines)
+        cax.xaxis.set_ticks_position('none')
+        zero_boundary_line = None
+        if boundary_lines :
+            cb.dividers.set_linewidths(linewidths[1:-1])
+            if colour_scheme_boundaries_zero_index in [0,11] :
+                cax.set_xlim(left=-0.002)
+                zero_boundary_x_value = { 0 : 0, 11 : 1 }
+                zero_boundary_line = cax.axvline(zero_boundary_x_value[colour_scheme_boundaries_zero_index], color='k', linewidth=zero_boundary_linewidth)
+        cb.set_label(plot_settings['colourbar_label'])
+        cax.get_xaxis().get_label().set_fontsize(layout['font_size'])
+        for ticklabel in cax.get_xaxis().get_majorticklabels() :
+            ticklabel.set_fontsize(layout['font_size'])
+
+        return { 'figure' : figure, 'title' : title, 'plot_axes' : plot_axes, 'basemaps' : basemaps, 'cax' : cax, 'cb' : cb, 'layout' : layout,
+                 'images' : images, 'boundary_lines' : boundary_line_artists, 'coastlines' : coastlines, 'zero_boundary_line' : zero_boundary_line,
+                 'boundary_lines_drawn' : boundary_lines, 'linewidths' : linewidths, 'plot_settings' : dict(plot_settings, boundary_lines=boundary_lines) }
+
+    # Method sets the map grid ticks (and lines) at the grid spacing within the region box, or removes them when not shown
+    def setGridLines(self, axes, region_box, grid_lines) :
+        if grid_lines['show'] :
+            latititudes = np.arange(90, -92.5, -2.5)
+            longitudes = np.arange(region_box['centre']-180, region_box['centre']+182.5, 2.5)
+            region_longitudes = longitudes[((longitudes >= region_box['lon'][0])*(longitudes <= region_box['lon'][1])).nonzero()]
+            region_latititudes = latititudes[((latititudes >= region_box['lat'][0])*(latititudes <= region_box['lat'][1])).nonzero()]
+            if grid_lines['space'] :
+                map_grid_space = grid_lines['space']
+            else :
+                map_grid_space = region_box['grid']
+            axes.set_xticks(region_longitudes[((region_longitudes % map_grid_space) == 0. ).nonzero()])
+            axes.set_yticks(region_latititudes[((region_latititudes % map_grid_space) == 0. ).nonzero()])
+            axes.set_xticklabels([])
+            axes.set_yticklabels([])
+            axes.grid(grid_lines['include'] == 'lines', which='major', axis='both')
+        else :
+            axes.set_xticks([])
+            axes.set_yticks([])
+            axes.grid(False, which='major', axis='both')
+
+    # Method sets the visibility of a plot artist (contour sets contain a collection for each level in earlier Matplotlib versions)
+    def setArtistVisible(self, artist, visible) :
+        if hasattr(artist, 'collections') :
+            for collection in artist.collections :
+                collection.set_visible(visible)
+        else :
+            artist.set_visible(visible)
+
+    # Method updates a grid plot figure in place for option changes that keep its grids and colour scheme boundaries
+    # Updates: 'palette' (colour map), 'boundary_lines' and 'land_boundaries' (visibility), 'grid_lines' (ticks or lines)
+    # The existing artists are modified, so the figure only needs to be redrawn. Returns False when the figure needs to be recreated
+    def updateGridFigure(self, grid_figure, updates, colour_map=None, boundary_lines=None, land_boundaries=None, grid_lines=None) :
+        plot_settings = grid_figure['plot_settings']
+        boundary_lines_drawn = grid_figure['boundary_lines_drawn']
+        if [update for update in updates if update not in ['palette', 'boundary_lines', 'land_boundaries', 'grid_lines']] :
+            return False
+        if 'boundary_lines' in updates and boundary_lines and not boundary_lines_drawn : # only hidden or shown when drawn with the figure
+            return False
+
+        # Colour map: the colourbar is redrawn from the last map, so its boundary line settings are restored
+        if 'palette' in updates :
+            for image in grid_figure['images'] :
+                image.set_cmap(colour_map)
+            grid_figure['cb'].update_normal(grid_figure['images'][-1])
+            grid_figure['cax'].xaxis.set_ticks_position('none')
+            if boundary_lines_drawn :
+                grid_figure['cb'].dividers.set_linewidths(grid_figure['linewidths'][1:-1])
+                grid_figure['cb'].dividers.set_visible(plot_settings['boundary_lines'])
+                if grid_figure['zero_boundary_line'] :
+                    grid_figure['cax'].set_xlim(left=-0.002)
+            for ticklabel in grid_figure['cax'].get_xaxis().get_majorticklabels() :
+                ticklabel.set_fontsize(grid_figure['layout']['font_size'])
+            plot_settings['colour_map'] = colour_map
+
+        # Boundary line visibility (maps and colourbar)
+        if 'boundary_lines' in updates :
+            for artist in grid_figure['boundary_lines'] :
+                if artist is not None :
+                    self.setArtistVisible(artist, boundary_lines)
+            if boundary_lines_drawn :
+                grid_figure['cb'].dividers.set_visible(boundary_lines)
+            if grid_figure['zero_boundary_line'] :
+                grid_figure['zero_boundary_line'].set_visible(boundary_lines)
+            plot_settings['boundary_lines'] = boundary_lines
+
+        # Land boundary visibility (coastlines are drawn when first shown)
+        if 'land_boundaries' in updates :
+            for i, coastline in enumerate(grid_figure['coastlines']) :
+                if coastline is not None :
+                    coastline.set_visible(land_boundaries)
+                elif land_boundaries :
+                    grid_figure['coastlines'][i] = grid_figure['basemaps'][i].drawcoastlines()
+            plot_settings['land_boundaries'] = land_boundaries
+
+        # Grid lines and ticks
+        if 'grid_lines' in updates :
+            for axes in grid_figure['plot_axes'] :
+                self.setGridLines(axes, plot_settings['region_box'], grid_lines)
+            plot_settings['grid_lines'] = grid_lines
+
+        return True
+
+    # Method renders a grid plot figure off-screen (Agg) and saves it to a PNG, PDF or SVG file (format via file extension)
+    def saveGridFigure(self, file_path, parameter_data, region_masks, plot_settings) :
+        file_format = path.splitext(file_path)[1][1:].lower()
+        if file_format not in ['png', 'pdf', 'svg'] :
+            raise Exception('Unsupported figure file type: ' + file_path)
+        grid_figure = self.createGridFigure(parameter_data, region_masks, plot_settings)
+        FigureCanvasAgg(grid_figure['figure'])
+        grid_figure['figure'].savefig(file_path, format=file_format, dpi=plot_settings.get('dpi', 100))
+        return file_path
+
+    # Method renders grid plot figures off-screen, across worker processes when required
+    # Each figure request is a dictionary: { 'file_path' : str, 'parameter_data' : [grids], 'region_masks' : [masks], 'plot_settings' : {} }
+    # Colour maps are specified via plot settings colour_palette, reverse_colour_palette (optional) when rendered in worker processes
+    def renderGridFigures(self, figure_requests, processes=1) :
+        if processes > 1 and len(figure_requests) > 1 :
+            pool = Pool(processes)
+            try :
+                file_paths = pool.map(renderWorkerGridFigure, figure_requests)
+                pool.close()
+            except :
+                pool.terminate()
+                raise
+            finally :
+                pool.join()
+            return file_paths
+        else :
+            return [self.renderGridFigure(figure_request) for figure_request in figure_requests]
+
+    # Method renders a single grid plot figure request
+    def renderGridFigure(self, figure_request) :
+        plot_settings = figure_request['plot_settings'].copy()
+        if not plot_settings.has_key('colour_map') :
+            plot_settings['colour_map'] = self.getColourMap(plot_settings.get('colour_palette', self.colour_palettes[0]),
+                                                            reverse=plot_settings.get('reverse_colour_palette', False),
+                                                            zero_index=plot_settings.get('colour_scheme_boundaries_zero_index'))
+        return self.saveGridFigure(figure_request['file_path'], figure_request['parameter_data'], figure_request['region_masks'], plot_settings)
+
+# END PaleoclimateToolGridPlotter
+
+## Worker process grid plotter (figures are rendered in separate processes, each with its own basemap cache)
+
+worker_grid_plotter = None
+
+# Worker function renders a grid plot figure request
+def renderWorkerGridFigure(figure_request) :
+    global worker_grid_plotter
+    if worker_grid_plotter is None :
+        worker_grid_plotter = PaleoclimateToolGridPlotter()
+    return worker_grid_plotter.renderGridFigure(figure_request)
@@ -0,0 +1,88 @@
+# Python modules
+from time import localtime, strftime
+
+# Python extension modules (requires extension installation)
+import numpy as np
+from netCDF4 import Dataset
+
+## Paleoclimate Tool NetCDF Grid Writer
+## * Streams grid data (maps) into a single NetCDF file via one open file handle
+## * Uses an unlimited time dimension with (compressed) chunks of one map, so each grid is written as it arrives
+## * Maps time values to time indices via a dictionary
+## * Writes single precision (f4) grid data by default
+## * Reopens an existing file (append) to continue writing grids after its writer was closed
+class PaleoclimateToolNetCdfGridWriter :
+
+    # Initialise (creates the NetCDF file, or reopens an existing file when appending)
+    def __init__(self, file_path, variable_name, times, description=None, data_units=None, data_type='f4', grid_height=72, grid_width=144, append=False) :
+
+        # Time indices
+        self.time_index = dict([(time, i) for i, time in enumerate(times)])
+
+        # Times written
+        self.times_written = set()
+
+        # Reopen existing file: times written are those with (any) unmasked grid data
+        if append :
+            self.rootgrp = Dataset(file_path, 'a')
+            self.data = self.rootgrp.variables[variable_name]
+            file_times = [int(time) for time in self.rootgrp.variables['time'][:]]
+            if file_times != list(times) :
+                self.close()
+                raise Exception('NetCDF grid data file times do not match the times being generated: ' + file_path)
+            for i, time in enumerate(file_times) :
+                if i < self.data.shape[0] and not np.ma.getmaskarray(self.data[i]).all() :
+                    self.times_written.add(time)
+            return
+
+        # Create file
+        self.rootgrp = Dataset(file_path, 'w')
+        self.rootgrp.Conventions = 'CF-1.7'
+        self.rootgrp.title = str(variable_name)
+        self.rootgrp.institution = 'Global Ecology Lab'
+        self.rootgrp.source = 'https://github.com/GlobalEcologyLab/PaleoView'
+        self.rootgrp.history = '[' + strftime("%Y-%m-%d %H:%M", localtime()) + ']' + 'Created netCDF4 zlib=True dataset.'
+        self.rootgrp.description = str(description)
+        self.rootgrp.createDimension('time', None)
+        self.rootgrp.createDimension('lat', grid_height)
+        self.rootgrp.createDimension('lon', grid_width)
+        time = self.rootgrp.createVariable('time','i4',('time',))
+        time.units = '- years BP' # 'years since 1950-1-1' shifts out of sync over time
+        time.calendar = 'noleap'
+        time.axis = 'T'
+        time.long_name = 'time'
+        time.standard_name = 'time'
+        time[:] = times
+        latitude = self.rootgrp.createVariable('lat','f8',('lat',), zlib=True)
+        latitude.units = 'degrees_north'
+        latitude.axis = 'Y'
+        latitude.long_name = 'latitude'
+        latitude.standard_name = 'latitude'
+        latitude[:] = np.arange(88.75,-88.751,-2.5)
+        longitude = self.rootgrp.createVariable('lon','f8',('lon',), zlib=True)
+        longitude.units = 'degrees_east'
+        longitude.axis = 'X'
+        longitude.long_name = 'longitude'
+        longitude.standard_name = 'longitude'
+        longitude[:] = np.arange(-178.75,178.751,2.5)
+        self.data = self.rootgrp.createVariable(variable_name, data_type, ('time','lat','lon'), zlib=True, chunksizes=(1, grid_height, grid_width))
+        self.data.coordinates = 'time lat lon'
+        self.data.units = str(data_units)
+        self.data.long_name = variable_name.replace('_',' ').title()
+
+    # Method writes the (masked) grid data for a time
+    def writeGrid(self, masked_data, time) :
+        if not self.time_index.has_key(time) :
+            raise Exception('Time ' + str(time) + ' is not within the NetCDF grid data file times')
+        self.data[self.time_index[time]] = masked_data
+        self.times_written.add(time)
+
+    # Method checks if grids have been written for all times
+    def allGridsWritten(self) :
+        return len(self.times_written) == len(self.time_index)
+
+    # Method closes the file
+    def close(self) :
+        if self.rootgrp != None :
+            self.rootgrp.close()
+            self.rootgrp = None
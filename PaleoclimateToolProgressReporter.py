@@ -0,0 +1,85 @@
+# Python modules
+from threading import RLock
+from time import time
+
+## Paleoclimate Tool Progress Cancelled
+## * Raised by a refresh function to stop the long running operation reporting progress (eg. a cancelled view plot extraction)
+class PaleoclimateToolProgressCancelled(Exception) :
+    pass
+
+## Paleoclimate Tool Progress Reporter
+## * Reports the progress of long running operations (data generation, downloads) via named progress keys
+## * Applies progress to registered progress bars (eg. ttk Progressbar) and calls a refresh function (eg. GUI update)
+## * Rate limits the progress bar and refresh updates (at most 20 per second by default)
+## * Simply accumulates progress values when used without a GUI (eg. batch runs)
+class PaleoclimateToolProgressReporter :
+
+    # Initialise
+    def __init__(self, refresh_function=None, maximum_refresh_rate=20.0) :
+
+        # Refresh function and minimum time between refreshes (seconds)
+        self.refresh_function = refresh_function
+        self.minimum_refresh_interval = 1.0/maximum_refresh_rate
+        self.last_refresh_time = None
+
+        # Progress bars, progress and progress yet to be applied to the progress bars
+        self.progress_bars = {} # { key : progress bar }
+        self.progress = {} # { key : { 'value' : value, 'maximum' : maximum } }
+        self.pending_progress = {} # { key : value increment }
+
+        # Lock for progress reported from other threads
+        self.lock = RLock()
+
+    # Set the progress bar for a progress key (any object with 'value' and 'maximum' items)
+    def setProgressBar(self, key, progress_bar) :
+        self.progress_bars[key] = progress_bar
+
+    # Method starts (resets) the progress for a key, optionally setting its maximum
+    def startProgress(self, key, maximum=None) :
+        with self.lock :
+            self.progress[key] = { 'value' : 0, 'maximum' : maximum }
+            self.pending_progress.pop(key, None)
+            if self.progress_bars.has_key(key) :
+                self.progress_bars[key]['value'] = 0
+                if maximum != None :
+                    self.progress_bars[key]['maximum'] = maximum
+
+    # Set the progress maximum for a key
+    def setProgressMaximum(self, key, maximum) :
+        with self.lock :
+            self.progress.setdefault(key, { 'value' : 0, 'maximum' : None })['maximum'] = maximum
+            if self.progress_bars.has_key(key) :
+                self.progress_bars[key]['maximum'] = maximum
+
+    # Get the progress maximum for a key (None when not set)
+    def getProgressMaximum(self, key) :
+        return self.progress.get(key, { 'maximum' : None })['maximum']
+
+    # Get the progress value for a key
+    def getProgressValue(self, key) :
+        return self.progress.get(key, { 'value' : 0 })['value']
+
+    # Method adds progress to a key and refreshes when the minimum refresh interval has passed
+    # Progress added from other threads should not refresh (the refresh is left to the thread that owns the GUI)
+    def addProgress(self, key, value, refresh=True) :
+        with self.lock :
+            self.progress.setdefault(key, { 'value' : 0, 'maximum' : None })['value'] += value
+            self.pending_progress[key] = self.pending_progress.get(key, 0) + value
+        if refresh :
+            self.refresh()
+
+    # Method applies pending progress to the progress bars and calls the refresh function (at the limited rate unless forced)
+    # Exceptions raised by the refresh function (eg. a closed window, or PaleoclimateToolProgressCancelled) are passed on to the caller
+    def refresh(self, force=False) :
+        current_time = time()
+        if not force and self.last_refresh_time != None and (current_time - self.last_refresh_time) < self.minimum_refresh_interval :
+            return False
+        self.last_refresh_time = current_time
+        with self.lock :
+            for key, value in self.pending_progress.items() :
+                if self.progress_bars.has_key(key) :
+                    self.progress_bars[key]['value'] += value
+            self.pending_progress = {}
+        if self.refresh_function != None :
+            self.refresh_function()
+        return True
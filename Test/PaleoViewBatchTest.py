@@ -0,0 +1,97 @@
+# Python modules
+from os import listdir, makedirs, path
+from shutil import rmtree
+from subprocess import PIPE, Popen
+from tempfile import mkdtemp
+import json
+import sys
+
+# Python extension modules (requires extension installation)
+import numpy as np
+import pandas as pd
+
+## Batch run function
+
+# Run the batch program (as from the command line) with job files: returns the exit code, output and errors
+def runBatch(job_file_paths) :
+    process = Popen([sys.executable, batch_program_path] + job_file_paths, stdout=PIPE, stderr=PIPE)
+    output, errors = process.communicate()
+    return (process.returncode, output, errors)
+
+# Write a job file (JSON)
+def writeJobFile(job_file_path, job_file) :
+    f = open(job_file_path, 'w')
+    f.write(json.dumps(job_file))
+    f.close()
+
+## Main program
+
+# Tool directory and batch program
+tool_directory = path.abspath(path.join(path.dirname(path.abspath(__file__)), '..'))
+batch_program_path = path.join(tool_directory, 'paleo_view_batch.py')
+
+# Local (text file) mean temperature climate data generated from the sample grid: each year offset by the years from 1980 AD
+directory = mkdtemp()
+climate_data_directory = path.join(directory, 'Climate Data')
+output_directory = path.join(directory, 'Batch Output')
+makedirs(path.join(climate_data_directory, 'T'))
+sample_grid = np.genfromtxt(path.join(tool_directory, 'Test', 'DataFileTests', 'grid_data_1989.txt'))
+sample_grid[sample_grid == -9999] = 0.0
+climate_data_years_ad = range(1974, 1990)
+for year_ad in climate_data_years_ad :
+    for month_code in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L'] :
+        np.savetxt(path.join(climate_data_directory, 'T', 'Trace21_2.5x2.5_' + str(year_ad) + 'AD.1T' + month_code + '.txt'), sample_grid + (year_ad - 1980), fmt='%.3f')
+
+# Job file: map and series CSV files for 1979 AD and 1984 AD (10 year intervals)
+job_file_path = path.join(directory, 'job.json')
+writeJobFile(job_file_path, { 'climate_data_directory' : climate_data_directory, 'output_directory' : output_directory, 'climate_data_local_data_type' : 'text',
+                              'defaults' : { 'interval_step' : 5, 'interval_size' : 10 },
+                              'jobs' : [{ 'parameters' : ['temperature/mean-temperature'], 'regions' : ['globe'], 'periods' : [['1979AD', '1984AD']],
+                                          'data_type' : 'map', 'file_type' : 'csv' },
+                                        { 'parameters' : ['temperature/mean-temperature'], 'regions' : ['globe'], 'periods' : [['1979AD', '1984AD']],
+                                          'data_type' : 'series', 'file_type' : 'csv', 'statistics' : ['minimum', 'maximum'] }] })
+generation_directory = path.join(output_directory, 'Mean_Temperature_Annual_1979AD-1984AD_step5_size10_globe')
+
+# Expected grids: means of the years within each interval (5 years before until 4 years after)
+expected_grids = { 1979 : sample_grid + np.mean(range(1974, 1984)) - 1980, 1984 : sample_grid + np.mean(range(1979, 1989)) - 1980 }
+
+# TEST command line arguments
+print 'TEST command line arguments:'
+
+print '  Test 1: usage reported without job files'
+exit_code, output, errors = runBatch([])
+print '    Pass =', (exit_code == 2 and 'Usage: python paleo_view_batch.py job.yaml' in str(errors))
+
+print '  Test 2: job file run'
+exit_code, output, errors = runBatch([job_file_path])
+print '    Pass =', (exit_code == 0 and str(output).count('generated in') == 2 and not errors)
+
+# TEST generated files
+print 'TEST generated files:'
+
+print '  Test 3: grid and series data files within the job directory'
+print '    Pass =', (path.exists(generation_directory) and sorted(listdir(generation_directory)) == ['grid_data_1979AD.csv', 'grid_data_1984AD.csv', 'series_data.csv'])
+
+print '  Test 4: grids are the interval means of the climate data'
+print '    Pass =', (not [year_ad for year_ad in [1979, 1984]
+                          if not np.allclose(np.genfromtxt(path.join(generation_directory, 'grid_data_' + str(year_ad) + 'AD.csv'), delimiter=','), expected_grids[year_ad], atol=0.001)])
+
+print '  Test 5: series statistics for each year'
+series_data_frame = pd.read_csv(path.join(generation_directory, 'series_data.csv'))
+print '    Pass =', (list(series_data_frame.columns) == ['Year (AD)', 'Minimum', 'Maximum'] and list(series_data_frame['Year (AD)']) == [1979, 1984] and
+                     np.allclose(series_data_frame['Minimum'], [expected_grids[1979].min(), expected_grids[1984].min()], atol=0.001) and
+                     np.allclose(series_data_frame['Maximum'], [expected_grids[1979].max(), expected_grids[1984].max()], atol=0.001))
+
+# TEST failures
+print 'TEST failures:'
+
+print '  Test 6: failed jobs and missing job files reported, and the remaining jobs still run'
+rmtree(output_directory)
+failing_job_file_path = path.join(directory, 'failing_job.json')
+writeJobFile(failing_job_file_path, { 'climate_data_directory' : climate_data_directory, 'output_directory' : output_directory, 'climate_data_local_data_type' : 'text',
+                                      'jobs' : [{ 'parameters' : ['temperature/unknown-temperature'], 'regions' : ['globe'], 'periods' : [['1979AD', '1984AD']] }] })
+exit_code, output, errors = runBatch([path.join(directory, 'missing.json'), failing_job_file_path, job_file_path])
+print '    Pass =', (exit_code == 1 and 'missing.json failed' in str(errors) and 'Unknown parameter temperature/unknown-temperature' in str(errors) and
+                     str(output).count('generated in') == 2 and sorted(listdir(generation_directory)) == ['grid_data_1979AD.csv', 'grid_data_1984AD.csv', 'series_data.csv'])
+
+rmtree(directory)
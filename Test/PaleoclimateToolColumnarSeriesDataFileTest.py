@@ -0,0 +1,73 @@
+# Python modules
+from os import listdir, path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+# Python extension modules (requires extension installation)
+import numpy as np
+import pandas as pd
+
+# Tool library module
+from PaleoclimateToolDataFileHelper import PaleoclimateToolDataFileHelper
+
+## Main program
+
+# Create the Paleoclimate Tool Data File Helper
+data_helper = PaleoclimateToolDataFileHelper()
+directory = mkdtemp()
+data_helper.setFileGenerationDirectory(directory)
+
+# Series data frames (as generated by the tool)
+data_frame = pd.DataFrame({ 'Year (BP)' : [100, 80, 60], 'Mean' : [12.5, 12.75, 13.0], 'Minimum' : [-20.0, -19.5, -19.0] })[['Year (BP)', 'Mean', 'Minimum']]
+labelled_data_frame = pd.DataFrame({ 'Year' : ['20BP', '1950AD', '1989AD'], 'Mean' : [13.25, 13.5, 14.0] })[['Year', 'Mean']]
+
+# Parquet and Feather files require pandas 0.24 or later and pyarrow
+try :
+    data_helper.checkColumnarSeriesDataFileRequirements()
+    requirements_missing = None
+except Exception, e :
+    requirements_missing = str(e)
+
+# TEST createColumnarSeriesDataFrame
+print 'TEST createColumnarSeriesDataFrame:'
+
+print '  Test 1: integer years BP and AD, float values, description and units'
+columnar_data_frame = data_helper.createColumnarSeriesDataFrame(data_frame, description='Mean Temperature', data_units='degrees C')
+print '    Pass =', (list(columnar_data_frame.columns) == ['Year (BP)', 'Year (AD)', 'Mean', 'Minimum', 'Description', 'Units'] and
+                     [str(dtype) for dtype in columnar_data_frame.dtypes[:4]] == ['int64', 'int64', 'float64', 'float64'] and
+                     list(columnar_data_frame['Year (AD)']) == [1850, 1870, 1890] and list(columnar_data_frame['Units']) == ['degrees C']*3)
+
+print '  Test 2: year labels converted'
+columnar_data_frame = data_helper.createColumnarSeriesDataFrame(labelled_data_frame)
+print '    Pass =', (list(columnar_data_frame['Year (AD)']) == [1930, 1950, 1989] and list(columnar_data_frame['Year (BP)']) == [20, 0, -39] and
+                     list(columnar_data_frame.columns) == ['Year (BP)', 'Year (AD)', 'Mean'])
+
+# TEST generateSeriesDataFile (Parquet and Feather)
+print 'TEST generateSeriesDataFile (Parquet and Feather):'
+
+if requirements_missing :
+
+    print '  Tests 3-5: skipped (' + requirements_missing + ')'
+
+else :
+
+    print '  Test 3: Parquet file'
+    data_helper.generateSeriesDataFile(data_frame, 'parquet', month='jan', description='Mean Temperature', data_units='degrees C')
+    file_data_frame = pd.read_parquet(path.join(directory, 'series_data_jan.parquet'))
+    print '    Pass =', (file_data_frame.equals(data_helper.createColumnarSeriesDataFrame(data_frame, description='Mean Temperature', data_units='degrees C')))
+
+    print '  Test 4: Feather file'
+    data_helper.generateSeriesDataFile(data_frame, 'feather', description='Mean Temperature', data_units='degrees C')
+    file_data_frame = pd.read_feather(path.join(directory, 'series_data.feather'))
+    print '    Pass =', (file_data_frame.equals(data_helper.createColumnarSeriesDataFrame(data_frame, description='Mean Temperature', data_units='degrees C')))
+
+    print '  Test 5: Parquet dataset appended and partitioned'
+    dataset_path = path.join(directory, 'series_data.parquet')
+    data_helper.generateSeriesDataFile(data_frame, 'parquet', dataset_path=dataset_path, partition=[('parameter', 'mean_temperature'), ('region', 'globe')])
+    data_helper.generateSeriesDataFile(labelled_data_frame, 'parquet', dataset_path=dataset_path, partition=[('parameter', 'mean_temperature'), ('region', 'land')])
+    file_data_frame = pd.read_parquet(dataset_path)
+    print '    Pass =', (sorted(listdir(path.join(dataset_path, 'parameter=mean_temperature'))) == ['region=globe', 'region=land'] and
+                         len(file_data_frame) == 6 and sorted(file_data_frame['Year (AD)']) == [1850, 1870, 1890, 1930, 1950, 1989] and
+                         set(file_data_frame['region'].astype(str)) == set(['globe', 'land']))
+
+rmtree(directory)
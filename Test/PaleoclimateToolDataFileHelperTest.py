@@ -151,6 +151,97 @@ data_helper.setFileGenerationDirectory(path.join(current_tool_version_directory,
 ##values.extend(values_89)
 ##print '    Pass =', (np.array(values) == nongridded_data3).all()
 ##
+### TEST loadClimateDataIntervalGrids
+##print 'TEST loadClimateDataIntervalGrids:'
+##
+##print '  Test 1: mean temperature, 1980-9 AD, months A,B'
+##interval_grids1 = data_helper.loadClimateDataIntervalGrids(parameter='mean_temperature', interval_ad_from=1980, interval_ad_until=1989, month_indices=[0,1])
+##data_grids = []
+##for year_ad in range(1980, 1990) :
+##    data_grids.append(data_helper.loadClimateDataGrids(parameter='mean_temperature', year_ad=year_ad, month_indices=[0,1]))
+##print '    Pass =', (np.array(data_grids) == interval_grids1).all()
+##
+##print '  Test 2: maximum temperature, 1980-9 AD, months A,B,C,K,L (crossing years)'
+##interval_grids2 = data_helper.loadClimateDataIntervalGrids(parameter='maximum_temperature', interval_ad_from=1980, interval_ad_until=1989, month_indices=[0,1,2,10,11])
+##data_grids = []
+##for year_ad in range(1980, 1990) :
+##    data_grids.append(data_helper.loadClimateDataGrids(parameter='maximum_temperature', year_ad=year_ad, month_indices=[0,1,2,10,11]))
+##print '    Pass =', (np.array(data_grids) == interval_grids2).all()
+##
+##print '  Test 3: relative humidity, 1940-60 AD, months A,L with bias correction'
+##interval_grids3 = data_helper.loadClimateDataIntervalGrids(parameter='relative_humidity', interval_ad_from=1940, interval_ad_until=1960, month_indices=[0,11], correct_bias=True)
+##data_grids = []
+##for year_ad in range(1940, 1961) :
+##    data_grids.append(data_helper.loadClimateDataGrids(parameter='relative_humidity', year_ad=year_ad, month_indices=[0,11], correct_bias=True))
+##print '    Pass =', (np.array(data_grids).round(6) == interval_grids3.round(6)).all()
+##
+### TEST climate data cache
+##print 'TEST climate data cache:'
+##
+##print '  Test 1: mean temperature, overlapping 1960-79 AD and 1970-89 AD intervals'
+##data_helper.clearNetCdfDataCache()
+##data_helper.climate_data_cache.resetStatistics()
+##interval_grids1 = data_helper.loadClimateDataInterval(parameter='mean_temperature', from_year_ad=1960, until_year_ad=1979)
+##interval_grids2 = data_helper.loadClimateDataInterval(parameter='mean_temperature', from_year_ad=1970, until_year_ad=1989)
+##statistics = data_helper.getClimateDataCacheStatistics()
+##print '    Pass =', (interval_grids1[10:] == interval_grids2[:10]).all() and statistics['hits'] == 10 and statistics['misses'] == 30
+##
+##print '  Test 2: memory budget of 10 year grids'
+##data_helper.setClimateDataCacheMemoryBudget(10*interval_grids1[0].nbytes)
+##statistics = data_helper.getClimateDataCacheStatistics()
+##print '    Pass =', statistics['year_grids'] == 10 and statistics['evictions'] == 20 and data_helper.climate_data_cache.hasYearGrids('mean_temperature', 1989)
+##data_helper.setClimateDataCacheMemoryBudget(512*1024*1024)
+##
+### TEST loadClimateDataIntervalMeans
+##print 'TEST loadClimateDataIntervalMeans:'
+##
+##print '  Test 1: mean temperature, 1980-9 AD, months A,B,L (crossing years)'
+##interval_means1 = data_helper.loadClimateDataIntervalMeans(parameter='mean_temperature', interval_ad_from=1980, interval_ad_until=1989, month_indices=[0,1,11])
+##interval_grids = data_helper.loadClimateDataIntervalGrids(parameter='mean_temperature', interval_ad_from=1980, interval_ad_until=1989, month_indices=[0,1,11])
+##print '    Pass =', (interval_means1.round(6) == interval_grids.mean(0).round(6)).all()
+##
+##print '  Test 2: precipitation, 1940-60 AD, months A,B with bias correction'
+##interval_means2 = data_helper.loadClimateDataIntervalMeans(parameter='precipitation', interval_ad_from=1940, interval_ad_until=1960, month_indices=[0,1], correct_bias=True)
+##interval_grids = data_helper.loadClimateDataIntervalGrids(parameter='precipitation', interval_ad_from=1940, interval_ad_until=1960, month_indices=[0,1], correct_bias=True)
+##print '    Pass =', (interval_means2.round(6) == interval_grids.mean(0).round(6)).all()
+##
+##print '  Test 3: relative humidity with bias correction (not linear)'
+##print '    Pass =', data_helper.loadClimateDataIntervalMeans(parameter='relative_humidity', interval_ad_from=1940, interval_ad_until=1960, month_indices=[0,1], correct_bias=True) is None
+##
+### TEST loadClimateDataInterval via memory mapped data files
+##print 'TEST loadClimateDataInterval via memory mapped data files:'
+##
+##print '  Test 1: mean temperature, 1940-89 AD, all months'
+##interval_grids = data_helper.loadClimateDataInterval(parameter='mean_temperature', from_year_ad=1940, until_year_ad=1989)
+##data_helper.useMmapData(True)
+##data_helper.getCurrentMmapDataIntervals()
+##mmap_interval_grids = data_helper.loadClimateDataInterval(parameter='mean_temperature', from_year_ad=1940, until_year_ad=1989)
+##print '    Pass =', (interval_grids.astype(np.float32) == mmap_interval_grids.astype(np.float32)).all()
+##
+##print '  Test 2: mean temperature, 1965 AD, month C'
+##print '    Pass =', (data_helper.loadClimateDataGrid(parameter='mean_temperature', year_ad=1965, month_index=2) == mmap_interval_grids[25,2]).all()
+##data_helper.useMmapData(False)
+##
+### TEST compileExpression
+##print 'TEST compileExpression:'
+##
+##print '  Test 1: relative humidity bias correction calculation'
+##climate_data_grids = data_helper.loadClimateDataInterval(parameter='relative_humidity', from_year_ad=1980, until_year_ad=1989)
+##bias_correction_data_grids = data_helper.loadBiasCorrectionDataGrids('relative_humidity', range(12))
+##expression = data_helper.compileExpression(data_helper.bias_correction_calculation['relative_humidity'])
+##expression_values = { 'climate_data_grids' : climate_data_grids, 'bias_correction_data_grids' : bias_correction_data_grids }
+##print '    Pass =', np.allclose(expression.evaluate(expression_values), eval(data_helper.bias_correction_calculation['relative_humidity']), equal_nan=True)
+##
+##print '  Test 2: compiled once'
+##print '    Pass =', data_helper.compileExpression(data_helper.bias_correction_calculation['relative_humidity']) is expression
+##
+##print '  Test 3: unsupported syntax rejected'
+##try :
+##    data_helper.compileExpression('__import__("os").getcwd()')
+##    print '    Pass =', False
+##except Exception, e :
+##    print '    Pass =', True
+##
 ### TEST generateParameterDataInterval
 ##print 'TEST generateParameterDataInterval:'
 ##
@@ -276,6 +367,11 @@ data_helper.setFileGenerationDirectory(path.join(current_tool_version_directory,
 ##          'grid_mean' : [region_data.mean()], 'grid_stdev' : [region_data.std()],
 ##          'area_mean' : [area_average], 'area_stdev' : [np.sqrt(((area_average - region_data)**2*cos_lat).sum()/cos_lat.sum())] }
 ##print '  Pass =', grid_region_statistics == stats
+##data_grids = data_helper.loadClimateDataGrids(parameter='mean_temperature', year_ad=1989, month_indices=range(12))
+##region_masks = [region_mask, data_helper.loadRegionMask('land')]*6
+##stack_statistics = data_helper.calculateGridRegionStatistics(np.array(data_grids), np.array(region_masks))
+##grid_statistics = [data_helper.calculateGridRegionStatistics([data_grids[i]], [region_masks[i]]) for i in range(12)]
+##print '  Pass =', np.array([[np.allclose(stack_statistics[key][i], grid_statistics[i][key][0]) for key in stats.keys()] for i in range(12)]).all()
 ##
 ### TEST generateParameterData
 ##print 'TEST generateParameterData:'
@@ -596,6 +692,11 @@ data_helper.setFileGenerationDirectory(path.join(current_tool_version_directory,
 ##data_helper.setRegionMaskDirectory(path.join(current_tool_version_directory, 'Map Data'))
 ##print '    Pass =', len(region_mask_dict) == 211 and (keys == np.arange(0, 21001, 100)).all() and (region_mask_dict[11500] == region_mask).all()
 ##
+##print '  Test 3: time dependent mask via packed mask store'
+##mask_file = path.join(data_helper.region_mask_directory['path'], 'land-0-21KBP', '11505BP.Mask.txt')
+##region_mask = data_helper.loadRegionMask('ocean-0-21KBP', time_dependent=True, year=11505)
+##print '    Pass =', (region_mask == (np.genfromtxt(mask_file, delimiter=1) < 0.5)*1).all() and path.exists(path.join(data_helper.region_mask_directory['path'], data_helper.time_dependent_region_mask_store_file))
+##
 ### TEST loadBiasCorrectionDataGrids
 ##print 'TEST loadBiasCorrectionDataGrids:'
 ##directory = data_helper.bias_correction_directory['path']
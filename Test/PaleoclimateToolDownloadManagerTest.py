@@ -0,0 +1,121 @@
+# Python modules
+from os import listdir, path, urandom
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Thread
+import BaseHTTPServer
+import SocketServer
+import hashlib
+
+# Tool library module
+from PaleoclimateToolDownloadManager import PaleoclimateToolDownloadManager
+
+## Local HTTP stand-in server: serves files from memory with (optional) range requests, and can drop connections part way through a file
+
+class StandInHttpServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer) :
+    daemon_threads = True
+    files = {} # { name : content }
+    drop_after = {} # { name : bytes sent before the connection is dropped (once) }
+    ignore_range = False
+    requests = [] # (name, range header)
+
+class StandInHttpRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler) :
+    def log_message(self, *args) :
+        pass
+    def do_GET(self) :
+        name = self.path.lstrip('/')
+        self.server.requests.append((name, self.headers.getheader('Range')))
+        if not self.server.files.has_key(name) :
+            self.send_error(404)
+            return
+        content = self.server.files[name]
+        start = 0
+        if self.headers.getheader('Range') and not self.server.ignore_range :
+            start = int(self.headers.getheader('Range').replace('bytes=', '').split('-')[0])
+            if start >= len(content) :
+                self.send_response(416)
+                self.send_header('Content-Range', 'bytes */' + str(len(content)))
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes ' + str(start) + '-' + str(len(content)-1) + '/' + str(len(content)))
+        else :
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(content) - start))
+        self.end_headers()
+        if self.server.drop_after.has_key(name) :
+            self.wfile.write(content[start:self.server.drop_after.pop(name)])
+            return # connection closed before the content is complete
+        self.wfile.write(content[start:])
+
+## Main program
+
+# Start the local server
+server = StandInHttpServer(('127.0.0.1', 0), StandInHttpRequestHandler)
+server_thread = Thread(target=server.serve_forever)
+server_thread.daemon = True
+server_thread.start()
+server_url = 'http://127.0.0.1:' + str(server.server_address[1]) + '/'
+for i in range(4) :
+    server.files['file' + str(i) + '.nc'] = urandom(300000 + i*1000)
+
+# Create the Paleoclimate Tool Download Manager
+download_manager = PaleoclimateToolDownloadManager(threads=3, block_size=8192, retry_delay=0.1)
+directory = mkdtemp()
+
+# TEST downloadFiles
+print 'TEST downloadFiles:'
+
+print '  Test 1: concurrent downloads'
+progress = []
+results = download_manager.downloadFiles([{ 'url' : server_url + name, 'path' : path.join(directory, name) } for name in sorted(server.files.keys())], progress_function=progress.append)
+print '    Pass =', ([result['error'] for result in results] == [None]*4 and
+                     [open(path.join(directory, name), 'rb').read() == server.files[name] for name in sorted(server.files.keys())] == [True]*4 and
+                     not [name for name in listdir(directory) if name.endswith('.part')] and round(sum(progress), 6) == 4)
+
+print '  Test 2: dropped connection resumed via range request'
+server.requests[:] = []
+server.drop_after['file1.nc'] = 100000
+results = download_manager.downloadFiles([{ 'url' : server_url + 'file1.nc', 'path' : path.join(directory, 'file1.nc') }])
+print '    Pass =', (results[0]['error'] == None and open(path.join(directory, 'file1.nc'), 'rb').read() == server.files['file1.nc'] and
+                     server.requests == [('file1.nc', None), ('file1.nc', 'bytes=100000-')])
+
+print '  Test 3: partial file (from a previous run) resumed'
+server.requests[:] = []
+f = open(path.join(directory, 'file2.nc.part'), 'wb')
+f.write(server.files['file2.nc'][:50000])
+f.close()
+results = download_manager.downloadFiles([{ 'url' : server_url + 'file2.nc', 'path' : path.join(directory, 'file2.nc') }])
+print '    Pass =', (results[0]['error'] == None and open(path.join(directory, 'file2.nc'), 'rb').read() == server.files['file2.nc'] and
+                     server.requests == [('file2.nc', 'bytes=50000-')])
+
+print '  Test 4: complete partial file (range not satisfiable) renamed into place'
+f = open(path.join(directory, 'file3.nc.part'), 'wb')
+f.write(server.files['file3.nc'])
+f.close()
+results = download_manager.downloadFiles([{ 'url' : server_url + 'file3.nc', 'path' : path.join(directory, 'file3.nc') }])
+print '    Pass =', (results[0]['error'] == None and open(path.join(directory, 'file3.nc'), 'rb').read() == server.files['file3.nc'] and
+                     not path.exists(path.join(directory, 'file3.nc.part')))
+
+print '  Test 5: range ignored by the server (complete file written)'
+server.ignore_range = True
+f = open(path.join(directory, 'file0.nc.part'), 'wb')
+f.write('not part of the file')
+f.close()
+results = download_manager.downloadFiles([{ 'url' : server_url + 'file0.nc', 'path' : path.join(directory, 'file0.nc') }])
+print '    Pass =', (results[0]['error'] == None and open(path.join(directory, 'file0.nc'), 'rb').read() == server.files['file0.nc'])
+server.ignore_range = False
+
+print '  Test 6: checksums'
+results = download_manager.downloadFiles([{ 'url' : server_url + 'file1.nc', 'path' : path.join(directory, 'checked.nc'), 'checksum' : hashlib.md5(server.files['file1.nc']).hexdigest() },
+                                          { 'url' : server_url + 'file2.nc', 'path' : path.join(directory, 'mismatched.nc'), 'checksum' : hashlib.md5('').hexdigest() }])
+print '    Pass =', (results[0]['error'] == None and results[1]['error'] != None and
+                     not path.exists(path.join(directory, 'mismatched.nc')) and not path.exists(path.join(directory, 'mismatched.nc.part')))
+
+print '  Test 7: missing file reported (and not retried)'
+server.requests[:] = []
+results = download_manager.downloadFiles([{ 'url' : server_url + 'missing.nc', 'path' : path.join(directory, 'missing.nc') }])
+print '    Pass =', (results[0]['error'] != None and len(server.requests) == 1 and not path.exists(path.join(directory, 'missing.nc')))
+
+server.shutdown()
+rmtree(directory)
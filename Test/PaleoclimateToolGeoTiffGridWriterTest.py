@@ -0,0 +1,126 @@
+# Python modules
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import struct
+import zlib
+
+# Python extension modules (requires extension installation)
+import numpy as np
+
+# Tool library module
+from PaleoclimateToolGeoTiffGridWriter import PaleoclimateToolGeoTiffGridWriter
+
+## TIFF reader functions (struct and zlib only)
+
+# Read the image file directories (following the chain from the header) as { tag : values } dictionaries
+def readImageFileDirectories(content) :
+    field_formats = { 2 : ('s', 1), 3 : ('H', 2), 4 : ('I', 4), 12 : ('d', 8) }
+    byte_order, version, offset = struct.unpack('<2sHI', content[:8])
+    image_file_directories = []
+    while offset :
+        entry_count = struct.unpack('<H', content[offset:(offset+2)])[0]
+        image_file_directory = {}
+        for i in range(entry_count) :
+            entry_offset = offset + 2 + i*12
+            tag, field_type, count = struct.unpack('<HHI', content[entry_offset:(entry_offset+8)])
+            field_format, field_size = field_formats[field_type]
+            value_offset = entry_offset + 8
+            if count*field_size > 4 :
+                value_offset = struct.unpack('<I', content[value_offset:(value_offset+4)])[0]
+            value_bytes = content[value_offset:(value_offset + count*field_size)]
+            if field_format == 's' :
+                image_file_directory[tag] = value_bytes
+            else :
+                image_file_directory[tag] = list(struct.unpack('<' + str(count) + field_format, value_bytes))
+        image_file_directories.append(image_file_directory)
+        offset = struct.unpack('<I', content[(offset + 2 + entry_count*12):(offset + 6 + entry_count*12)])[0]
+    return (byte_order, version, image_file_directories)
+
+# Read a tile: inflate, undo the floating point predictor (sum the differences along each row then interleave the byte planes)
+def readTile(content, offset, byte_count, tile_size) :
+    differences = np.frombuffer(zlib.decompress(content[offset:(offset+byte_count)]), dtype=np.uint8).reshape(tile_size, tile_size*4)
+    byte_planes = np.cumsum(differences, axis=1, dtype=np.uint8)
+    return byte_planes.reshape(tile_size, 4, tile_size).transpose(0, 2, 1).copy().view('>f4').reshape(tile_size, tile_size)
+
+# Read a band from tiles
+def readBand(content, image_file_directory, band, tile_size) :
+    height, width = image_file_directory[257][0], image_file_directory[256][0]
+    tiles_down, tiles_across = (height + tile_size - 1)/tile_size, (width + tile_size - 1)/tile_size
+    data = np.empty((tiles_down*tile_size, tiles_across*tile_size), dtype='>f4')
+    for tile_row in range(tiles_down) :
+        for tile_col in range(tiles_across) :
+            tile_index = band*tiles_down*tiles_across + tile_row*tiles_across + tile_col
+            data[(tile_row*tile_size):((tile_row+1)*tile_size), (tile_col*tile_size):((tile_col+1)*tile_size)] = readTile(content, image_file_directory[324][tile_index], image_file_directory[325][tile_index], tile_size)
+    return data
+
+## Main program
+
+# Grid data: bands 0 and 2 written (with masked cells), band 1 left unwritten
+directory = mkdtemp()
+file_path = path.join(directory, 'grids.tif')
+grids = [np.ma.masked_array(np.arange(72*144, dtype=float).reshape(72, 144)/10.0, mask=np.zeros((72, 144), dtype=bool)),
+         None,
+         np.ma.masked_array(np.random.rand(72, 144)*30.0 - 10.0, mask=(np.random.rand(72, 144) > 0.7))]
+grids[0].mask[0:10,0:20] = True
+
+# Create the Paleoclimate Tool GeoTIFF Grid Writer
+grid_writer = PaleoclimateToolGeoTiffGridWriter(file_path, [1000, 1010, 1020], description='Mean Temperature', data_units='degrees C', tile_size=64)
+grid_writer.writeGrid(grids[0], 1000, band_label='950 BP')
+grid_writer.writeGrid(grids[2], 1020, band_label='930 BP')
+all_grids_written = grid_writer.allGridsWritten()
+grid_writer.close()
+content = open(file_path, 'rb').read()
+byte_order, version, image_file_directories = readImageFileDirectories(content)
+
+# TEST header and image file directories
+print 'TEST header and image file directories:'
+
+print '  Test 1: little endian header, and incomplete bands reported'
+print '    Pass =', (byte_order == 'II' and version == 42 and not all_grids_written)
+
+print '  Test 2: full resolution image then overviews (halved until within a single tile)'
+print '    Pass =', ([(ifd[256][0], ifd[257][0], ifd[254][0]) for ifd in image_file_directories] == [(144, 72, 0), (72, 36, 1), (36, 18, 1)])
+
+print '  Test 3: tiled, Deflate compression, floating point predictor, separate planes, 32 bit floating point samples'
+print '    Pass =', (not [ifd for ifd in image_file_directories if not (ifd[259] == [8] and ifd[317] == [3] and ifd[284] == [2] and ifd[322] == [64] and ifd[323] == [64] and
+                                                                    ifd[277] == [3] and ifd[258] == [32]*3 and ifd[339] == [3]*3 and ifd[338] == [0]*2)])
+
+print '  Test 4: tile offsets and byte counts for each tile of each band'
+print '    Pass =', ([(len(ifd[324]), len(ifd[325])) for ifd in image_file_directories] == [(3*2*3, 3*2*3), (2*1*3, 2*1*3), (1*1*3, 1*1*3)] and
+                     not [offset for ifd in image_file_directories for offset, byte_count in zip(ifd[324], ifd[325]) if byte_count and offset + byte_count > len(content)])
+
+print '  Test 5: unwritten band has zero tile offsets and byte counts (read as no data)'
+print '    Pass =', (not [ifd for ifd in image_file_directories if sum(ifd[324][(len(ifd[324])/3):(2*len(ifd[324])/3)] + ifd[325][(len(ifd[325])/3):(2*len(ifd[325])/3)]) != 0] and
+                     not [ifd for ifd in image_file_directories if 0 in ifd[325][:(len(ifd[325])/3)] + ifd[325][(2*len(ifd[325])/3):]])
+
+print '  Test 6: georeferencing (WGS84, 2.5 degree pixels from 180W 90N), description and no data on the full resolution image'
+print '    Pass =', (image_file_directories[0][33550] == [2.5, 2.5, 0.0] and image_file_directories[0][33922] == [0.0, 0.0, 0.0, -180.0, 90.0, 0.0] and
+                     image_file_directories[0][34735][12:16] == [2048, 0, 1, 4326] and image_file_directories[0][270] == 'Mean Temperature\0' and
+                     not [ifd for ifd in image_file_directories if ifd[42113] != '-9999\0'])
+
+print '  Test 7: band descriptions and units within the GDAL metadata'
+gdal_metadata = image_file_directories[0][42112]
+print '    Pass =', ('<Item name="DESCRIPTION" sample="0" role="description">950 BP</Item>' in gdal_metadata and
+                     '<Item name="DESCRIPTION" sample="2" role="description">930 BP</Item>' in gdal_metadata and
+                     '<Item name="DESCRIPTION" sample="1" role="description">1010</Item>' in gdal_metadata and
+                     gdal_metadata.count('role="unittype">degrees C</Item>') == 3)
+
+# TEST tiles
+print 'TEST tiles:'
+
+print '  Test 8: full resolution tiles decompressed with the predictor undone match the grids (masked cells as no data)'
+band_data = [readBand(content, image_file_directories[0], band, 64) for band in [0, 2]]
+print '    Pass =', (not [band for band, data in zip([0, 2], band_data) if not np.allclose(data[:72,:144], grids[band].astype(np.float32).filled(-9999.0))])
+
+print '  Test 9: tiles padded with no data beyond the grid'
+print '    Pass =', ((band_data[0][72:,:] == -9999.0).all() and (band_data[0][:,144:] == -9999.0).all())
+
+print '  Test 10: overviews are the means of the valid values within each 2 x 2 block'
+overview_data = readBand(content, image_file_directories[1], 0, 64)
+full_data = np.ma.masked_equal(band_data[0][:72,:144].astype(float), -9999.0)
+expected_data = full_data.reshape(36, 2, 72, 2).mean(axis=3).mean(axis=1) # equal weighting only matches where the blocks are fully valid or fully masked
+print '    Pass =', (np.allclose(overview_data[:36,:72][~expected_data.mask], expected_data.compressed()) and
+                     (overview_data[:5,:10] == -9999.0).all() and (overview_data[36:,:] == -9999.0).all())
+
+rmtree(directory)
@@ -0,0 +1,62 @@
+# Python modules
+import copy
+
+# Python extension modules (requires extension installation)
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Tool library module
+from PaleoclimateToolGridPlotter import PaleoclimateToolGridPlotter
+
+## Main program
+
+# Create the Paleoclimate Tool Grid Plotter
+grid_plotter = PaleoclimateToolGridPlotter()
+region_box = grid_plotter.region_bounding_box['globe']
+basemap_settings = grid_plotter.resolveRegionBasemapSettings('globe', region_box)
+
+# Figure with two plot axes (off-screen)
+figure = Figure(figsize=(8, 4))
+canvas = FigureCanvasAgg(figure)
+plot_axes = [figure.add_subplot(1, 2, 1), figure.add_subplot(1, 2, 2)]
+
+# Grid data (with cell edge latitudes and longitudes)
+lons, lats = np.meshgrid(np.arange(-180, 182.5, 2.5), np.arange(90, -92.5, -2.5))
+grid = np.ma.masked_array(np.random.rand(72, 144)*30.0, mask=np.zeros((72, 144), dtype=bool))
+
+# TEST getBasemap
+print 'TEST getBasemap:'
+
+print '  Test 1: basemap created once for each region box, resolution and projection'
+basemaps = [grid_plotter.getBasemap(axes, region_box, basemap_settings['resolution'], basemap_settings['projection'], basemap_settings['bounding_lat']) for axes in plot_axes]
+cached_basemap = grid_plotter.cached_basemaps.values()[0]
+print '    Pass =', (len(grid_plotter.cached_basemaps) == 1 and basemaps[0] is not cached_basemap and basemaps[1] is not cached_basemap and
+                     basemaps[0].coastsegs is cached_basemap.coastsegs) # processed coastlines shared
+
+print '  Test 2: each copy is bound to its own axes'
+print '    Pass =', (basemaps[0].ax is plot_axes[0] and basemaps[1].ax is plot_axes[1] and cached_basemap.ax is not plot_axes[0] and cached_basemap.ax is not plot_axes[1])
+
+print '  Test 3: drawing on the copies does not modify the cached basemap'
+cached_attributes = dict(cached_basemap.__dict__)
+cached_initialized_axes = copy.copy(getattr(cached_basemap, '_initialized_axes', None))
+for basemap in basemaps :
+    basemap.drawmapboundary(fill_color='0.3')
+    basemap.pcolor(lons, lats, grid, shading='flat', latlon=True)
+    basemap.drawcoastlines()
+    basemap.drawparallels(np.arange(-90, 91, 30))
+canvas.draw()
+print '    Pass =', (sorted(cached_basemap.__dict__.keys()) == sorted(cached_attributes.keys()) and
+                     not [key for key, value in cached_basemap.__dict__.items() if value is not cached_attributes[key]] and
+                     getattr(cached_basemap, '_initialized_axes', None) == cached_initialized_axes)
+
+print '  Test 4: axes limits set for each copy'
+print '    Pass =', (not [basemap for basemap in basemaps if basemap.ax.get_xlim() != (basemap.llcrnrx, basemap.urcrnrx) or basemap.ax.get_ylim() != (basemap.llcrnry, basemap.urcrnry)])
+
+print '  Test 5: cached basemap reused for new axes, and a separate basemap cached for another resolution'
+figure.clf()
+reused_basemap = grid_plotter.getBasemap(figure.add_subplot(1, 1, 1), region_box, basemap_settings['resolution'], basemap_settings['projection'], basemap_settings['bounding_lat'])
+other_resolution = [resolution for resolution in ['c', 'l'] if resolution != basemap_settings['resolution']][0]
+other_basemap = grid_plotter.getBasemap(figure.gca(), region_box, other_resolution, basemap_settings['projection'], basemap_settings['bounding_lat'])
+print '    Pass =', (len(grid_plotter.cached_basemaps) == 2 and reused_basemap.coastsegs is cached_basemap.coastsegs and
+                     getattr(reused_basemap, '_initialized_axes', set()) == set() and other_basemap.resolution == other_resolution)
@@ -0,0 +1,63 @@
+# Python modules
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+# Python extension modules (requires extension installation)
+import numpy as np
+from netCDF4 import Dataset
+
+# Tool library module
+from PaleoclimateToolNetCdfGridWriter import PaleoclimateToolNetCdfGridWriter
+
+## Main program
+
+# Grid data for four times (with masked cells)
+directory = mkdtemp()
+file_path = path.join(directory, 'grids.nc')
+times = [-1000, -990, -980, -970]
+grids = [np.ma.masked_array(np.random.rand(72, 144)*30.0, mask=(np.random.rand(72, 144) > 0.8)) for time in times]
+
+# TEST write, reopen and append
+print 'TEST write, reopen and append:'
+
+print '  Test 1: first grids written then the file closed (eg. after a data extraction error)'
+grid_writer = PaleoclimateToolNetCdfGridWriter(file_path, 'mean_temperature', times, description='Mean Temperature', data_units='degrees C')
+grid_writer.writeGrid(grids[0], times[0])
+grid_writer.writeGrid(grids[1], times[1])
+all_grids_written = grid_writer.allGridsWritten()
+grid_writer.close()
+print '    Pass =', (not all_grids_written and grid_writer.times_written == set(times[:2]))
+
+print '  Test 2: reopened file (append) rebuilds the times written from the existing grids'
+grid_writer = PaleoclimateToolNetCdfGridWriter(file_path, 'mean_temperature', times, append=True)
+print '    Pass =', (grid_writer.times_written == set(times[:2]) and not grid_writer.allGridsWritten())
+
+print '  Test 3: remaining grids appended'
+grid_writer.writeGrid(grids[2], times[2])
+grid_writer.writeGrid(grids[3], times[3])
+all_grids_written = grid_writer.allGridsWritten()
+grid_writer.close()
+rootgrp = Dataset(file_path, 'r')
+print '    Pass =', (all_grids_written and list(rootgrp.variables['time'][:]) == times and rootgrp.description == 'Mean Temperature' and
+                     not [i for i, grid in enumerate(grids) if not (np.allclose(rootgrp.variables['mean_temperature'][i].filled(-1.0), grid.astype(np.float32).filled(-1.0)) and
+                                                                    (np.ma.getmaskarray(rootgrp.variables['mean_temperature'][i]) == grid.mask).all())])
+rootgrp.close()
+
+print '  Test 4: reopening with different times is an error'
+try :
+    grid_writer = PaleoclimateToolNetCdfGridWriter(file_path, 'mean_temperature', times[:3], append=True)
+    print '    Pass =', False
+except Exception, e :
+    print '    Pass =', ('times do not match' in str(e))
+
+print '  Test 5: times outside the file are an error'
+grid_writer = PaleoclimateToolNetCdfGridWriter(file_path, 'mean_temperature', times, append=True)
+try :
+    grid_writer.writeGrid(grids[0], -960)
+    print '    Pass =', False
+except Exception, e :
+    print '    Pass =', (grid_writer.allGridsWritten() and 'not within' in str(e))
+grid_writer.close()
+
+rmtree(directory)
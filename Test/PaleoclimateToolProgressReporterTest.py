@@ -0,0 +1,83 @@
+# Python modules
+from threading import Thread
+from time import sleep
+
+# Tool library module
+from PaleoclimateToolProgressReporter import PaleoclimateToolProgressCancelled, PaleoclimateToolProgressReporter
+
+## Main program
+
+# Refresh function records each refresh
+refreshes = []
+def refresh() :
+    refreshes.append(progress_bar['value'])
+
+# Progress bar stand-in (as for a ttk Progressbar: 'value' and 'maximum' items)
+progress_bar = { 'value' : 0, 'maximum' : 100 }
+
+# Create the Paleoclimate Tool Progress Reporter (at most 20 refreshes per second)
+progress_reporter = PaleoclimateToolProgressReporter(refresh_function=refresh, maximum_refresh_rate=20.0)
+progress_reporter.setProgressBar('generation', progress_bar)
+
+# TEST startProgress and addProgress
+print 'TEST startProgress and addProgress:'
+
+print '  Test 1: progress started with a maximum (progress bar reset)'
+progress_bar['value'] = 50
+progress_reporter.startProgress('generation', maximum=1000)
+print '    Pass =', (progress_bar == { 'value' : 0, 'maximum' : 1000 } and progress_reporter.getProgressMaximum('generation') == 1000 and
+                     progress_reporter.getProgressValue('generation') == 0)
+
+print '  Test 2: rapid progress refreshes once within the minimum refresh interval'
+for i in range(100) :
+    progress_reporter.addProgress('generation', 1)
+print '    Pass =', (len(refreshes) == 1 and refreshes[0] == 1 and progress_reporter.getProgressValue('generation') == 100)
+
+print '  Test 3: pending progress applied to the progress bar on the next refresh'
+sleep(0.06)
+progress_reporter.addProgress('generation', 1)
+print '    Pass =', (len(refreshes) == 2 and progress_bar['value'] == 101 and progress_reporter.getProgressValue('generation') == 101)
+
+print '  Test 4: forced refresh within the minimum refresh interval'
+progress_reporter.addProgress('generation', 4, refresh=False)
+refreshed = progress_reporter.refresh(force=True)
+print '    Pass =', (refreshed and len(refreshes) == 3 and progress_bar['value'] == 105)
+
+print '  Test 5: progress without a progress bar (eg. batch runs) accumulated'
+progress_reporter.startProgress('conversion')
+progress_reporter.addProgress('conversion', 2.5, refresh=False)
+progress_reporter.addProgress('conversion', 2.5, refresh=False)
+print '    Pass =', (progress_reporter.getProgressValue('conversion') == 5.0 and progress_reporter.getProgressMaximum('conversion') == None)
+
+# TEST progress from other threads
+print 'TEST progress from other threads:'
+
+print '  Test 6: progress added concurrently (without refreshing) is not lost'
+progress_reporter.startProgress('generation', maximum=8*5000)
+refreshes[:] = []
+def addThreadProgress() :
+    for i in range(5000) :
+        progress_reporter.addProgress('generation', 1, refresh=False)
+threads = [Thread(target=addThreadProgress) for i in range(8)]
+for thread in threads :
+    thread.start()
+while [thread for thread in threads if thread.isAlive()] :
+    progress_reporter.refresh()
+for thread in threads :
+    thread.join()
+progress_reporter.refresh(force=True)
+print '    Pass =', (progress_reporter.getProgressValue('generation') == 8*5000 and progress_bar['value'] == 8*5000 and
+                     refreshes == sorted(refreshes) and refreshes[-1] == 8*5000)
+
+# TEST cancellation
+print 'TEST cancellation:'
+
+print '  Test 7: exceptions raised by the refresh function passed on to the caller (with the progress retained)'
+def cancel() :
+    raise PaleoclimateToolProgressCancelled()
+cancelling_progress_reporter = PaleoclimateToolProgressReporter(refresh_function=cancel)
+try :
+    cancelling_progress_reporter.addProgress('generation', 1)
+    print '    Pass =', False
+except PaleoclimateToolProgressCancelled :
+    print '    Pass =', (cancelling_progress_reporter.getProgressValue('generation') == 1)
@@ -0,0 +1,550 @@
+# Python modules
+import json
+import sys
+from os import getcwd, path
+from time import time
+
+# Python extension modules (requires extension installation)
+import numpy as np
+import pandas as pd
+try :
+    import yaml # optional: job files may be JSON when not installed
+except ImportError :
+    yaml = None
+
+# Tool library modules
+from PaleoclimateToolDataFileHelper import PaleoclimateToolDataFileHelper
+try :
+    from PaleoclimateToolGridPlotter import PaleoclimateToolGridPlotter # optional: map figures require Matplotlib and Basemap
+except ImportError :
+    PaleoclimateToolGridPlotter = None
+
+## PaleoView Batch
+## * Generates grid (map) and series data files without the GUI from a job file (YAML or JSON)
+## * Runs every combination of the parameters, regions and periods listed for each job
+## * Reuses the climate data (year grid) cache and region masks across jobs
+## * Optionally renders map figures (PNG, PDF or SVG) off-screen, across the worker processes, once all jobs have run
+## * Appends Parquet series data to a single dataset (series_data.parquet in the output directory) partitioned by parameter, region and months
+##
+## Example job file (YAML):
+##   climate_data_directory : C:/PaleoView/Climate Data
+##   output_directory : C:/PaleoView/Batch Output
+##   processes : 4                    # optional: worker processes for generating map grids
+##   defaults :
+##     data_type : map                # map or series
+##     file_type : csv                # csv, ascii, esri_ascii, netcdf or geotiff (maps), or csv, ascii, netcdf, parquet or feather (series)
+##     interval_step : 100
+##     interval_size : 100
+##   jobs :
+##     - parameters : [temperature/mean-temperature, precipitation/mean-precipitation]
+##       regions : [globe, land-0-21KBP]
+##       periods : [[21000BP, 0BP]]
+##       months : DJF                 # annual, a season (DJF, MAM, JJA, SON), a list of month names, or all (series only)
+##       delta_reference : 1989AD     # optional
+##       delta_as_percent : false
+##       correct_bias : true
+##       figure_type : png            # optional (maps only): png, pdf or svg figures of the grids
+##       maps_per_figure : 20
+##       map_colour_scheme : fixed_range # fixed_range or 90%_range
+##       map_colour_palette : rainbow # rainbow, red_blue, ar4 or extended_red_blue (requires zero boundary)
+##       reverse_map_colour_palette : false
+##       map_colour_zero_boundary : false
+##       contoured_maps : true
+class PaleoViewBatch :
+
+    # Initialise
+    def __init__(self, tool_directory=getcwd()) :
+
+        # Create the Paleoclimate data file helper (no GUI)
+        self.data_file_helper = PaleoclimateToolDataFileHelper()
+
+        # Default directories
+        self.tool_directory = tool_directory
+        self.region_mask_directory = path.join(tool_directory, 'Map Data')
+        self.bias_correction_directory = path.join(tool_directory, 'Bias Corrections')
+
+        # Month names and seasons
+        self.month_names = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+        self.time_unit_seasons_month_indices = { 'DJF' : [0,1,11], 'MAM' : [2,3,4], 'JJA' : [5,6,7], 'SON' : [8,9,10] }
+
+        # Job defaults
+        self.job_defaults = { 'data_type' : 'map', 'file_type' : 'csv', 'interval_step' : 10, 'interval_size' : 10,
+                              'months' : 'annual', 'delta_reference' : None, 'delta_as_percent' : False, 'correct_bias' : False,
+                              'statistics' : ['minimum', 'percentile_5th', 'percentile_50th', 'percentile_95th', 'maximum', 'area_mean'],
+                              'figure_type' : None, 'maps_per_figure' : 20, 'map_colour_scheme' : 'fixed_range', 'map_colour_palette' : 'rainbow',
+                              'reverse_map_colour_palette' : False, 'map_colour_zero_boundary' : False, 'contoured_maps' : True }
+        self.data_file_type_keys = ['csv', 'ascii', 'esri_ascii', 'netcdf', 'geotiff', 'parquet', 'feather']
+        self.data_file_types_for_data_type = { 'map' : ['csv', 'ascii', 'esri_ascii', 'netcdf', 'geotiff'],
+                                               'series' : ['csv', 'ascii', 'netcdf', 'parquet', 'feather'] }
+        self.columnar_data_file_type_keys = ['parquet', 'feather'] # include all grid region statistics
+        self.series_dataset_name = 'series_data.parquet'
+        self.figure_type_keys = ['png', 'pdf', 'svg']
+
+        # Parameter unit strings
+        self.parameter_unit_string = { 'temperature' : {}, 'precipitation' : {}, 'humidity' : {}, 'sea-level-pressure' : {} }
+        for parameter in ['mean-temperature', 'minimum-temperature', 'maximum-temperature', 'diurnal-temperature-range', 'annual-temperature-range'] :
+            self.parameter_unit_string['temperature'][parameter] = 'degrees C'
+        for parameter in ['isothermality', 'temperature-seasonality'] :
+            self.parameter_unit_string['temperature'][parameter] = ''
+        self.parameter_unit_string['precipitation']['mean-precipitation'] = 'mm/day'
+        self.parameter_unit_string['precipitation']['precipitation-seasonality'] = ''
+        self.parameter_unit_string['humidity']['specific-humidity'] = 'gm/kg'
+        self.parameter_unit_string['humidity']['relative-humidity'] = '%'
+        self.parameter_unit_string['sea-level-pressure']['sea-level-pressure'] = 'hPa'
+
+        # Grid region statistics keys and names
+        self.grid_region_statistics_keys = ['minimum', 'percentile_5th', 'percentile_25th', 'percentile_50th', 'percentile_75th', 'percentile_95th', 'maximum',
+                                            'grid_mean', 'grid_stdev', 'area_mean', 'area_stdev']
+        self.grid_region_statistics_names = { 'minimum' : 'Minimum',
+                                              'percentile_5th' : '5th Percentile',
+                                              'percentile_25th' : 'Q1',
+                                              'percentile_50th' : 'Median',
+                                              'percentile_75th' : 'Q3',
+                                              'percentile_95th' : '95th Percentile',
+                                              'maximum' : 'Maximum',
+                                              'grid_mean' : 'Mean (grid)',
+                                              'grid_stdev' : 'Stdev (grid)',
+                                              'area_mean' : 'Area Mean',
+                                              'area_stdev' : 'Area Stdev' }
+
+        # Time dependent regions
+        self.time_dependent_regions = ['land-0-21KBP', 'ocean-0-21KBP']
+
+        # Worker processes utilised for generating map grids
+        self.processes = 1
+
+        # Cached region masks (reused across jobs)
+        self.cached_region_masks = {} # { region : mask } or { region : { year : mask } } for time dependent regions
+
+        # Grid plotter (created when map figures are first required) and figures to be rendered once all jobs have run
+        self.grid_plotter = None
+        self.figure_requests = []
+
+    # Method loads a job file (YAML or JSON)
+    def loadJobFile(self, job_file_path) :
+        f = open(job_file_path)
+        content = f.read()
+        f.close()
+        if job_file_path.lower().endswith('.json') :
+            return json.loads(content)
+        elif yaml :
+            return yaml.safe_load(content)
+        else :
+            try :
+                return json.loads(content)
+            except Exception, e :
+                raise Exception('Could not read job file ' + job_file_path + ' (YAML job files require the PyYAML module)\n' + str(e))
+
+    # Method configures the data file helper from the job file settings
+    def configureDataFileHelper(self, job_file) :
+        if not job_file.has_key('climate_data_directory') :
+            raise Exception('The job file requires a climate_data_directory')
+        self.data_file_helper.setClimateDataSource('local')
+        self.data_file_helper.setClimateDataDirectory(job_file['climate_data_directory'])
+        self.data_file_helper.setRegionMaskDirectory(job_file.get('region_mask_directory', self.region_mask_directory))
+        self.data_file_helper.setBiasCorrectionDirectory(job_file.get('bias_correction_directory', self.bias_correction_directory))
+        local_data_type = job_file.get('climate_data_local_data_type', 'netcdf')
+        self.data_file_helper.useNetCdfData(use=(local_data_type in ['netcdf', 'mmap']))
+        self.data_file_helper.useMmapData(use=(local_data_type == 'mmap'))
+        if job_file.has_key('climate_data_cache_memory_budget') :
+            self.data_file_helper.setClimateDataCacheMemoryBudget(int(job_file['climate_data_cache_memory_budget']))
+        if job_file.has_key('use_cumulative_sum_index') :
+            self.data_file_helper.useCumulativeSumIndex(use=bool(job_file['use_cumulative_sum_index']))
+        if job_file.has_key('parameter_loading_threads') :
+            self.data_file_helper.setParameterLoadingThreads(int(job_file['parameter_loading_threads']))
+        self.processes = int(job_file.get('processes', 1))
+
+    # Method runs all the jobs in a job file: returns the number of failed job combinations
+    def runJobFile(self, job_file_path) :
+        job_file = self.loadJobFile(job_file_path)
+        self.configureDataFileHelper(job_file)
+        output_directory = job_file.get('output_directory', path.join(self.tool_directory, 'Batch Output'))
+        defaults = self.job_defaults.copy()
+        defaults.update(job_file.get('defaults', {}))
+        failures = 0
+        for job_number, job in enumerate(job_file.get('jobs', [])) :
+            job_settings = defaults.copy()
+            job_settings.update(job)
+            for combination in self.expandJobCombinations(job_settings) :
+                start_time = time()
+                try :
+                    generation_directory = self.runJob(combination, output_directory)
+                    print 'Job', (job_number + 1), ':', combination['name'], 'generated in', generation_directory, ('(%.1fs)' % (time() - start_time))
+                except Exception, e :
+                    failures += 1
+                    print >> sys.stderr, 'Job', (job_number + 1), ':', combination['name'], 'failed:', e
+                # Close any grid data file left open by a failed job
+                self.data_file_helper.closeGridDataFileWriter()
+                # Close data files, but retain the year grid and delta reference caches for subsequent jobs
+                self.data_file_helper.clearNetCdfDataCache(retain_year_grids=True)
+        self.data_file_helper.clearNetCdfDataCache()
+        failures += self.renderFigures()
+        return failures
+
+    # Method renders the map figures collected from the jobs (across worker processes when utilised): returns the number of failures
+    def renderFigures(self) :
+        figure_requests = self.figure_requests
+        self.figure_requests = []
+        if not figure_requests :
+            return 0
+        start_time = time()
+        try :
+            self.grid_plotter.renderGridFigures(figure_requests, processes=self.processes)
+            print len(figure_requests), 'map figures rendered', ('(%.1fs)' % (time() - start_time))
+            return 0
+        except Exception, e :
+            print >> sys.stderr, 'Map figure rendering failed:', e
+            return len(figure_requests)
+
+    # Method expands job settings into each parameter, region and period combination
+    def expandJobCombinations(self, job_settings) :
+        combinations = []
+        parameters = job_settings.get('parameters', [job_settings.get('parameter')])
+        regions = job_settings.get('regions', [job_settings.get('region', 'globe')])
+        periods = job_settings.get('periods', [job_settings.get('period')])
+        for parameter in parameters :
+            for region in regions :
+                for period in periods :
+                    if not (parameter and region and period) :
+                        raise Exception('Each job requires parameters, regions and periods')
+                    combination = job_settings.copy()
+                    [combination['parameter_group_code'], combination['parameter_code']] = parameter.split('/')
+                    combination['region'] = region
+                    combination['period'] = [str(period[0]), str(period[1])]
+                    combination['name'] = parameter + ' ' + region + ' ' + combination['period'][0] + '-' + combination['period'][1]
+                    if job_settings.has_key('name') :
+                        combination['name'] = job_settings['name'] + ': ' + combination['name']
+                    combinations.append(combination)
+        return combinations
+
+    # Method converts a year label (eg. 21000BP or 1989AD) into an AD year and postfix
+    def convertYearLabel(self, year_label) :
+        year_label = str(year_label).upper().replace(' ', '')
+        if year_label.endswith('BP') :
+            return { 'year_ad' : (1950 - int(year_label[:-2])), 'year' : int(year_label[:-2]), 'postfix' : 'BP' }
+        elif year_label.endswith('AD') :
+            return { 'year_ad' : int(year_label[:-2]), 'year' : int(year_label[:-2]), 'postfix' : 'AD' }
+        else :
+            raise Exception('Year ' + year_label + ' requires a BP or AD postfix')
+
+    # Method resolves the month indices (and whether all months are generated separately) for a months setting
+    def resolveMonthIndices(self, months) :
+        if months == 'all' :
+            return { 'month_indices' : range(12), 'all_months' : True, 'label' : 'All Months' }
+        elif months == 'annual' :
+            return { 'month_indices' : range(12), 'all_months' : False, 'label' : 'Annual' }
+        elif self.time_unit_seasons_month_indices.has_key(str(months)) :
+            return { 'month_indices' : self.time_unit_seasons_month_indices[months], 'all_months' : False, 'label' : months }
+        else :
+            if type(months) != list :
+                months = [months]
+            month_indices = []
+            for month in months :
+                if str(month).title() in self.month_names :
+                    month_indices.append(self.month_names.index(str(month).title()))
+                else :
+                    raise Exception('Unknown month ' + str(month))
+            return { 'month_indices' : month_indices, 'all_months' : False, 'label' : '-'.join([self.month_names[i][:3] for i in month_indices]) }
+
+    # Method loads (cached) region mask, including each time dependent mask year required for the interval years
+    def loadRegionMask(self, region, interval_years_ad) :
+        if region in self.time_dependent_regions :
+            if not self.cached_region_masks.has_key(region) :
+                self.cached_region_masks[region] = {}
+            for year_ad in interval_years_ad :
+                time_dependent_year = self.data_file_helper.nearestTimeDependentRegionMaskYear(1950 - year_ad)
+                if not self.cached_region_masks[region].has_key(time_dependent_year) :
+                    self.cached_region_masks[region][time_dependent_year] = self.data_file_helper.loadRegionMask(region, time_dependent=True, year=time_dependent_year)
+        elif not self.cached_region_masks.has_key(region) :
+            self.cached_region_masks[region] = self.data_file_helper.loadRegionMask(region)
+        return self.cached_region_masks[region]
+
+    # Method runs a single job combination: returns the generation directory
+    def runJob(self, job, output_directory) :
+
+        # Resolve settings
+        parameter_group_code = job['parameter_group_code']
+        parameter_code = job['parameter_code']
+        if not self.parameter_unit_string.has_key(parameter_group_code) or not self.parameter_unit_string[parameter_group_code].has_key(parameter_code) :
+            raise Exception('Unknown parameter ' + parameter_group_code + '/' + parameter_code)
+        generate_grids = (job['data_type'] == 'map')
+        if job['data_type'] not in ['map', 'series'] :
+            raise Exception('Unknown data type ' + str(job['data_type']))
+        if job['file_type'] not in self.data_file_type_keys :
+            raise Exception('Unknown file type ' + str(job['file_type']))
+        if job['file_type'] not in self.data_file_types_for_data_type[job['data_type']] :
+            raise Exception('File type ' + str(job['file_type']) + ' is not available for ' + job['data_type'] + ' data')
+        if job['file_type'] in self.columnar_data_file_type_keys :
+            self.data_file_helper.checkColumnarSeriesDataFileRequirements()
+        generate_figures = (generate_grids and bool(job['figure_type']))
+        if generate_figures :
+            if job['figure_type'] not in self.figure_type_keys :
+                raise Exception('Unknown figure type ' + str(job['figure_type']))
+            if not PaleoclimateToolGridPlotter :
+                raise Exception('Map figures require the Matplotlib and Basemap modules')
+            if not self.grid_plotter :
+                self.grid_plotter = PaleoclimateToolGridPlotter()
+        period_from = self.convertYearLabel(job['period'][0])
+        period_until = self.convertYearLabel(job['period'][1])
+        period_ad_from = period_from['year_ad']
+        period_ad_until = period_until['year_ad']
+        interval_step = int(job['interval_step'])
+        interval_size = int(job['interval_size'])
+        months = self.resolveMonthIndices(job['months'])
+        if months['all_months'] and generate_grids :
+            raise Exception('All months are only available for series data')
+        parameter_name = parameter_code.replace('-', ' ').title()
+
+        # Delta reference
+        if job['delta_reference'] :
+            delta_reference = self.convertYearLabel(job['delta_reference'])
+            delta_ref_period_ad = delta_reference['year_ad']
+            if generate_grids :
+                if delta_ref_period_ad == period_ad_from :
+                    period_ad_from += interval_step
+                elif delta_ref_period_ad == period_ad_until :
+                    period_ad_until -= interval_step
+        else :
+            delta_ref_period_ad = None
+        period_years_ad = range(period_ad_from, period_ad_until+1, interval_step)
+
+        # Region mask
+        region_mask = self.loadRegionMask(job['region'], period_years_ad)
+
+        # Construct description, filename, and times (for netCDF and GeoTIFF files)
+        description = ''
+        if delta_ref_period_ad :
+            if job['delta_as_percent'] :
+                description += '% '
+            description += 'Change in '
+        if months['label'] == 'Annual' :
+            description += 'Annual '
+        description += parameter_name
+        if months['all_months'] :
+            description += ' for All Months'
+        elif months['label'] != 'Annual' :
+            description += ' for ' + months['label']
+        if delta_ref_period_ad :
+            description += ' Relative to ' + str(delta_reference['year']) + ' ' + delta_reference['postfix']
+        filename = parameter_name.replace(' ','_') + '_'
+        if not months['all_months'] :
+            filename += months['label'] + '_'
+        filename += (str(period_from['year']) + period_from['postfix'] + '-' + str(period_until['year']) + period_until['postfix'] +
+                     '_step' + str(interval_step) + '_size' + str(interval_size))
+        times = range(period_ad_from-1950, period_ad_until-1950+1, interval_step)
+
+        # Data units
+        if job['delta_as_percent'] and delta_ref_period_ad :
+            data_units = '%'
+        else :
+            data_units = self.parameter_unit_string[parameter_group_code][parameter_code]
+
+        # Generate files in a separate directory for each job combination (or append Parquet series to the series dataset)
+        if job['file_type'] == 'parquet' :
+            generation_directory = path.join(output_directory, self.series_dataset_name)
+            series_dataset_path = generation_directory
+        else :
+            generation_directory = path.join(output_directory, filename + '_' + job['region'])
+            series_dataset_path = None
+        if not path.exists(generation_directory) :
+            generation_directory = self.data_file_helper.createDirectoryPath(generation_directory)
+        self.data_file_helper.setFileGenerationDirectory(generation_directory)
+        parameter_data_is_gridded = self.data_file_helper.parameterDataIsGridded(parameter_group_code, parameter_code)
+
+        if generate_grids : # Generate one file at a time (as grid data for each year arrives from the worker processes when utilised)
+
+            # Grids, masks and year labels collected for figures
+            figure_grids = { 'parameter_data' : [], 'region_masks' : [], 'titles' : [] }
+
+            # Region masks are applied to the generated grids
+            for year_ad, parameter_data in self.data_file_helper.generateParameterDataForYears(period_years_ad,
+                                                                                               processes=self.processes,
+                                                                                               parameter_group_code=parameter_group_code,
+                                                                                               parameter_code=parameter_code,
+                                                                                               delta_ref_period_ad=delta_ref_period_ad,
+                                                                                               delta_as_percent=bool(job['delta_as_percent']),
+                                                                                               interval_step=interval_step,
+                                                                                               interval_size=interval_size,
+                                                                                               month_indices=months['month_indices'],
+                                                                                               correct_bias=bool(job['correct_bias'])) :
+
+                # Resolve year label for data
+                if year_ad <= 1950 and period_from['postfix'] == 'BP' :
+                    year_label = str(1950 - year_ad) + 'BP'
+                else :
+                    year_label = str(year_ad) + 'AD'
+
+                # Apply region mask to grid
+                if type(region_mask) == dict :
+                    region_mask_for_year = region_mask[self.data_file_helper.nearestTimeDependentRegionMaskYear(1950 - year_ad)]
+                else :
+                    region_mask_for_year = region_mask
+                masked_parameter_data = np.ma.masked_array(parameter_data, mask=((region_mask_for_year - 1)*-1))
+
+                # Generate a grid data file
+                if year_ad == period_years_ad[0] :
+                    grid = 'first'
+                elif year_ad == period_years_ad[-1] :
+                    grid = 'last'
+                else :
+                    grid = None
+                self.data_file_helper.generateGridDataFile(masked_parameter_data, file_type=job['file_type'], year_label=year_label,
+                                                           year_ad=year_ad, description=description, filename=filename, times=times, data_units=data_units, grid=grid)
+
+                # Collect grid for figures
+                if generate_figures :
+                    figure_grids['parameter_data'].append(parameter_data)
+                    figure_grids['region_masks'].append(region_mask_for_year)
+                    figure_grids['titles'].append(year_label[:-2] + ' ' + year_label[-2:])
+
+            # Close the NetCDF or GeoTIFF file (when the last grid was not generated)
+            self.data_file_helper.closeGridDataFileWriter()
+
+            # Add figure requests (rendered once all jobs have run)
+            if generate_figures and figure_grids['parameter_data'] :
+                self.addFigureRequests(job, figure_grids, description + ': ' + job['region'], data_units, filename + '_' + job['region'])
+
+        else : # Collect series data then generate file
+
+            parameter_data = self.data_file_helper.generateParameterData(parameter_group_code=parameter_group_code,
+                                                                         parameter_code=parameter_code,
+                                                                         period_ad_from=period_ad_from,
+                                                                         period_ad_until=period_ad_until,
+                                                                         delta_ref_period_ad=delta_ref_period_ad,
+                                                                         delta_as_percent=bool(job['delta_as_percent']),
+                                                                         interval_step=interval_step,
+                                                                         interval_size=interval_size,
+                                                                         month_indices=months['month_indices'],
+                                                                         region_mask=region_mask,
+                                                                         generate_grids=generate_grids,
+                                                                         all_months=months['all_months'],
+                                                                         correct_bias=bool(job['correct_bias']))
+
+            # Gather years for series data frame
+            if period_from['postfix'] == 'BP' and period_until['postfix'] == 'BP' :
+                x_title = 'Year (BP)'
+                years = [(1950 - year_ad) for year_ad in period_years_ad]
+            elif period_from['postfix'] == 'AD' and period_until['postfix'] == 'AD' :
+                x_title = 'Year (AD)'
+                years = period_years_ad
+            else :
+                x_title = 'Year'
+                years = [self.data_file_helper.convertAdYearToDataLabel(year_ad) for year_ad in period_years_ad]
+
+            if parameter_data_is_gridded : # Generate statistics
+                if months['all_months'] :
+                    month_labels = self.month_names
+                else :
+                    month_labels = ['']
+                    parameter_data = [parameter_data]
+                if job['file_type'] in self.columnar_data_file_type_keys :
+                    statistic_fields = self.grid_region_statistics_keys
+                else :
+                    statistic_fields = job['statistics']
+                for i, month in enumerate(month_labels) :
+                    indexes = [x_title]
+                    data_dict = { x_title : years }
+                    for statistic_field in statistic_fields :
+                        indexes.append(self.grid_region_statistics_names[statistic_field])
+                        data_dict[self.grid_region_statistics_names[statistic_field]] = parameter_data[i][statistic_field]
+                    if month :
+                        month_description = description + ': ' + month
+                    else :
+                        month_description = description
+                    self.data_file_helper.generateSeriesDataFile(data_frame=pd.DataFrame(data_dict)[indexes], file_type=job['file_type'], month=month.lower(),
+                                                                 description=month_description, data_units=data_units, dataset_path=series_dataset_path,
+                                                                 partition=[('parameter', parameter_code), ('region', job['region']), ('months', (month or months['label']))])
+
+            else : # Generate raw data
+                if months['all_months'] :
+                    indexes = [x_title]
+                    data_dict = { x_title : years }
+                    for i, month in enumerate(self.month_names) :
+                        indexes.append(month)
+                        data_dict[month] = parameter_data[i]
+                else :
+                    y_title = parameter_name
+                    if delta_ref_period_ad :
+                        if job['delta_as_percent'] :
+                            y_title = '% Change in ' + y_title
+                        else :
+                            y_title = 'Change in ' + y_title
+                    indexes = [x_title, y_title]
+                    data_dict = { x_title : years, y_title : parameter_data }
+                self.data_file_helper.generateSeriesDataFile(data_frame=pd.DataFrame(data_dict)[indexes], file_type=job['file_type'], description=description, data_units=data_units,
+                                                             dataset_path=series_dataset_path, partition=[('parameter', parameter_code), ('region', job['region']), ('months', months['label'])])
+
+        return self.data_file_helper.getFileGenerationDirectoryPath()
+
+    # Method adds figure requests for the grids generated by a map job (split into figures of at most maps per figure)
+    def addFigureRequests(self, job, figure_grids, main_title, data_units, filename) :
+
+        # Colour scheme boundaries
+        region_statistics = self.data_file_helper.calculateGridRegionStatistics(figure_grids['parameter_data'], figure_grids['region_masks'])
+        fixed_range_colour_scheme = self.grid_plotter.getFixedRangeColourScheme(job['parameter_group_code'], job['parameter_code'],
+                                                                                delta=bool(job['delta_reference']), delta_as_percent=bool(job['delta_as_percent']))
+        colour_scheme_boundaries = self.grid_plotter.calculateColourSchemeBoundaries(job['map_colour_scheme'], fixed_range_colour_scheme, region_statistics)
+        colour_scheme_boundaries_zero_index = None
+        if job['map_colour_zero_boundary'] and self.grid_plotter.zeroBoundaryPermitted(job['map_colour_scheme'], region_statistics) :
+            colour_scheme_boundaries_zero_index, colour_scheme_boundaries = self.grid_plotter.adjustColourSchemeZeroBoundaries(colour_scheme_boundaries, job['map_colour_scheme'], fixed_range_colour_scheme)
+        colour_palette = job['map_colour_palette']
+        if colour_palette not in self.grid_plotter.colour_palettes :
+            raise Exception('Unknown map colour palette ' + str(colour_palette))
+        if colour_palette in self.grid_plotter.extended_colour_palettes and colour_scheme_boundaries_zero_index is None :
+            colour_palette = self.grid_plotter.colour_palettes[0]
+
+        # Region box: shift grids for regions centred on 180 degrees
+        region_box = self.grid_plotter.region_bounding_box.get(job['region'], self.grid_plotter.region_bounding_box['globe'])
+        parameter_data = figure_grids['parameter_data']
+        region_masks = figure_grids['region_masks']
+        if region_box['centre'] == 180 :
+            parameter_data = self.grid_plotter.shiftDataGrids180Degrees(parameter_data)
+            region_masks = self.grid_plotter.shiftDataGrids180Degrees(region_masks)
+        if job['contoured_maps'] :
+            parameter_data = self.grid_plotter.transformDataGridsForContours(parameter_data)
+            region_masks = self.grid_plotter.transformGridMasksForContours(region_masks)
+
+        # Plot settings shared by each figure
+        plot_settings = { 'main_title' : main_title, 'region_box' : region_box,
+                          'basemap' : self.grid_plotter.resolveRegionBasemapSettings(job['region'], region_box),
+                          'colour_scheme_boundaries' : colour_scheme_boundaries, 'colour_scheme_boundaries_zero_index' : colour_scheme_boundaries_zero_index,
+                          'colourbar_label_boundaries' : self.grid_plotter.calculateColourbarLabelBoundaries(colour_scheme_boundaries, job['map_colour_scheme'], fixed_range_colour_scheme),
+                          'colourbar_label' : data_units, 'colour_palette' : colour_palette, 'reverse_colour_palette' : bool(job['reverse_map_colour_palette']),
+                          'contoured' : bool(job['contoured_maps']) }
+
+        # Figure requests
+        maps_per_figure = max(1, int(job['maps_per_figure']))
+        figures = range(0, len(parameter_data), maps_per_figure)
+        for figure_number, first_map in enumerate(figures) :
+            figure_settings = plot_settings.copy()
+            figure_settings['grid_plot_titles'] = figure_grids['titles'][first_map:(first_map + maps_per_figure)]
+            if len(figures) > 1 :
+                figure_filename = filename + '_' + str(figure_number + 1) + '.' + job['figure_type']
+            else :
+                figure_filename = filename + '.' + job['figure_type']
+            self.figure_requests.append({ 'file_path' : path.join(self.data_file_helper.getFileGenerationDirectoryPath(), figure_filename),
+                                          'parameter_data' : parameter_data[first_map:(first_map + maps_per_figure)],
+                                          'region_masks' : region_masks[first_map:(first_map + maps_per_figure)],
+                                          'plot_settings' : figure_settings })
+
+# END PaleoViewBatch
+
+## Main program
+
+if __name__ == '__main__' :
+
+    if len(sys.argv) < 2 :
+        print >> sys.stderr, 'Usage: python paleo_view_batch.py job.yaml [job.yaml ...]'
+        sys.exit(2)
+
+    batch = PaleoViewBatch(tool_directory=path.dirname(path.abspath(__file__)))
+    failures = 0
+    for job_file_path in sys.argv[1:] :
+        try :
+            failures += batch.runJobFile(job_file_path)
+        except Exception, e :
+            failures += 1
+            print >> sys.stderr, 'Job file', job_file_path, 'failed:', e
+    sys.exit(int(failures > 0))
+
+# END Main program
@@ -1,7 +1,9 @@
 # Python modules
 import base64
+import Queue
 import string
 import sys
+import threading
 import Tkinter as tk
 import ttk
 from os import chdir, environ, getcwd, listdir, mkdir, path
@@ -28,14 +30,11 @@ import packaging.markers
 import pandas as pd
 
 # Python extension Matplot and Basemap modules
-from mpl_toolkits.basemap import Basemap
 import FileDialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends.backend_tkagg import NavigationToolbar2TkAgg
 import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
 from matplotlib.colorbar import ColorbarBase
-from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
 from matplotlib import rcParams
@@ -45,6 +44,8 @@ MAC_VERSION = True # Make True for releases to enable Linux compatibility
 
 # Tool library modules
 from PaleoclimateToolDataFileHelper import PaleoclimateToolDataFileHelper
+from PaleoclimateToolGridPlotter import PaleoclimateToolGridPlotter
+from PaleoclimateToolProgressReporter import PaleoclimateToolProgressCancelled, PaleoclimateToolProgressReporter
 
 # TEST FLAG: Write stdout and stderr to console (not log files)
 DEBUG = False
@@ -74,7 +75,11 @@ class ApplicationGUI(tk.Frame) :
         self.grid()
 
         # Create the Paleoclimate data file helper
-        self.data_file_helper = PaleoclimateToolDataFileHelper(application_gui=self)
+        self.progress_reporter = PaleoclimateToolProgressReporter(refresh_function=self.update)
+        self.data_file_helper = PaleoclimateToolDataFileHelper(progress_reporter=self.progress_reporter)
+
+        # Create the Paleoclimate grid plotter (maps)
+        self.grid_plotter = PaleoclimateToolGridPlotter()
 
         # Configuration file (initially in the same directory as the tool, but copied to user application data directory)
         self.tool_config_file = 'paleo_view_config.txt'
@@ -90,7 +95,7 @@ class ApplicationGUI(tk.Frame) :
         self.climate_data_proxy_username = ''
         self.climate_data_proxy_password = ''
         self.climate_data_directory = ''
-        self.climate_data_local_data_type = 'netcdf' # netcdf/raw
+        self.climate_data_local_data_type = 'netcdf' # netcdf/mmap/raw
         self.default_file_generation_directory = ''
         self.default_file_generation_directory_set = False
         self.region_mask_directory = path.join(getcwd(), 'Map Data')
@@ -98,6 +103,9 @@ class ApplicationGUI(tk.Frame) :
         self.public_release = True
         self.show_extended_colour_palettes_in_advance = False
         self.unpack_downloaded_netcdf_data = False
+        self.climate_data_cache_memory_budget = 512*1024*1024 # bytes
+        self.use_cumulative_sum_index = False # generates sidecar index files alongside NetCDF files (about 1MB of disk space per year of data)
+        self.parameter_loading_threads = 3 # loads derived parameter inputs concurrently
 
         # Current directory locations
         self.current_figure_save_directory = ''
@@ -161,51 +169,15 @@ class ApplicationGUI(tk.Frame) :
                                              'default_file_generation_directory_set' : bool, 'public_release' : bool, 'show_extended_colour_palettes_in_advance' : bool,
                                              'climate_data_local_data_type' : str }
 
-        # Parameter fixed range colour scheme
-        self.parameter_fixed_range_colour_scheme = { 'temperature' : { 'mean-temperature' : { 'value' : {}, 'delta' : {} },
-                                                                       'minimum-temperature' : { 'value' : {}, 'delta' : {} },
-                                                                       'maximum-temperature' : { 'value' : {}, 'delta' : {} },
-                                                                       'diurnal-temperature-range' : { 'value' : {}, 'delta' : {} },
-                                                                       'annual-temperature-range' : { 'value' : {}, 'delta' : {} },
-                                                                       'isothermality' : { 'value' : {}, 'delta' : {} },
-                                                                       'temperature-seasonality' : { 'value' : {}, 'delta' : {} } },
-                                                     'precipitation' : { 'mean-precipitation' : { 'value' : {}, 'delta' : {} },
-                                                                         'precipitation-seasonality' : { 'value' : {}, 'delta' : {} } },
-                                                     'humidity' : { 'specific-humidity' : { 'value' : {}, 'delta' : {} },
-                                                                    'relative-humidity' : { 'value' : {}, 'delta' : {} } },
-                                                     'sea-level-pressure' : { 'sea-level-pressure' : { 'value' : {}, 'delta' : {} } } }
-        self.parameter_fixed_range_colour_scheme['temperature']['mean-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['mean-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['minimum-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['minimum-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['maximum-temperature']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['maximum-temperature']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['diurnal-temperature-range']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['diurnal-temperature-range']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['annual-temperature-range']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['annual-temperature-range']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['isothermality']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['isothermality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['temperature-seasonality']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['temperature']['temperature-seasonality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['precipitation']['mean-precipitation']['%delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['precipitation']['precipitation-seasonality']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['precipitation']['precipitation-seasonality']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['humidity']['specific-humidity']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['humidity']['specific-humidity']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['humidity']['relative-humidity']['value'] = { 'min' : 0.0, 'first_boundary' : None, 'last_boundary' : None, 'max' : 100.0 }
-        self.parameter_fixed_range_colour_scheme['humidity']['relative-humidity']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['sea-level-pressure']['sea-level-pressure']['value'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
-        self.parameter_fixed_range_colour_scheme['sea-level-pressure']['sea-level-pressure']['delta'] = { 'min' : None, 'first_boundary' : None, 'last_boundary' : None, 'max' : None }
+        # Parameter fixed range colour scheme (shared with the grid plotter, may be modified via config)
+        self.parameter_fixed_range_colour_scheme = self.grid_plotter.parameter_fixed_range_colour_scheme
 
         # Load config from file and warn if file not found
         config_warning = self.loadConfig()
         if config_warning :
             showwarning('Error Loading Configuration', config_warning)
 
-        # Set the climate data source, url and directory, and the file generation, mask, and bias correction directories
+        # Set the climate data source, url and directory, the file generation, mask, and bias correction directories, the data cache memory budget, cumulative sum index use, and parameter loading threads
         self.data_file_helper.setClimateDataSource(self.climate_data_source)
         self.data_file_helper.setClimateDataUrl(self.climate_data_url)
         self.data_file_helper.setClimateDataProxy(self.climate_data_proxy_active, self.climate_data_proxy_url, self.climate_data_proxy_username, self.climate_data_proxy_password)
@@ -215,6 +187,10 @@ class ApplicationGUI(tk.Frame) :
         self.data_file_helper.setFileGenerationDirectory(self.default_file_generation_directory)
         self.data_file_helper.setRegionMaskDirectory(self.region_mask_directory)
         self.data_file_helper.setBiasCorrectionDirectory(self.bias_correction_directory)
+        self.data_file_helper.setClimateDataCacheMemoryBudget(self.climate_data_cache_memory_budget)
+        self.data_file_helper.useCumulativeSumIndex(use=self.use_cumulative_sum_index)
+        self.data_file_helper.useMmapData(use=(self.climate_data_local_data_type == 'mmap'))
+        self.data_file_helper.setParameterLoadingThreads(self.parameter_loading_threads)
 
         # Tool Process steps
         self.process_step = {}
@@ -372,33 +348,11 @@ class ApplicationGUI(tk.Frame) :
 
     # Method setup colour palettes
     def setupColourPalettes(self) :
-        self.colour_palettes = ['rainbow', 'red_blue', 'ar4', 'extended_red_blue']
+        self.colour_palettes = self.grid_plotter.colour_palettes
         self.map_colour_palette = 'rainbow'
-        self.extended_colour_palettes = ['extended_red_blue']
-        rainbow = ['#fa58f4', '#0000ff', '#819ff7', '#81f7f3', '#04b431', '#44ff00', '#ffff00', '#fe9a2e', '#fec3d2', '#ff0000', '#cc3300']
-        rainbow_reversed = rainbow[:]
-        rainbow_reversed.reverse()
-        red_blue = ['#0000ac', '#0000ff', '#8888ff', '#a9a9ff', '#d5d5ff', '#ffffff', '#ffd7d7', '#ffaaaa', '#ff6464', '#ff0000', '#cc3300']
-        red_blue_reversed = red_blue[:]
-        red_blue_reversed.reverse()
-        ar4 = ['#668bf1', '#94b0fe', '#b1c4fa', '#d1dcfb', '#eaeffc', '#ffffce', '#ffe898', '#ffc98e', '#f3a24b', '#ff8257', '#fc551d']
-        ar4_reversed = ar4[:]
-        ar4_reversed.reverse()
-        extended_red_blue = ['#7a0000', '#b50000', '#df0000', '#ff0000', '#fa563d', '#ffa495', '#ff7338', '#ffa161', '#fdb56b', '#fecd80',
-                           '#f5ecc3', '#d7e2ff', '#b3ccf5', '#97b4fa', '#84a6ff', '#6989ec', '#4c80e6', '#3366d9', '#054baa', '#07378c',
-                           '#0a2864', '#0a0931'] # already reversed
-        extended_red_blue_reversed = extended_red_blue[:]
-        extended_red_blue.reverse()
-        self.colour_palette_lists = { False : { 'rainbow' : rainbow, 'red_blue' : red_blue, 'ar4' : ar4, 'extended_red_blue' : extended_red_blue },
-                                      True : { 'rainbow' : rainbow_reversed, 'red_blue' : red_blue_reversed, 'ar4' : ar4_reversed, 'extended_red_blue' : extended_red_blue_reversed } }
-        self.colourmaps = { False : { 'rainbow' : LinearSegmentedColormap.from_list('rainbow', rainbow, N=11),
-                                      'red_blue' : LinearSegmentedColormap.from_list('red_blue', red_blue, N=11),
-                                      'ar4' : LinearSegmentedColormap.from_list('ar4', ar4, N=11),
-                                      'extended_red_blue' : LinearSegmentedColormap.from_list('extended_red_blue', extended_red_blue[6:17], N=11) },
-                            True : { 'rainbow' : LinearSegmentedColormap.from_list('rainbow_reversed', rainbow_reversed, N=11),
-                                     'red_blue' : LinearSegmentedColormap.from_list('red_blue_reversed', red_blue_reversed, N=11),
-                                     'ar4' : LinearSegmentedColormap.from_list('ar4_reversed', ar4_reversed, N=11),
-                                     'extended_red_blue' : LinearSegmentedColormap.from_list('extended_red_blue_reversed', extended_red_blue_reversed[5:16], N=11) } }
+        self.extended_colour_palettes = self.grid_plotter.extended_colour_palettes
+        self.colour_palette_lists = self.grid_plotter.colour_palette_lists
+        self.colourmaps = self.grid_plotter.createColourMaps()
 
     # Menu GUI (will grow over time)
     def createMenu(self) :
@@ -682,41 +636,8 @@ class ApplicationGUI(tk.Frame) :
         self.current_region = self.region_codes[0]
         self.current_user_defined_region_mask = self.region_mask*0
 
-        # Region bounding box
-        self.region_bounding_box = {}
-        self.region_bounding_box['globe'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['land'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['ocean'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['land-0-21KBP'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['ocean-0-21KBP'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['northern-hemisphere'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['southern-hemisphere'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['equatorial-pacific'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
-        self.region_bounding_box['n3'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
-        self.region_bounding_box['n3-4'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
-        self.region_bounding_box['n4'] = { 'centre': 180, 'lat' : [-30,30], 'lon' : [125,300], 'grid' : 10 }
-        self.region_bounding_box['usa'] = { 'centre': 0, 'lat' : [15,60], 'lon' : [-130,-55], 'grid' : 10 }
-        self.region_bounding_box['canada'] = { 'centre': 0, 'lat' : [35,80], 'lon' : [-150,-45], 'grid' : 10 }
-        self.region_bounding_box['mexico'] = { 'centre': 0, 'lat' : [5,40], 'lon' : [-125,-80], 'grid' : 10 }
-        self.region_bounding_box['brazil'] = { 'centre': 0, 'lat' : [-45,15], 'lon' : [-80,-25], 'grid' : 10 }
-        self.region_bounding_box['africa'] = { 'centre': 0, 'lat' : [-40,40], 'lon' : [-20,55], 'grid' : 10 }
-        self.region_bounding_box['europe'] = { 'centre': 0, 'lat' : [30,75], 'lon' : [-25,40], 'grid' : 10 }
-        self.region_bounding_box['india'] = { 'centre': 0, 'lat' : [0,45], 'lon' : [60,100], 'grid' : 10 }
-        self.region_bounding_box['china'] = { 'centre': 0, 'lat' : [15,60], 'lon' : [70,140], 'grid' : 10 }
-        self.region_bounding_box['japan'] = { 'centre': 0, 'lat' : [25,50], 'lon' : [125,150], 'grid' : 10 }
-        self.region_bounding_box['australia-nz'] = { 'centre': 180, 'lat' : [-50,-5], 'lon' : [110,185], 'grid' : 10 }
-        self.region_bounding_box['central-asia'] = { 'centre': 0, 'lat' : [20,60], 'lon' : [35,120], 'grid' : 10 }
-        self.region_bounding_box['middle-east'] = { 'centre': 0, 'lat' : [10,45], 'lon' : [30,65], 'grid' : 10 }
-        self.region_bounding_box['east-former-soviet-union'] = { 'centre': 180, 'lat' : [40,85], 'lon' : [55,195], 'grid' : 10 }
-        self.region_bounding_box['west-former-soviet-union'] = { 'centre': 0, 'lat' : [40,80], 'lon' : [15,65], 'grid' : 10 }
-        self.region_bounding_box['rola'] = { 'centre': 0, 'lat' : [-60,30], 'lon' : [-95,-45], 'grid' : 10 }
-        self.region_bounding_box['south-east-asia'] = { 'centre': 0, 'lat' : [-15,35], 'lon' : [65,155], 'grid' : 10 }
-        self.region_bounding_box['west-pacific'] = { 'centre': 180, 'lat' : [-35,25], 'lon' : [130,240], 'grid' : 10 }
-        self.region_bounding_box['alaska'] = { 'centre': 180, 'lat' : [50,75], 'lon' : [190,225], 'grid' : 10 }
-        self.region_bounding_box['greenland'] = { 'centre': 0, 'lat' : [55,90], 'lon' : [-75,-10], 'grid' : 10 }
-        self.region_bounding_box['antarctica'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
-        self.region_bounding_box['arctic-islands'] = { 'centre': 0, 'lat' : [55,85], 'lon' : [-130,-55], 'grid' : 10 }
-        self.region_bounding_box['user-defined'] = { 'centre': 0, 'lat' : [-90,90], 'lon' : [-180,180], 'grid' : 10 }
+        # Region bounding box (shared with the grid plotter)
+        self.region_bounding_box = self.grid_plotter.region_bounding_box
 
         # Other parameters for regions
 
@@ -998,16 +919,20 @@ class ApplicationGUI(tk.Frame) :
         self.view_button.grid(row=0, column=0, sticky=tk.W, padx=0, pady=5)
         tk.Label(self.view_frame, text=' :').grid(row=0, column=1, padx=0, pady=5)
         self.view_label.grid(row=0, column=2, sticky=tk.NW+tk.SW, padx=0, pady=5)    
+        self.view_cancel_button = tk.Button(self.view_frame, text='Cancel', state=tk.NORMAL, command=self.cancelViewPlot)
+        self.view_cancel_button.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
+        self.view_cancel_button.grid_remove()
+        self.view_plot_poll_interval = 50 # ms
 
         # File generation
         self.file_frame = tk.Frame(self.generation_frame)
         self.file_generation_completed = False
 
         # Data file type
-        self.data_file_type_keys = ['csv', 'ascii', 'esri_ascii', 'netcdf']
-        self.data_file_type_selection = ['CSV', 'ASCII', 'ESRI ASCII', 'NetCDF']
-        self.data_file_types_for_data_type = { 'map' : ['csv', 'ascii', 'esri_ascii', 'netcdf'],
-                                               'series' : ['csv', 'ascii'] } # 'netcdf'
+        self.data_file_type_keys = ['csv', 'ascii', 'esri_ascii', 'netcdf', 'geotiff', 'parquet', 'feather']
+        self.data_file_type_selection = ['CSV', 'ASCII', 'ESRI ASCII', 'NetCDF', 'GeoTIFF', 'Parquet', 'Feather']
+        self.data_file_types_for_data_type = { 'map' : ['csv', 'ascii', 'esri_ascii', 'netcdf', 'geotiff'],
+                                               'series' : ['csv', 'ascii', 'parquet', 'feather'] } # 'netcdf' (Parquet and Feather require pyarrow)
         self.data_file_type_text = tk.StringVar()
         self.data_file_type_text.set(self.data_file_type_selection[0])
         select_data_file_type = self.data_type_frame.register(self.selectDataFileType)
@@ -1047,12 +972,13 @@ class ApplicationGUI(tk.Frame) :
         self.generate_label.grid(row=2, column=2, sticky=tk.NW+tk.SW, padx=0, pady=5)
 
         # Generation status bar
-        self.generation_status_options = { 'view' : { 'data' : 'Loading data...', 'plot' : 'Generating plot...' },
+        self.generation_status_options = { 'view' : { 'data' : 'Loading data...', 'plot' : 'Generating plot...', 'conversion' : 'Converting NetCDF data files' },
                                            'files' : { 'map' : { 'data' : 'Loading data...', 'file' : 'Generating data files...' },
                                                        'series' : { 'data' : 'Loading data...', 'file' : 'Generating data file...' } } }
         self.generation_status_times = { 'view' : { 'map' : 10, 'time-dependent' : 100, 'contours' : 5, 'masks' : 5, 'series' : 5 },
                                          'files' : { 'map' : 1, 'series' : 1 } }
         self.generation_status_bar = ttk.Progressbar(self.generation_frame, orient='horizontal', mode='determinate')
+        self.progress_reporter.setProgressBar('generation', self.generation_status_bar)
 
         # Add frames to grid
         row = 9
@@ -1273,13 +1199,7 @@ class ApplicationGUI(tk.Frame) :
     # Menu Method: Map Zero Boundary Permitted?
     def mapZeroBoundaryPermitted(self, precheck=False) :
         if precheck or (hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map') :
-            if self.map_colour_scheme == '90%_range' :
-                if min(self.grid_plot_statistics['region']['percentile_5th']) <= 0 and max(self.grid_plot_statistics['region']['percentile_95th']) >= 0 :
-                    return True
-                else :
-                    return False
-            else : # fixed_range
-                return True
+            return self.grid_plotter.zeroBoundaryPermitted(self.map_colour_scheme, self.grid_plot_statistics['region'])
         else :
             return False
 
@@ -1287,8 +1207,8 @@ class ApplicationGUI(tk.Frame) :
     def updateExtendedColourMaps(self, colour_palette) :
         colour_scheme_boundaries = self.calculateColourSchemeBoundaries()
         zero_index, colour_scheme_boundaries = self.adjustColourSchemeZeroBoundaries(colour_scheme_boundaries)
-        self.colourmaps[False][colour_palette] = LinearSegmentedColormap.from_list(colour_palette, self.colour_palette_lists[False][colour_palette][(11-zero_index):(22-zero_index)], N=11)
-        self.colourmaps[True][colour_palette] = LinearSegmentedColormap.from_list(colour_palette, self.colour_palette_lists[True][colour_palette][(11-zero_index):(22-zero_index)], N=11)
+        self.colourmaps[False][colour_palette] = self.grid_plotter.createExtendedColourMap(colour_palette, False, zero_index)
+        self.colourmaps[True][colour_palette] = self.grid_plotter.createExtendedColourMap(colour_palette, True, zero_index)
 
     # Menu Method: Update Map Colour Selection
     def updateMapColourSelection(self) :
@@ -1301,7 +1221,9 @@ class ApplicationGUI(tk.Frame) :
             self.map_options_update_button.configure(state=tk.DISABLED)
             self.updating_plot_status_text.set('Updating plot ...')
             self.update_idletasks()
-            self.updateGridPlots(update=self.map_options_update_includes)
+            if not self.updateGridPlotsIncrementally(self.map_options_update_includes) :
+                self.updateGridPlots(update=self.map_options_update_includes)
+            self.map_options_update_includes = []
             self.update_idletasks()
             self.view_climate_data_window.after_idle(lambda: self.updating_plot_status_text.set(''))
 
@@ -1324,8 +1246,8 @@ class ApplicationGUI(tk.Frame) :
     def selectMapColourPalette(self) :
         self.map_colour_palette = self.map_colour_palette_text.get()
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
-            if 'colours' not in self.map_options_update_includes :
-                self.map_options_update_includes.append('colours')
+            if 'palette' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('palette')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Set Auto Map Colour Palette # NOT IN USE
@@ -1339,8 +1261,8 @@ class ApplicationGUI(tk.Frame) :
         self.reverse_map_colour_palette = bool(self.reverse_map_colour_palette_int.get())
         self.after_idle(lambda: self.updateMapColourSelection())
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
-            if 'colours' not in self.map_options_update_includes :
-                self.map_options_update_includes.append('colours')
+            if 'palette' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('palette')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Set Map Colour Boundary Lines
@@ -1348,8 +1270,8 @@ class ApplicationGUI(tk.Frame) :
         self.map_colour_boundary_lines = bool(self.map_colour_boundary_lines_int.get())
         self.after_idle(lambda: self.updateMapColourSelection())
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
-            if 'colours' not in self.map_options_update_includes :
-                self.map_options_update_includes.append('colours')
+            if 'boundary_lines' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('boundary_lines')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Set Map Colour Zero Boundary
@@ -1383,6 +1305,8 @@ class ApplicationGUI(tk.Frame) :
     def setShowGridMapLandBoundaries(self) :
         self.show_grid_map_land_boundaries = bool(self.show_grid_map_land_boundaries_int.get())
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
+            if 'land_boundaries' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('land_boundaries')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Set Show Map Grid Lines
@@ -1395,6 +1319,8 @@ class ApplicationGUI(tk.Frame) :
             self.map_grid_include_menu.configure(state=tk.DISABLED)
             self.map_grid_space_menu.configure(state=tk.DISABLED)
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
+            if 'grid_lines' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('grid_lines')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Select Map Grid Include
@@ -1402,6 +1328,8 @@ class ApplicationGUI(tk.Frame) :
         self.map_grid_include_text.set(self.map_grid_include_selection[self.map_grid_includes.index(selected)]) # needed as OptionMenu menu item commands have been overridden
         self.map_grid_include = selected
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
+            if 'grid_lines' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('grid_lines')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Select Map Grid Space
@@ -1409,6 +1337,8 @@ class ApplicationGUI(tk.Frame) :
         self.map_grid_space_text.set(self.map_grid_space_selection[self.map_grid_spaces.index(float(selected))]) # needed as OptionMenu menu item commands have been overridden
         self.map_grid_space = float(selected)
         if hasattr(self, 'view_climate_data_window') and self.view_climate_data_window.children and self.current_view_climate_data_window_type == 'map' :
+            if 'grid_lines' not in self.map_options_update_includes :
+                self.map_options_update_includes.append('grid_lines')
             self.map_options_update_button.configure(state=tk.NORMAL)
 
     # Menu Method: Configure Climate Data Location
@@ -1484,13 +1414,13 @@ class ApplicationGUI(tk.Frame) :
 
         # Local climate data file type
         self.climate_data_local_data_type_label = tk.Label(location_options_frame, text='Data File Type:', justify=tk.LEFT)
-        self.climate_data_local_data_type_options = { 'netcdf' : 'NetCDF (default)', 'raw' : 'Raw Data' }
+        self.climate_data_local_data_type_options = { 'netcdf' : 'NetCDF (default)', 'mmap' : 'Memory Mapped', 'raw' : 'Raw Data' }
         self.climate_data_local_data_type_text = tk.StringVar(value=self.climate_data_local_data_type_options[tool_option_values['climate_data_local_data_type']])
-        climate_data_local_data_type_menu_selection = [self.climate_data_local_data_type_options['netcdf'], self.climate_data_local_data_type_options['raw']]
+        climate_data_local_data_type_menu_selection = [self.climate_data_local_data_type_options['netcdf'], self.climate_data_local_data_type_options['mmap'], self.climate_data_local_data_type_options['raw']]
         self.climate_data_local_data_type_menu = tk.OptionMenu(location_options_frame, self.climate_data_local_data_type_text, *climate_data_local_data_type_menu_selection)
         self.climate_data_local_data_type_menu.config(highlightthickness=0, anchor=tk.W)
         select_climate_data_local_data_type = location_options_frame.register(self.selectClimateDataLocalDataType)
-        for i, selection in enumerate(['netcdf', 'raw']) :
+        for i, selection in enumerate(['netcdf', 'mmap', 'raw']) :
             self.climate_data_local_data_type_menu['menu'].entryconfigure(i, command=(select_climate_data_local_data_type, selection))
 
         # Local directory selection
@@ -1599,7 +1529,8 @@ class ApplicationGUI(tk.Frame) :
 
         # Change data type and inform file helper
         self.setToolOptions({ 'climate_data_local_data_type' : code })
-        self.data_file_helper.useNetCdfData(use=(code == 'netcdf'))
+        self.data_file_helper.useNetCdfData(use=(code in ['netcdf', 'mmap'])) # memory mapped files are converted from NetCDF files
+        self.data_file_helper.useMmapData(use=(code == 'mmap'))
 
         # Warn user if current climate data directory doesn't contain climate data
         if not self.data_file_helper.climateDataIsPresent() :
@@ -1937,6 +1868,7 @@ class ApplicationGUI(tk.Frame) :
         self.climate_data_download_status_text = tk.StringVar(value='')
         self.climate_data_download_status_label = tk.Label(download_climate_data_frame, textvariable=self.climate_data_download_status_text, justify=tk.LEFT)
         self.climate_data_download_status_bar = ttk.Progressbar(download_climate_data_frame, orient='horizontal', mode='determinate')
+        self.progress_reporter.setProgressBar('download', self.climate_data_download_status_bar)
 
         # Place elements on grid
         self.climate_data_url_label = tk.Label(download_climate_data_frame, text='Download from URL:', justify=tk.LEFT)
@@ -1999,8 +1931,9 @@ class ApplicationGUI(tk.Frame) :
             if self.climate_download_interval_int.has_key(download_interval) and self.climate_download_interval_int[download_interval].get() :
                 download_intervals_selected.append(download_interval)
 
-        # Download and unpack NetCDF files
+        # Download NetCDF files (concurrently)
         if self.data_file_helper.getClimateDataUrl() and self.data_file_helper.getClimateDataDirectoryPath() and data_parameters_selected and download_intervals_selected :
+            parameter_intervals = []
             for data_parameter in data_parameters_selected :
                 for download_interval in download_intervals_selected :
                     overwrite_ok = True
@@ -2009,23 +1942,28 @@ class ApplicationGUI(tk.Frame) :
                                                 'The data for '+data_parameter.replace('_',' ').title()+' interval '+download_interval+' is already present in the directory selected.\n\n'+
                                                 'Do you wish to download again and overwrite the existing file?', parent=self.download_climate_data_window)
                     if overwrite_ok :
-                        self.climate_data_download_button.configure(state=tk.DISABLED)
-                        self.climate_data_download_status_text.set('Downloading ' + data_parameter.replace('_',' ').title() + ' ' + download_interval + ' ...')
-                        self.climate_data_download_status_bar['maximum'] = 1
-                        self.climate_data_download_status_bar['value'] = 0
-                        self.climate_data_download_status_bar.grid()
-                        self.update() # .update_idletasks()
-                        try :
-                            self.data_file_helper.downloadClimateDataInterval(data_parameter, download_interval, delimiter='')
-                        except Exception, e :
-                            if hasattr(self, 'download_climate_data_window') and self.download_climate_data_window.children :
-                                showerror('Data download error', str(e), parent=self.download_climate_data_window)
-                                print >> sys.stderr, 'Data download error:', e
-                        if self.download_climate_data_window.children :
-                            self.climate_data_download_status_text.set('')
-                            self.climate_data_download_status_bar.grid_remove()
-                            self.climate_data_download_button.configure(state=tk.NORMAL)
-                            self.update() # .update_idletasks()
+                        parameter_intervals.append((data_parameter, download_interval))
+            if parameter_intervals :
+                self.climate_data_download_button.configure(state=tk.DISABLED)
+                if len(parameter_intervals) == 1 :
+                    self.climate_data_download_status_text.set('Downloading ' + parameter_intervals[0][0].replace('_',' ').title() + ' ' + parameter_intervals[0][1] + ' ...')
+                else :
+                    self.climate_data_download_status_text.set('Downloading ' + str(len(parameter_intervals)) + ' climate data files ...')
+                self.progress_reporter.startProgress('download', maximum=len(parameter_intervals))
+                self.climate_data_download_status_bar.grid()
+                self.update() # .update_idletasks()
+                try :
+                    download_errors = self.data_file_helper.downloadClimateDataIntervals(parameter_intervals)
+                except Exception, e :
+                    download_errors = [str(e)]
+                if download_errors and hasattr(self, 'download_climate_data_window') and self.download_climate_data_window.children :
+                    showerror('Data download error', '\n\n'.join(download_errors), parent=self.download_climate_data_window)
+                    print >> sys.stderr, 'Data download error:', '\n'.join(download_errors)
+                if self.download_climate_data_window.children :
+                    self.climate_data_download_status_text.set('')
+                    self.climate_data_download_status_bar.grid_remove()
+                    self.climate_data_download_button.configure(state=tk.NORMAL)
+                    self.update() # .update_idletasks()
         else :
             if not self.data_file_helper.getClimateDataUrl() :
                 showinfo('Download from URL not defined', 'Please enter the URL location of the climate data download(s).', parent=self.download_climate_data_window)
@@ -2787,9 +2725,7 @@ class ApplicationGUI(tk.Frame) :
             # Shift the region_mask if required
             shifted_region_mask = region_mask
             if self.region_bounding_box[self.current_region]['centre'] == 180 :
-                shifted_region_mask = np.zeros((72, 144))
-                shifted_region_mask[:,0:72] = region_mask[:,72:144]
-                shifted_region_mask[:,72:144] = region_mask[:,0:72]
+                shifted_region_mask = self.shiftGridMask180Degrees(region_mask)
 
             # Basemap resolution: c (crude), l (low), i (intermediate), h (high), f (full)
             if self.current_region in ['user-defined', 'globe', 'land', 'ocean', 'land-0-21KBP', 'ocean-0-21KBP', 'northern-hemisphere', 'southern-hemisphere', 'equatorial-pacific', 'n3', 'n3-4', 'n4', 'rola'] :
@@ -2828,15 +2764,7 @@ class ApplicationGUI(tk.Frame) :
                 self.view_edit_region_figure = Figure(figsize=(width, height), frameon=False, linewidth=10, dpi=dpi, tight_layout=True)
                 self.view_edit_region_plot_axes = self.view_edit_region_figure.add_subplot(111)
             self.view_edit_region_figure.subplots_adjust(left=(margin/width), right=(1.0-margin/width), bottom=(margin/height), top=(1.0-margin/height))
-            self.region_basemap = Basemap(ax=self.view_edit_region_plot_axes,
-                                          lon_0=self.region_bounding_box[self.current_region]['centre'],
-                                          llcrnrlat=self.region_bounding_box[self.current_region]['lat'][0],
-                                          urcrnrlat=self.region_bounding_box[self.current_region]['lat'][1],
-                                          llcrnrlon=self.region_bounding_box[self.current_region]['lon'][0],
-                                          urcrnrlon=self.region_bounding_box[self.current_region]['lon'][1],
-                                          resolution=basemap_resolution,
-                                          projection=map_projection,
-                                          boundinglat=bounding_lat)
+            self.region_basemap = self.grid_plotter.getBasemap(self.view_edit_region_plot_axes, self.region_bounding_box[self.current_region], basemap_resolution, map_projection, bounding_lat)
             plot_data = shifted_region_mask + (shifted_region_mask < 1)*0.3
 
         # Plot the map
@@ -4394,7 +4322,7 @@ class ApplicationGUI(tk.Frame) :
         # Disable view button, add generation status bar, and change label text
         self.view_button.configure(state=tk.DISABLED)
         self.update() # .update_idletasks()
-        self.generation_status_bar['value'] = 0
+        self.progress_reporter.startProgress('generation')
         self.generation_status_bar['maximum'] = (self.current_interval_steps + 1) * self.current_valid_interval_size_value * len(self.selected_time_unit_month_indices)
         if generate_grids :
             if self.use_contoured_grid_maps :
@@ -4454,52 +4382,158 @@ class ApplicationGUI(tk.Frame) :
         self.view_label_text.set(self.generation_status_options['view']['plot'])
         self.update() # .update_idletasks()
 
-        # Gather parameter data from the climate data files
-        data_extraction_ok = False
+        # Gather parameter data from the climate data files within a worker thread (progress and results are posted to a queue polled by the GUI)
+        # The selections used to plot the data are retained, and the step inputs are disabled until the plot is complete
+        self.view_plot_details = { 'generate_grids' : generate_grids,
+                                   'parameter_data_is_gridded' : parameter_data_is_gridded,
+                                   'period_ad_from' : period_ad_from,
+                                   'period_ad_until' : period_ad_until,
+                                   'interval_step' : self.current_valid_interval_step_value,
+                                   'region' : self.current_region,
+                                   'region_mask' : self.region_mask,
+                                   'shift_grids' : (self.region_bounding_box[self.current_region]['centre'] == 180 or self.userDefinedGridMaskRequiresShift()),
+                                   'generate_button_state' : self.generate_button.cget('state'),
+                                   'progress' : 0 }
+        generation_arguments = { 'parameter_group_code' : parameter_group_code,
+                                 'parameter_code' : parameter_code,
+                                 'period_ad_from' : period_ad_from,
+                                 'period_ad_until' : period_ad_until,
+                                 'delta_ref_period_ad' : delta_ref_period_ad,
+                                 'delta_as_percent' : bool(self.delta_as_percent.get()),
+                                 'interval_step' : self.current_valid_interval_step_value,
+                                 'interval_size' : self.current_valid_interval_size_value,
+                                 'month_indices' : self.selected_time_unit_month_indices,
+                                 'region_mask' : self.region_mask,
+                                 'generate_grids' : generate_grids,
+                                 'all_months' : self.time_unit_is_all_months,
+                                 'correct_bias' : self.utilise_bias_correction.get() }
+        self.view_plot_queue = Queue.Queue()
+        self.view_plot_cancel_event = threading.Event()
+        self.disableStepInputs()
+        worker_progress_reporter = PaleoclimateToolProgressReporter(refresh_function=lambda: self.postViewPlotProgress(worker_progress_reporter))
+        self.generate_button.configure(state=tk.DISABLED)
+        self.view_cancel_button.configure(state=tk.NORMAL)
+        self.view_cancel_button.grid()
+        view_plot_thread = threading.Thread(target=self.extractViewPlotData, args=(generation_arguments, worker_progress_reporter))
+        view_plot_thread.daemon = True
+        view_plot_thread.start()
+        self.after(self.view_plot_poll_interval, self.pollViewPlotData)
+
+    # Step 7 Method: Extract View Plot Data (runs within the worker thread: no GUI access)
+    def extractViewPlotData(self, generation_arguments, progress_reporter) :
         try :
             #print strftime("%Y-%m-%d %H:%M:%S", localtime())
-            parameter_data = self.data_file_helper.generateParameterData(parameter_group_code=parameter_group_code,
-                                                                         parameter_code=parameter_code,
-                                                                         period_ad_from=period_ad_from,
-                                                                         period_ad_until=period_ad_until,
-                                                                         delta_ref_period_ad=delta_ref_period_ad,
-                                                                         delta_as_percent=bool(self.delta_as_percent.get()),
-                                                                         interval_step=self.current_valid_interval_step_value,
-                                                                         interval_size=self.current_valid_interval_size_value,
-                                                                         month_indices=self.selected_time_unit_month_indices,
-                                                                         region_mask=self.region_mask,
-                                                                         generate_grids=generate_grids,
-                                                                         all_months=self.time_unit_is_all_months,
-                                                                         correct_bias=self.utilise_bias_correction.get())
+            parameter_data = self.data_file_helper.generateParameterData(progress_reporter=progress_reporter, **generation_arguments)
             #print strftime("%Y-%m-%d %H:%M:%S", localtime())
-            data_extraction_ok = (len(parameter_data) > 0)
             self.data_file_helper.clearNetCdfDataCache()
+            self.view_plot_queue.put(('data', parameter_data))
+        except PaleoclimateToolProgressCancelled :
+            self.data_file_helper.clearNetCdfDataCache()
+            self.view_plot_queue.put(('cancelled', None))
         except Exception, e :
             self.data_file_helper.clearNetCdfDataCache()
-            showerror('Data extraction error', str(e))
-            print >> sys.stderr, 'Data extraction error:', e
+            self.view_plot_queue.put(('error', e))
+
+    # Step 7 Method: Post View Plot Progress (rate limited refresh of the worker progress reporter: raising the cancelled exception stops the extraction)
+    def postViewPlotProgress(self, progress_reporter) :
+        if self.view_plot_cancel_event.is_set() :
+            raise PaleoclimateToolProgressCancelled('View plot cancelled')
+        conversion_progress = None # fraction of the years converted to memory mapped data files (whilst converting)
+        if progress_reporter.getProgressMaximum('conversion') :
+            conversion_progress = float(progress_reporter.getProgressValue('conversion'))/progress_reporter.getProgressMaximum('conversion')
+        self.view_plot_queue.put(('progress', (progress_reporter.getProgressValue('generation'), conversion_progress)))
+
+    # Step 7 Method: Disable Step Inputs (records the current states of the input widgets so they can be restored)
+    def disableStepInputs(self) :
+        self.disabled_step_input_states = []
+        widgets = self.main_frame.winfo_children()
+        while widgets :
+            widget = widgets.pop()
+            if widget in [self.view_frame, self.file_frame] : # view and generate buttons are handled separately
+                continue
+            widgets.extend(widget.winfo_children())
+            if isinstance(widget, (tk.Button, tk.Checkbutton, tk.Entry, tk.Menubutton, tk.Radiobutton, tk.Spinbox)) :
+                self.disabled_step_input_states.append((widget, widget.cget('state')))
+                widget.configure(state=tk.DISABLED)
+
+    # Step 7 Method: Restore Step Inputs (to the states recorded when disabled)
+    def restoreStepInputs(self) :
+        for widget, state in self.disabled_step_input_states :
+            widget.configure(state=state)
+        self.disabled_step_input_states = []
+
+    # Step 7 Method: Cancel View Plot
+    def cancelViewPlot(self) :
+        self.view_plot_cancel_event.set()
+        self.view_cancel_button.configure(state=tk.DISABLED)
+
+    # Step 7 Method: Poll View Plot Data (processes progress and results posted by the worker thread)
+    def pollViewPlotData(self) :
+        while True :
+            try :
+                message, content = self.view_plot_queue.get_nowait()
+            except Queue.Empty :
+                self.progress_reporter.refresh(force=True)
+                self.after(self.view_plot_poll_interval, self.pollViewPlotData)
+                return
+            if message == 'progress' :
+                generation_progress, conversion_progress = content
+                self.progress_reporter.addProgress('generation', generation_progress - self.view_plot_details['progress'])
+                self.view_plot_details['progress'] = generation_progress
+                if conversion_progress != None :
+                    self.view_label_text.set(self.generation_status_options['view']['conversion'] + ' (' + str(int(conversion_progress*100)) + '%)...')
+                elif self.view_label_text.get() != self.generation_status_options['view']['plot'] :
+                    self.view_label_text.set(self.generation_status_options['view']['plot'])
+                continue
+            self.progress_reporter.refresh(force=True)
+            if message == 'cancelled' :
+                self.completeViewPlot([])
+                return
+            elif message == 'error' :
+                showerror('Data extraction error', str(content))
+                print >> sys.stderr, 'Data extraction error:', content
+                self.completeViewPlot([])
+                return
+            else :
+                self.completeViewPlot(content)
+                return
+
+    # Step 7 Method: Complete View Plot (plots the extracted data)
+    def completeViewPlot(self, parameter_data) :
+
+        # Retrieve details
+        generate_grids = self.view_plot_details['generate_grids']
+        parameter_data_is_gridded = self.view_plot_details['parameter_data_is_gridded']
+        period_ad_from = self.view_plot_details['period_ad_from']
+        period_ad_until = self.view_plot_details['period_ad_until']
+        interval_step = self.view_plot_details['interval_step']
+        region = self.view_plot_details['region']
+        region_mask = self.view_plot_details['region_mask']
+        shift_grids = self.view_plot_details['shift_grids']
+        data_extraction_ok = (len(parameter_data) > 0 and not self.view_plot_cancel_event.is_set())
+
+        # Re-enable the step inputs
+        self.restoreStepInputs()
 
         if data_extraction_ok :
 
             # Plot data
             if generate_grids :
                 region_masks = []
-                global_masks = []
                 contoured_region_masks = []
                 contoured_parameter_data = []
-                for i, interval_from in enumerate(range(period_ad_from, period_ad_until+1, self.current_valid_interval_step_value)) :
-                    if self.region_is_time_dependent[self.current_region] :
-                        region_masks.append(self.region_mask[self.data_file_helper.nearestTimeDependentRegionMaskYear(1950 - interval_from)])
+                for i, interval_from in enumerate(range(period_ad_from, period_ad_until+1, interval_step)) :
+                    if self.region_is_time_dependent[region] :
+                        region_masks.append(region_mask[self.data_file_helper.nearestTimeDependentRegionMaskYear(1950 - interval_from)])
                     else :
-                        region_masks.append(self.region_mask)
-                    if self.region_bounding_box[self.current_region]['centre'] == 180 or self.userDefinedGridMaskRequiresShift() :
-                        region_masks[i] = self.shiftGridMask180Degrees(region_masks[i])
-                    global_masks.append(np.ones_like(region_masks[i]))
-                    if self.use_contoured_grid_maps :
-                        contoured_region_masks.append(self.transformGridMaskForContours(region_masks[i]))
-                        self.generation_status_bar['value'] += self.generation_status_times['view']['contours']
-                        self.update() # .update_idletasks()
-                if self.region_bounding_box[self.current_region]['centre'] == 180 or self.userDefinedGridMaskRequiresShift() :
+                        region_masks.append(region_mask)
+                if shift_grids :
+                    region_masks = self.shiftDataGrids180Degrees(region_masks)
+                global_masks = [np.ones_like(region_mask) for region_mask in region_masks]
+                if self.use_contoured_grid_maps :
+                    contoured_region_masks = self.transformGridMasksForContours(region_masks)
+                    self.progress_reporter.addProgress('generation', self.generation_status_times['view']['contours']*len(region_masks))
+                if shift_grids :
                     parameter_data = self.shiftDataGrids180Degrees(parameter_data)
                 if self.use_contoured_grid_maps :
                     contoured_parameter_data = self.transformDataGridsForContours(parameter_data)
@@ -4509,7 +4543,7 @@ class ApplicationGUI(tk.Frame) :
                 self.grid_plot_contoured_region_masks = contoured_region_masks
                 self.grid_plot_statistics = { 'region' : self.data_file_helper.calculateGridRegionStatistics(self.grid_plot_parameter_data, self.grid_plot_region_masks),
                                               'global' : self.data_file_helper.calculateGridRegionStatistics(self.grid_plot_parameter_data, global_masks),
-                                              'years_ad' : range(period_ad_from, period_ad_until+1, self.current_valid_interval_step_value) }
+                                              'years_ad' : range(period_ad_from, period_ad_until+1, interval_step) }
                 if self.use_contoured_grid_maps :
                     self.viewGridPlots(contoured_parameter_data, contoured_region_masks)
                 else :
@@ -4528,7 +4562,9 @@ class ApplicationGUI(tk.Frame) :
         self.view_label_text.set('')
         self.update_idletasks()
         self.view_label_text.set(self.generation_options['view'][self.data_type_keys[self.data_type_selection.index(self.data_type_text.get())]])
+        self.view_cancel_button.grid_remove()
         self.view_button.configure(state=tk.NORMAL)
+        self.generate_button.configure(state=self.view_plot_details['generate_button_state'])
 
     # Step 7 Method: Details Incomplete
     def detailsIncomplete(self) :
@@ -4591,15 +4627,7 @@ class ApplicationGUI(tk.Frame) :
 
     # Step 7 Method: Shift Data Grids 180 Degrees
     def shiftDataGrids180Degrees(self, data_grids) :
-        shifted_data_grids = []
-        for i, data_grid in enumerate(data_grids) :
-            rows = data_grid.shape[0]
-            cols = data_grid.shape[1]
-            shifted_data_grid = np.zeros((rows, cols))
-            shifted_data_grid[:,0:(cols/2)] = data_grid[:,(cols/2):cols]
-            shifted_data_grid[:,(cols/2):cols] = data_grid[:,0:(cols/2)]
-            shifted_data_grids.append(shifted_data_grid)
-        return shifted_data_grids
+        return self.grid_plotter.shiftDataGrids180Degrees(data_grids)
 
     # Step 7 Method: User-defined Grid Mask Requires Shift?
     def userDefinedGridMaskRequiresShift(self) :
@@ -4615,39 +4643,14 @@ class ApplicationGUI(tk.Frame) :
                     return True
         return False
 
-    # Step 7 Method: Transform Grid Mask For Contours
-    def transformGridMaskForContours(self, grid_mask) :
-        rows = grid_mask.shape[0]
-        cols = grid_mask.shape[1]
-        contour_grid_mask = np.zeros((rows+1,cols+1))
-        contour_grid_mask[0,:] = grid_mask[0,:].any()
-        contour_grid_mask[rows,:] = grid_mask[(rows-1),:].any()
-        for r in np.arange(1, rows) :
-            for c in np.arange(1, cols) :
-                contour_grid_mask[r,c] = grid_mask[r-1:r+1,c-1:c+1].any()
-        for r in np.arange(1, rows) :
-            contour_grid_mask[r,0] = np.append(grid_mask[r-1:r+1,0], grid_mask[r-1:r+1,(cols-1)]).any()
-            contour_grid_mask[r,cols] = contour_grid_mask[r,0]
-        return contour_grid_mask
+    # Step 7 Method: Transform Grid Masks For Contours
+    def transformGridMasksForContours(self, grid_masks) :
+        return self.grid_plotter.transformGridMasksForContours(grid_masks)
 
     # Step 7 Method: Transform Data Grids For Contours
     def transformDataGridsForContours(self, data_grids) :
-        contour_data_grids = []
-        for i, data_grid in enumerate(data_grids) :
-            rows = data_grid.shape[0]
-            cols = data_grid.shape[1]
-            contour_data_grid = np.zeros((rows+1,cols+1))
-            contour_data_grid[0,:] = data_grid[0,:].mean()
-            contour_data_grid[rows,:] = data_grid[(rows-1),:].mean()
-            for r in np.arange(1, rows) :
-                for c in np.arange(1, cols) :
-                    contour_data_grid[r,c] = data_grid[r-1:r+1,c-1:c+1].mean()
-            for r in np.arange(1, rows) :
-                contour_data_grid[r,0] = np.append(data_grid[r-1:r+1,0], data_grid[r-1:r+1,(cols-1)]).mean()
-                contour_data_grid[r,cols] = contour_data_grid[r,0]
-            contour_data_grids.append(contour_data_grid)
-            self.generation_status_bar['value'] += self.generation_status_times['view']['contours']
-            self.update() # .update_idletasks()
+        contour_data_grids = self.grid_plotter.transformDataGridsForContours(data_grids)
+        self.progress_reporter.addProgress('generation', self.generation_status_times['view']['contours']*len(contour_data_grids))
         return contour_data_grids
 
     # Step 7 Method: Open Generation Status Window
@@ -4721,66 +4724,34 @@ class ApplicationGUI(tk.Frame) :
                 buttons_required_height = padding + self.view_climate_data_window.winfo_reqheight() - self.view_climate_data_canvas.get_tk_widget().winfo_reqheight()
                 self.view_climate_data_canvas.get_tk_widget().configure(height=event.height-buttons_required_height)
             
-            # Set/calculate dimensions and margins
-            maximum_width = self.view_climate_data_figure.get_figwidth()
-            maximum_height = self.view_climate_data_figure.get_figheight()
-            margin = 0.225*max(maximum_width/15.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-            title_margin = 0.495*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-            label_margin = 0.335*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-            colourbar_margin = 0.585*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-            colourbar_total_height = 1.125*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-            plot_width_to_height_ratio = self.current_plot_width_to_height_ratio
-    
-            # Determine best row x column configuration
-            max_rows = 20
-            max_cols = 20
-            max_plot_width = 0
-            best_config = None
-            best_uses = None
+            # Calculate the layout for the current figure size
             number_of_plots = len(self.view_climate_data_figure.get_axes()) - 1
-            for rows in np.arange(1, min(number_of_plots+1, max_rows+1)) :
-                cols = number_of_plots/rows + int(bool(number_of_plots%rows))
-                if cols <= max_cols :
-                    plot_width = (maximum_width - (cols + 1)*margin)/cols
-                    plot_height = (maximum_height - title_margin - (rows - 1)*label_margin - colourbar_total_height)/rows
-                    using = 'maximum_width'
-                    if plot_width > plot_height*plot_width_to_height_ratio :
-                        plot_width = plot_width_to_height_ratio*plot_height
-                        using = 'maximum_height'
-                    if plot_width > max_plot_width :
-                        max_plot_width = plot_width
-                        best_config = [int(rows), int(cols)]
-                        best_uses = using
-            max_plot_height = max_plot_width/plot_width_to_height_ratio
-
-            # Set colorbar width relative to row:col configuration
-            config_ratio = 1.0*best_config[0]/best_config[1]
-            colourbar_width = maximum_width*(0.70+np.log2(config_ratio)*0.1)
-            colourbar_height = 0.015*colourbar_width
+            layout = self.grid_plotter.calculateGridPlotLayout(number_of_plots, self.current_plot_width_to_height_ratio,
+                                                               figure_width=self.view_climate_data_figure.get_figwidth(),
+                                                               figure_height=self.view_climate_data_figure.get_figheight())
 
             # Update or adjust figure
-            if best_config != self.current_plot_best_config :
+            if layout['best_config'] != self.current_plot_best_config :
                 self.view_climate_data_window.unbind('<Configure>')
                 self.view_climate_data_frame.grid_remove()
                 self.after_idle(lambda: self.updateGridPlots())
                 self.after_idle(lambda: self.view_climate_data_window.bind('<Configure>', self.__configureViewGridPlotWindow))
             else :
                 # Adjust spacing and colorbar axis
-                width = self.view_climate_data_figure.get_figwidth()
-                height = self.view_climate_data_figure.get_figheight()
-                self.view_climate_data_figure.subplots_adjust(left=(margin/width), right=(1.0-margin/width),
-                                                              bottom=(colourbar_total_height/height), top=(1.0-title_margin/height),
-                                                              wspace=(margin/max_plot_width), hspace=(label_margin/max_plot_height))
-                self.view_climate_data_figure.get_axes()[-1].set_position([((1-colourbar_width/width)/2.0), (colourbar_margin/height), (colourbar_width/width), (colourbar_height/height)])
+                width = layout['width']
+                height = layout['height']
+                self.view_climate_data_figure.subplots_adjust(left=(layout['margin']/width), right=(1.0-layout['margin']/width),
+                                                              bottom=(layout['colourbar_total_height']/height), top=(1.0-layout['title_margin']/height),
+                                                              wspace=(layout['margin']/layout['max_plot_width']), hspace=(layout['label_margin']/layout['max_plot_height']))
+                self.view_climate_data_figure.get_axes()[-1].set_position([((1-layout['colourbar_width']/width)/2.0), (layout['colourbar_margin']/height),
+                                                                           (layout['colourbar_width']/width), (layout['colourbar_height']/height)])
 
                 # Update font sizes
-                font_scale = (maximum_width/15.0 + maximum_height/9.0)/2
-                self.current_figure_title.set_fontsize(14*font_scale)
-                font_size = 12*font_scale
+                self.current_figure_title.set_fontsize(layout['title_font_size'])
                 for axes in self.view_climate_data_figure.get_axes() :
-                    axes.get_xaxis().get_label().set_fontsize(font_size)
+                    axes.get_xaxis().get_label().set_fontsize(layout['font_size'])
                 for ticklabel in self.view_climate_data_figure.get_axes()[-1].get_xaxis().get_majorticklabels() :
-                    ticklabel.set_fontsize(font_size)
+                    ticklabel.set_fontsize(layout['font_size'])
 
     # Step 7 Method: Update Grid Plots (plot contents)
     def updateGridPlots(self, update=[]) :
@@ -4794,9 +4765,7 @@ class ApplicationGUI(tk.Frame) :
             if self.use_contoured_grid_maps :
                 if not (self.grid_plot_contoured_parameter_data and self.grid_plot_contoured_region_masks) :
                     self.grid_plot_contoured_parameter_data = self.transformDataGridsForContours(self.grid_plot_parameter_data)
-                    self.grid_plot_contoured_region_masks = []
-                    for region_mask in self.grid_plot_region_masks :
-                        self.grid_plot_contoured_region_masks.append(self.transformGridMaskForContours(region_mask))
+                    self.grid_plot_contoured_region_masks = self.transformGridMasksForContours(self.grid_plot_region_masks)
 
         # Create grid plots
         figure_width = self.view_climate_data_figure.get_figwidth() - 0.12
@@ -4807,6 +4776,20 @@ class ApplicationGUI(tk.Frame) :
         else :
             self.createGridPlots(self.grid_plot_parameter_data, self.grid_plot_region_masks, figure_width=figure_width, figure_height=figure_height)
 
+    # Step 7 Method: Update Grid Plots Incrementally (modifies the existing plots for palette, boundary line, land boundary and map grid changes)
+    # Returns False when the plots need to be recreated
+    def updateGridPlotsIncrementally(self, update) :
+        if self.map_colour_palette in self.extended_colour_palettes and self.map_colour_zero_boundary :
+            self.updateExtendedColourMaps(self.map_colour_palette)
+        if self.grid_plotter.updateGridFigure(self.current_grid_figure, update,
+                                              colour_map=self.colourmaps[self.reverse_map_colour_palette][self.map_colour_palette],
+                                              boundary_lines=self.map_colour_boundary_lines,
+                                              land_boundaries=self.show_grid_map_land_boundaries,
+                                              grid_lines={ 'show' : self.show_map_grid_lines, 'space' : self.map_grid_space, 'include' : self.map_grid_include }) :
+            self.view_climate_data_canvas.draw()
+            return True
+        return False
+
     # Step 7 Method: Create Grid Plots (plot contents)
     def createGridPlots(self, parameter_data, region_masks, figure_width=None, figure_height=None) :
 
@@ -4815,13 +4798,7 @@ class ApplicationGUI(tk.Frame) :
         parameter_code = self.parameter_via_group_selection_map[parameter_group_code][self.parameter_via_group_text[parameter_group_code].get()]
 
         # Select fixed colour scheme via parameter codes and delta settings
-        if self.utilise_delta.get() :
-            if self.delta_as_percent.get() and self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code].has_key('%delta') :
-                fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['%delta']
-            else :
-                fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['delta']
-        else :
-            fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['value']
+        fixed_range_colour_scheme = self.selectedFixedRangeColourScheme()
 
         # Calculate colour scheme boundary values
         colour_scheme_boundaries = self.calculateColourSchemeBoundaries()
@@ -4836,19 +4813,9 @@ class ApplicationGUI(tk.Frame) :
                 self.map_colour_zero_boundary = False
                 if self.map_colour_palette in self.extended_colour_palettes :
                     self.map_colour_palette = self.colour_palettes[0]
+        if not self.map_colour_zero_boundary :
+            colour_scheme_boundaries_zero_index = None
 
-        # Resolve minimum and maximum data values and colour scheme interval from colour scheme boundaries
-        data_min = colour_scheme_boundaries[0]
-        data_max = colour_scheme_boundaries[-1]
-        scheme_interval = colour_scheme_boundaries[1] - colour_scheme_boundaries[0]
-
-        # Enforce near minimum and near maximum values on data
-        near_data_min = data_min + 0.0001*scheme_interval
-        near_data_max = data_max - 0.0001*scheme_interval
-        for i, data_grid in enumerate(parameter_data) :
-            parameter_data[i] = parameter_data[i]*(parameter_data[i] >= near_data_min) + (parameter_data[i] < near_data_min)*near_data_min
-            parameter_data[i] = parameter_data[i]*(parameter_data[i] <= near_data_max) + (parameter_data[i] > near_data_max)*near_data_max
-        
         # Construct main title
         title_prefix = ''
         if self.time_unit_text.get() == 'Month' :
@@ -4908,9 +4875,6 @@ class ApplicationGUI(tk.Frame) :
                 else :
                     grid_plot_titles.append(str(ad_year) + ' AD')
 
-        # Determine parameter colour palette
-        colour_palette = self.map_colour_palette
-
         # Resolve region box for user-defined region if required
         region_box = self.region_bounding_box[self.current_region].copy()
         if self.current_region == 'user-defined' and self.region_mask.any() :
@@ -4935,225 +4899,37 @@ class ApplicationGUI(tk.Frame) :
             if region_mask.nonzero()[0].max() <= 69 :
                 region_box['lat'][0] = np.arange(90, -92.5, -2.5)[region_mask.nonzero()[0].max() + 3]
 
-        # Basemap resolution: c (crude), l (low), i (intermediate), h (high), f (full)
-        if self.current_region in ['globe', 'land', 'land-0-21KBP', 'ocean', 'ocean-0-21KBP', 'northern-hemisphere', 'southern-hemisphere', 'equatorial-pacific', 'n3', 'n3-4', 'n4', 'rola'] :
-            basemap_resolution = 'c'
-        elif self.current_region in ['japan', 'middle-east', 'alaska'] :
-            basemap_resolution = 'i'
-        elif self.current_region == 'user-defined':
-            box_area = (region_box['lat'][1]-region_box['lat'][0])/2.5*(region_box['lon'][1]-region_box['lon'][0])/2.5
-            if box_area > 1000 :
-                basemap_resolution = 'c'
-            elif box_area > 200 :
-                basemap_resolution = 'l'
-            else :
-                basemap_resolution = 'i'
-        else :
-            basemap_resolution = 'l'
-
-        # Setup the latitude and longitude variables
-        latititudes = np.arange(90, -92.5, -2.5)
-        longitudes = np.arange(region_box['centre']-180, region_box['centre']+182.5, 2.5)
-        lons, lats = np.meshgrid(longitudes, latititudes)
-
-        # Setup plots
-        map_projection = 'cyl'
-        bounding_lat = None
-        if self.current_region == 'antarctica' :
-            map_projection = 'spaeqd'
-            bounding_lat = -60
-
-        # Set/calculate dimensions and margins
-        if figure_width :
-            maximum_width = figure_width
-        else :
-            maximum_width = 15.0
-        if figure_height :
-            maximum_height = figure_height
-        else :
-            maximum_height = 9.0
-        margin = 0.225*max(maximum_width/15.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-        title_margin = 0.495*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-        label_margin = 0.335*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-        colourbar_margin = 0.585*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-        colourbar_total_height = 1.125*max(maximum_height/9.0, (maximum_width/15.0 + maximum_height/9.0)/2)
-        if self.current_region in ['antarctica'] :
-            plot_width_to_height_ratio = 1.0
-        else :
-            plot_width_to_height_ratio = 1.0*(region_box['lon'][1] - region_box['lon'][0])/(region_box['lat'][1] - region_box['lat'][0])
-        self.current_plot_width_to_height_ratio = plot_width_to_height_ratio
-
-        # Determine best row x column configuration
-        max_rows = 20
-        max_cols = 20
-        max_plot_width = 0
-        best_config = None
-        best_uses = None
-        for rows in np.arange(1, min(len(parameter_data)+1, max_rows+1)) :
-            cols = len(parameter_data)/rows + int(bool(len(parameter_data)%rows))
-            if cols <= max_cols :
-                plot_width = (maximum_width - (cols + 1)*margin)/cols
-                plot_height = (maximum_height - title_margin - (rows - 1)*label_margin - colourbar_total_height)/rows
-                using = 'maximum_width'
-                if plot_width > plot_height*plot_width_to_height_ratio :
-                    plot_width = plot_width_to_height_ratio*plot_height
-                    using = 'maximum_height'
-                if plot_width > max_plot_width :
-                    max_plot_width = plot_width
-                    best_config = [int(rows), int(cols)]
-                    best_uses = using
-        max_plot_height = max_plot_width/plot_width_to_height_ratio
-        self.current_plot_best_config = best_config
-
-        # Set colorbar width relative to row:col configuration
-        config_ratio = 1.0*best_config[0]/best_config[1]
-        colourbar_width = maximum_width*(0.70+np.log2(config_ratio)*0.1) # 0.75
-        colourbar_height = 0.015*colourbar_width
-
-        # Calculate width and height of best configuration
-        if figure_width and figure_height :
-            width = figure_width
-            height = figure_height
+        # Colourbar label
+        if self.delta_as_percent.get() :
+            colourbar_label = '%'
         else :
-            if best_uses == 'maximum_width' :
-                width = maximum_width
-                height = title_margin + max_plot_height*best_config[0] + label_margin*(best_config[0] - 1) + colourbar_total_height
-            elif best_uses == 'maximum_height' :
-                width = margin*(best_config[1] + 1) + max_plot_width*best_config[1]
-                height = maximum_height
-            if width < colourbar_width*1.1 :
-                width = colourbar_width*1.1
-
-        # Set font sizes relative to figure size
-        font_scale = (width/15.0+height/9.0)/2
-        title_font_size = 14*font_scale
-        font_size = 12*font_scale
+            colourbar_label = self.parameter_unit_string[parameter_group_code][parameter_code]
+
+        # Grid plot settings
+        plot_settings = { 'main_title' : main_title, 'grid_plot_titles' : grid_plot_titles, 'region_box' : region_box,
+                          'basemap' : self.grid_plotter.resolveRegionBasemapSettings(self.current_region, region_box),
+                          'colour_scheme_boundaries' : colour_scheme_boundaries, 'colour_scheme_boundaries_zero_index' : colour_scheme_boundaries_zero_index,
+                          'colourbar_label_boundaries' : self.grid_plotter.calculateColourbarLabelBoundaries(colour_scheme_boundaries, self.map_colour_scheme, fixed_range_colour_scheme),
+                          'colourbar_label' : colourbar_label, 'colour_map' : self.colourmaps[self.reverse_map_colour_palette][self.map_colour_palette],
+                          'contoured' : self.use_contoured_grid_maps, 'boundary_lines' : self.map_colour_boundary_lines, 'land_boundaries' : self.show_grid_map_land_boundaries,
+                          'grid_lines' : { 'show' : self.show_map_grid_lines, 'space' : self.map_grid_space, 'include' : self.map_grid_include },
+                          'figure_width' : figure_width, 'figure_height' : figure_height }
+        if self.map_colour_boundary_lines and self.map_colour_zero_boundary :
+            self.colour_scheme_boundaries = colour_scheme_boundaries
+            self.colour_scheme_boundaries_zero_index = colour_scheme_boundaries_zero_index
 
         # Create plots
         self.view_climate_data_frame = tk.Frame(self.view_climate_data_window, padx=0, pady=0)
-        self.view_climate_data_figure = Figure(frameon=False, linewidth=0, dpi=100, figsize=(width, height))
-        self.current_figure_title = self.view_climate_data_figure.suptitle(main_title, fontsize=title_font_size) #, y=0.97)
-        self.view_climate_data_plot_axes = []
-        self.climate_data_basemaps = []
-
-        # Set linewidths
-        if self.map_colour_boundary_lines :
-            regular_boundary_linewidth = rcParams['lines.linewidth']*0.5
-            zero_boundary_linewidth = rcParams['lines.linewidth']*1.5
-            linewidths = np.ones_like(colour_scheme_boundaries)*regular_boundary_linewidth
-            if self.map_colour_zero_boundary :
-                linewidths[colour_scheme_boundaries_zero_index] = zero_boundary_linewidth
-                self.colour_scheme_boundaries = colour_scheme_boundaries
-                self.colour_scheme_boundaries_zero_index = colour_scheme_boundaries_zero_index
-
-        for i, data in enumerate(parameter_data) :
-
-            # Plot data on a base map
-            self.view_climate_data_plot_axes.append(self.view_climate_data_figure.add_subplot(best_config[0], best_config[1], i+1))
-            self.view_climate_data_plot_axes[i].set_xlabel(grid_plot_titles[i], fontsize=font_size) #set_title
-            region_basemap = Basemap(ax=self.view_climate_data_plot_axes[i],
-                                     lon_0=region_box['centre'],
-                                     llcrnrlat=region_box['lat'][0],
-                                     urcrnrlat=region_box['lat'][1],
-                                     llcrnrlon=region_box['lon'][0],
-                                     urcrnrlon=region_box['lon'][1],
-                                     resolution=basemap_resolution,
-                                     projection=map_projection,
-                                     boundinglat=bounding_lat)
-            self.climate_data_basemaps.append(region_basemap)
-            self.climate_data_basemaps[i].drawmapboundary(fill_color='0.3')
-            if self.use_contoured_grid_maps :
-                masked_data = np.ma.masked_array(data, mask=((region_masks[i] - 1)*-1))
-                im = self.climate_data_basemaps[i].contourf(lons, lats, masked_data, colour_scheme_boundaries, shading='flat', cmap=self.colourmaps[self.reverse_map_colour_palette][self.map_colour_palette], latlon=True, vmin=data_min, vmax=data_max)
-                if self.map_colour_boundary_lines :
-                    self.climate_data_basemaps[i].contour(lons, lats, masked_data, colour_scheme_boundaries, linewidths=linewidths, colors='k', linestyles='solid', latlon=True, vmin=data_min, vmax=data_max)
-            else :
-                masked_data = np.ma.masked_array(data, mask=((region_masks[i] - 1)*-1))
-                im = self.climate_data_basemaps[i].pcolor(lons, lats, masked_data, shading='flat', cmap=self.colourmaps[self.reverse_map_colour_palette][self.map_colour_palette], latlon=True, vmin=data_min, vmax=data_max, snap=True)
-                if self.map_colour_boundary_lines :
-                    colour_indexes = np.zeros_like(masked_data)
-                    for boundary_value in colour_scheme_boundaries[1:-1] :
-                        colour_indexes += (masked_data >= boundary_value)
-                    if self.map_colour_zero_boundary :
-                        isZeroBoundary = lambda a, b: (np.array([a,b]) >= colour_scheme_boundaries_zero_index).any() and (np.array([a,b]) < colour_scheme_boundaries_zero_index).any()
-                    else :
-                        isZeroBoundary = lambda a, b: False
-                    boundary_lines = []
-                    boundary_linewidth = { False : regular_boundary_linewidth, True : zero_boundary_linewidth }
-                    for iy, lat in enumerate(latititudes[:-1]) :
-                        for jx, lon in enumerate(longitudes[:-1]) :
-                            if jx < 143 and colour_indexes[iy,jx] != colour_indexes[iy,jx+1] :
-                                if map_projection == 'cyl' :
-                                    if isZeroBoundary(colour_indexes[iy,jx], colour_indexes[iy,jx+1]) :
-                                        self.view_climate_data_plot_axes[i].plot([lon+2.5, lon+2.5], [lat, lat-2.5], 'k-', linewidth=zero_boundary_linewidth)
-                                    else :
-                                        boundary_lines.append([(lon+2.5,lat),(lon+2.5,lat-2.5)])
-                                else :
-                                    self.climate_data_basemaps[i].plot([lon+2.5, lon+2.5], [lat, lat-2.5], 'k-', latlon=True, linewidth=boundary_linewidth[isZeroBoundary(colour_indexes[iy,jx], colour_indexes[iy,jx+1])])
-                            if iy < 71 and colour_indexes[iy,jx] != colour_indexes[iy+1,jx] :
-                                if map_projection == 'cyl' :
-                                    if isZeroBoundary(colour_indexes[iy,jx], colour_indexes[iy+1,jx]) :
-                                        self.view_climate_data_plot_axes[i].plot([lon, lon+2.5], [lat-2.5, lat-2.5], 'k-', linewidth=zero_boundary_linewidth)
-                                    else :
-                                        boundary_lines.append([(lon,lat-2.5),(lon+2.5,lat-2.5)])
-                                else :
-                                    self.climate_data_basemaps[i].plot([lon, lon+2.5], [lat-2.5, lat-2.5], 'k-', latlon=True, linewidth=boundary_linewidth[isZeroBoundary(colour_indexes[iy,jx], colour_indexes[iy+1,jx])])
-                    if map_projection == 'cyl' :
-                        self.view_climate_data_plot_axes[i].add_collection(LineCollection(boundary_lines, colors='k', linewidths=regular_boundary_linewidth))
-            if self.show_grid_map_land_boundaries :
-                self.climate_data_basemaps[i].drawcoastlines()
-
-            # Grid lines and ticks
-            if self.show_map_grid_lines :
-                region_longitudes = longitudes[((longitudes >= region_box['lon'][0])*(longitudes <= region_box['lon'][1])).nonzero()]
-                region_latititudes = latititudes[((latititudes >= region_box['lat'][0])*(latititudes <= region_box['lat'][1])).nonzero()]
-                if self.map_grid_space :
-                    map_grid_space = self.map_grid_space
-                else :
-                    map_grid_space = region_box['grid']                
-                self.view_climate_data_plot_axes[i].set_xticks(region_longitudes[((region_longitudes % map_grid_space) == 0. ).nonzero()])
-                self.view_climate_data_plot_axes[i].set_yticks(region_latititudes[((region_latititudes % map_grid_space) == 0. ).nonzero()])
-                self.view_climate_data_plot_axes[i].set_xticklabels([])
-                self.view_climate_data_plot_axes[i].set_yticklabels([])
-                if self.map_grid_include == 'lines' :
-                    self.view_climate_data_plot_axes[i].grid(b=True, which='major', axis='both')
-
-            # Update status bar
-            self.generation_status_bar['value'] += self.generation_status_times['view']['map']
-            if self.region_is_time_dependent[self.current_region] :
-                self.generation_status_bar['value'] += self.generation_status_times['view']['time-dependent']
-            self.update() # .update_idletasks()
-        
-        # Adjust spacing and make an axis for the colorbar on the bottom
-        self.view_climate_data_figure.subplots_adjust(left=(margin/width), right=(1.0-margin/width),
-                                                      bottom=(colourbar_total_height/height), top=(1.0-title_margin/height),
-                                                      wspace=(margin/max_plot_width), hspace=(label_margin/max_plot_height))
-        cax = self.view_climate_data_figure.add_axes([((1-colourbar_width/width)/2.0), (colourbar_margin/height), (colourbar_width/width), (colourbar_height/height)])
-        if self.map_colour_scheme == '90%_range' :
-            cb_label_boundaries = colour_scheme_boundaries[1:-1]
-        else : # fixed_range
-            cb_label_boundaries = colour_scheme_boundaries[:]
-            if fixed_range_colour_scheme['first_boundary'] != None and fixed_range_colour_scheme['min'] == None :
-                cb_label_boundaries = cb_label_boundaries[1:]
-            if fixed_range_colour_scheme['last_boundary'] != None and fixed_range_colour_scheme['max'] == None :
-                cb_label_boundaries = cb_label_boundaries[:-1]
-        cb = self.view_climate_data_figure.colorbar(im, cax=cax, orientation='horizontal', boundaries=colour_scheme_boundaries, ticks=cb_label_boundaries, drawedges=self.map_colour_boundary_lines)#, shrink=0.75)
-        cax.xaxis.set_ticks_position('none')
-        if self.map_colour_boundary_lines :
-            cb.dividers.set_linewidths(linewidths[1:-1])
-            if self.map_colour_zero_boundary and colour_scheme_boundaries_zero_index in [0,11] :
-                cax.set_xlim(left=-0.002)
-                zero_boundary_x_value = { 0 : 0, 11 : 1 }
-                vl = cax.axvline(zero_boundary_x_value[colour_scheme_boundaries_zero_index], color='k', linewidth=zero_boundary_linewidth)
-        self.cax = cax
-        self.cb = cb
-        if self.delta_as_percent.get() :
-            cb.set_label('%')
-        else :
-            cb.set_label(self.parameter_unit_string[parameter_group_code][parameter_code])
-        cax.get_xaxis().get_label().set_fontsize(font_size)
-        for ticklabel in cax.get_xaxis().get_majorticklabels() :
-            ticklabel.set_fontsize(font_size)
+        grid_figure = self.grid_plotter.createGridFigure(parameter_data, region_masks, plot_settings, map_plotted=self.updateGridPlotStatusBar)
+        self.current_grid_figure = grid_figure
+        self.view_climate_data_figure = grid_figure['figure']
+        self.current_figure_title = grid_figure['title']
+        self.view_climate_data_plot_axes = grid_figure['plot_axes']
+        self.climate_data_basemaps = grid_figure['basemaps']
+        self.current_plot_width_to_height_ratio = grid_figure['layout']['plot_width_to_height_ratio']
+        self.current_plot_best_config = grid_figure['layout']['best_config']
+        self.cax = grid_figure['cax']
+        self.cb = grid_figure['cb']
 
         # Plot the region map
         self.view_climate_data_canvas = FigureCanvasTkAgg(self.view_climate_data_figure, master=self.view_climate_data_frame)
@@ -5179,6 +4955,13 @@ class ApplicationGUI(tk.Frame) :
         tk.Button(button_frame, text='Close', anchor=tk.CENTER, command=self.closeFigureWindow).grid(row=0, column=4, padx=0, pady=0)
         button_frame.grid(row=1, column=0, padx=0, pady=5)
 
+    # Step 7 Method: Update Grid Plot Status Bar (as each map is plotted)
+    def updateGridPlotStatusBar(self, map_index) :
+        if self.region_is_time_dependent[self.current_region] :
+            self.progress_reporter.addProgress('generation', self.generation_status_times['view']['map'] + self.generation_status_times['view']['time-dependent'])
+        else :
+            self.progress_reporter.addProgress('generation', self.generation_status_times['view']['map'])
+
     # Step 7 Method: Zoom Figure Via Toolbar
     def zoomFigureViaToolbar(self) :
         if self.grid_plot_zoom_text.get() == 'Zoom' :
@@ -5578,8 +5361,7 @@ class ApplicationGUI(tk.Frame) :
                 ticklabel.set_fontsize(font_size)
 
             # Update status bar
-            self.generation_status_bar['value'] += self.generation_status_times['view']['series']
-            self.update() # .update_idletasks()
+            self.progress_reporter.addProgress('generation', self.generation_status_times['view']['series'])
 
         # Adjust spacing
         if self.time_unit_is_all_months :
@@ -5754,7 +5536,7 @@ class ApplicationGUI(tk.Frame) :
         # Disable generate button, add generation status bar, and change label text
         self.generate_button.configure(state=tk.DISABLED)
         self.update() # .update_idletasks()
-        self.generation_status_bar['value'] = 0
+        self.progress_reporter.startProgress('generation')
         self.generation_status_bar['maximum'] = (self.current_interval_steps + 1) * self.current_valid_interval_size_value * len(self.selected_time_unit_month_indices)
         if generate_grids :
             self.generation_status_bar['maximum'] += (self.current_interval_steps + 1) * self.generation_status_times['files']['map']
@@ -5808,7 +5590,7 @@ class ApplicationGUI(tk.Frame) :
         else :
             delta_ref_period_ad = None
 
-        # Construct description, filename, and times (for netCDF files)
+        # Construct description, filename, and times (for netCDF and GeoTIFF files)
         description = ''
         if self.utilise_delta.get() :
             if self.delta_as_percent.get() :
@@ -5919,6 +5701,10 @@ class ApplicationGUI(tk.Frame) :
                     except Exception, e :
                         showerror('File generation error', str(e))
                         print >> sys.stderr, 'File generation error:', e
+                        break # remaining grids are not generated (the NetCDF or GeoTIFF file may no longer be writable)
+
+            # Close the NetCDF or GeoTIFF file (when the last grid was not generated)
+            self.data_file_helper.closeGridDataFileWriter()
 
             # Resolve generation status
             expected_when_error = ''
@@ -5926,6 +5712,8 @@ class ApplicationGUI(tk.Frame) :
                 expected_when_error = ' of the ' + str(len(period_years_ad)) + ' expected'
             if data_file_type == 'netcdf' :
                 generation_status = str(generated_file_count) + expected_when_error + ' grid data grids generated in netCDF file in \"' + self.data_file_helper.getFileGenerationDirectoryName()+ '\"'
+            elif data_file_type == 'geotiff' :
+                generation_status = str(generated_file_count) + expected_when_error + ' grid data bands generated in GeoTIFF file in \"' + self.data_file_helper.getFileGenerationDirectoryName()+ '\"'
             else :
                 generation_status = str(generated_file_count) + expected_when_error + ' grid data files generated in \"' + self.data_file_helper.getFileGenerationDirectoryName()+ '\"'
             if generated_file_count :
@@ -6246,12 +6034,12 @@ class ApplicationGUI(tk.Frame) :
                 number_generated = self.tool_generation_log_entry['grids_generated']['number']
                 number_expected = self.tool_generation_log_entry['grids_generated']['expected']
                 if number_generated < number_expected :
-                    if self.data_file_type_text.get() == 'NetCDF' :
+                    if self.data_file_type_text.get() in ['NetCDF', 'GeoTIFF'] :
                         log_entry_string += '  ' + str(number_generated) + ' of the expected ' + str(number_expected) + ' data grids within the ' + self.data_file_type_text.get() + ' file'
                     else :
                         log_entry_string += '  ' + str(number_generated) + ' of the expected ' + str(number_expected) + ' ' + self.data_file_type_text.get() + ' data files'
                 else :
-                    if self.data_file_type_text.get() == 'NetCDF' :
+                    if self.data_file_type_text.get() in ['NetCDF', 'GeoTIFF'] :
                         log_entry_string += '  ' + str(number_generated) + ' data grids within the ' + self.data_file_type_text.get() + ' file'
                     else :
                         log_entry_string += '  ' + str(number_generated) + ' ' + self.data_file_type_text.get() + ' data files'
@@ -6277,121 +6065,27 @@ class ApplicationGUI(tk.Frame) :
 
     ## Shared Methods ################################################################################################################################################
 
+    # Shared Method: Selected Fixed Range Colour Scheme (via parameter codes and delta settings)
+    def selectedFixedRangeColourScheme(self) :
+        parameter_group_code = self.parameter_group_selection_map[self.parameter_group_text.get()]
+        parameter_code = self.parameter_via_group_selection_map[parameter_group_code][self.parameter_via_group_text[parameter_group_code].get()]
+        return self.grid_plotter.getFixedRangeColourScheme(parameter_group_code, parameter_code, delta=self.utilise_delta.get(), delta_as_percent=self.delta_as_percent.get())
+
     # Shared Method: Calculate Colour Scheme Boundaries (used in menu colour edit and grid plot methods)
     def calculateColourSchemeBoundaries(self) :
-
-        # Find minimum and maximum data values and colour scheme interval
         if self.map_colour_scheme == '90%_range' :
-            data_5th_percentile = min(self.grid_plot_statistics['region']['percentile_5th'])
-            data_95th_percentile = max(self.grid_plot_statistics['region']['percentile_95th'])
-            scheme_interval = (data_95th_percentile - data_5th_percentile)/9
-            data_min = data_5th_percentile - scheme_interval
-            data_max = data_95th_percentile + scheme_interval
-
+            fixed_range_colour_scheme = None
         else : # fixed_range
-
-            # Resolve selected parameter/group codes
-            parameter_group_code = self.parameter_group_selection_map[self.parameter_group_text.get()]
-            parameter_code = self.parameter_via_group_selection_map[parameter_group_code][self.parameter_via_group_text[parameter_group_code].get()]
-
-            # Select fixed colour scheme via parameter codes and delta settings
-            if self.utilise_delta.get() :
-                if self.delta_as_percent.get() and self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code].has_key('%delta') :
-                    fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['%delta']
-                else :
-                    fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['delta']
-            else :
-                fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['value']
-
-            # Prioritise min/max then first/last boundaries, use statistical min/max when neither provided
-            if fixed_range_colour_scheme['min'] != None :
-                data_min = fixed_range_colour_scheme['min']
-            elif fixed_range_colour_scheme['first_boundary'] != None :
-                data_min = None
-            else :
-                data_min = min(self.grid_plot_statistics['region']['minimum'])
-            if fixed_range_colour_scheme['max'] != None :
-                data_max = fixed_range_colour_scheme['max']
-            elif fixed_range_colour_scheme['last_boundary'] != None :
-                data_max = None
-            else :
-                data_max = max(self.grid_plot_statistics['region']['maximum'])
-
-            # Resolve scheme interval and unresolved min/max
-            if data_min == None and data_max == None :
-                scheme_interval = (fixed_range_colour_scheme['last_boundary'] - fixed_range_colour_scheme['first_boundary'])/9.0
-                data_min = fixed_range_colour_scheme['first_boundary'] - scheme_interval
-                data_max = fixed_range_colour_scheme['last_boundary'] + scheme_interval
-            elif data_min == None :
-                scheme_interval = (data_max - fixed_range_colour_scheme['first_boundary'])/10.0
-                data_min = fixed_range_colour_scheme['first_boundary'] - scheme_interval
-            elif data_max == None :
-                scheme_interval = (fixed_range_colour_scheme['last_boundary'] - data_min)/10.0
-                data_max = fixed_range_colour_scheme['last_boundary'] + scheme_interval
-            else :
-                scheme_interval = (data_max - data_min)/11.0
-
-        # Return colour scheme boundary values
-        if scheme_interval :
-            return np.arange(data_min, data_max+0.1*scheme_interval, scheme_interval)
-        else :
-            return np.arange(data_min-1.0, data_max+1.2, 0.2)
+            fixed_range_colour_scheme = self.selectedFixedRangeColourScheme()
+        return self.grid_plotter.calculateColourSchemeBoundaries(self.map_colour_scheme, fixed_range_colour_scheme, self.grid_plot_statistics['region'])
 
     # Shared Method: Adjust Colour Scheme Zero Boundaries (used in menu colour edit and grid plot methods)
     def adjustColourSchemeZeroBoundaries(self, colour_scheme_boundaries) :
-
-        if self.map_colour_scheme == '90%_range' : # shift left method
-            colour_scheme_boundaries_zero_index = (colour_scheme_boundaries >= 0).nonzero()[0][0]
-            colour_scheme_boundaries -= colour_scheme_boundaries[colour_scheme_boundaries_zero_index]
-
-        else : # fixed_range: minimal stretch method
-
-            # Resolve selected parameter/group codes
-            parameter_group_code = self.parameter_group_selection_map[self.parameter_group_text.get()]
-            parameter_code = self.parameter_via_group_selection_map[parameter_group_code][self.parameter_via_group_text[parameter_group_code].get()]
-
-            # Select fixed colour scheme via parameter codes and delta settings
-            if self.utilise_delta.get() :
-                if self.delta_as_percent.get() and self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code].has_key('%delta') :
-                    fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['%delta']
-                else :
-                    fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['delta']
-            else :
-                fixed_range_colour_scheme = self.parameter_fixed_range_colour_scheme[parameter_group_code][parameter_code]['value']
-
-            # Resolve colour scheme zero boundaries
-            first_index = int(fixed_range_colour_scheme['first_boundary'] != None and fixed_range_colour_scheme['min'] == None)
-            last_index = 11 - int(fixed_range_colour_scheme['last_boundary'] != None and fixed_range_colour_scheme['max'] == None)
-            if colour_scheme_boundaries.round(12).min() >= 0 :
-                data_min = 0.0
-                scheme_interval = (colour_scheme_boundaries[last_index] - data_min)/last_index
-                data_max = colour_scheme_boundaries[last_index] + scheme_interval*(11 - last_index)
-                colour_scheme_boundaries_zero_index = 0
-            elif colour_scheme_boundaries.round(12).max() <= 0 :
-                data_max = 0.0
-                scheme_interval = (data_max - colour_scheme_boundaries[first_index])/(11 - first_index)
-                data_min = colour_scheme_boundaries[first_index] - scheme_interval*first_index
-                colour_scheme_boundaries_zero_index = 11
-            else :
-                first_positive_index = (colour_scheme_boundaries >= 0).nonzero()[0][0]
-                lower_stretch = None
-                upper_stretch = None
-                if first_positive_index < last_index :
-                    lower_stretch = (last_index - first_index)*colour_scheme_boundaries[first_positive_index]/(last_index - first_positive_index)
-                if first_positive_index > first_index + 1 :
-                    upper_stretch = (last_index - first_index)*colour_scheme_boundaries[first_positive_index - 1]/(first_index - first_positive_index + 1)
-                if upper_stretch == None or (lower_stretch != None and round(lower_stretch, 12) <= round(upper_stretch, 12)) :
-                    colour_scheme_boundaries[first_index] -= lower_stretch
-                    colour_scheme_boundaries_zero_index = first_positive_index
-                else :
-                    colour_scheme_boundaries[last_index] += upper_stretch
-                    colour_scheme_boundaries_zero_index = first_positive_index - 1
-                scheme_interval = (colour_scheme_boundaries[last_index] - colour_scheme_boundaries[first_index])/(last_index - first_index)
-                data_min = colour_scheme_boundaries[first_index] - scheme_interval*first_index
-                data_max = colour_scheme_boundaries[last_index] + scheme_interval*(11 - last_index)
-            colour_scheme_boundaries = np.arange(data_min, data_max+0.1*scheme_interval, scheme_interval).round(12)
-
-        return (colour_scheme_boundaries_zero_index, colour_scheme_boundaries)
+        if self.map_colour_scheme == '90%_range' :
+            fixed_range_colour_scheme = None
+        else : # fixed_range
+            fixed_range_colour_scheme = self.selectedFixedRangeColourScheme()
+        return self.grid_plotter.adjustColourSchemeZeroBoundaries(colour_scheme_boundaries, self.map_colour_scheme, fixed_range_colour_scheme)
 
     ## Generic Methods ####################################################################################################################################################
 